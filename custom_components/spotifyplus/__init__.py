@@ -4,14 +4,13 @@ The spotifyplus integration.
 
 from __future__ import annotations
 
-from asyncio import run_coroutine_threadsafe
 from urllib3._version import __version__ as urllib3_version
 
-import functools
 import json
 import logging
 import os
-import threading
+import time
+from typing import Any, Callable
 import voluptuous as vol
 
 from spotifywebapipython import SpotifyClient, SpotifyAuthToken
@@ -19,10 +18,10 @@ from spotifywebapipython.models import SpotifyConnectDevices, SpotifyConnectDevi
 from spotifywebapipython.const import VERSION as spotifywebapipython_VERSION
 
 from homeassistant.components import zeroconf
-from homeassistant.components.media_player import MediaPlayerEntity
+from homeassistant.components.media_player import MediaPlayerEntity, MediaType
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_ID, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady, HomeAssistantError, IntegrationError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.config_entry_oauth2_flow import (OAuth2Session, async_get_config_entry_implementation)
@@ -30,11 +29,22 @@ from homeassistant.helpers.issue_registry import IssueSeverity, async_create_iss
 from homeassistant.helpers.typing import ConfigType
 
 from .appmessages import STAppMessages
+from .coordinator import (
+    async_acquire_playstate_coordinator,
+    async_release_playstate_coordinator,
+    SpotifyPlusPlayStateCoordinator,
+)
 from .instancedata_spotifyplus import InstanceDataSpotifyPlus
+from .instrumentation import InstrumentationCategory
+from .ratelimiter import SpotifyRequestLane
+from .tokenrefresher import SpotifyPlusTokenRefresher
 from .const import (
+    BrowsableMedia,
     CONF_OPTION_DEVICE_LOGINID,
     CONF_OPTION_DEVICE_PASSWORD,
     CONF_OPTION_DEVICE_USERNAME,
+    CONF_OPTION_TOKEN_REFRESH_MARGIN,
+    DEFAULT_OPTION_TOKEN_REFRESH_MARGIN,
     DOMAIN, 
     SPOTIFY_SCOPES,
     SERVICE_SPOTIFY_ADD_PLAYER_QUEUE_ITEMS,
@@ -162,7 +172,6 @@ TOKEN_STATUS_ACCOUNT_NAME:str = 'token_account_name'
 TOKEN_STATUS_CLIENT_ID:str = 'token_client_id'
 TOKEN_STATUS_REFRESH_EVENT:str = 'TokenRefreshEvent'
 TOKEN_STATUS_REAUTH_EVENT:str = 'TokenReauthEvent'
-TOKENUPDATER_LOCK = threading.Lock()   # syncronous lock to sync access to token updates.
 
 REAUTH_TEST_FIRST_TIME:bool = None    # used when testing app creds reauth processing
 
@@ -1276,6 +1285,65 @@ SERVICE_TEST_TOKEN_EXPIRE_SCHEMA = vol.Schema(
 )
 
 
+# services that send a small, fixed number of player commands; they are run in the TRANSPORT
+# lane.  services that page through library or catalog data before they start playing (e.g.
+# play track favorites, play artist context) are run in the BULK lane like all other services.
+SERVICE_TRANSPORT_LANE_SERVICES:list[str] = [
+    SERVICE_SPOTIFY_ADD_PLAYER_QUEUE_ITEMS,
+    SERVICE_SPOTIFY_PLAYER_MEDIA_PAUSE,
+    SERVICE_SPOTIFY_PLAYER_MEDIA_PLAY_TRACKS,
+    SERVICE_SPOTIFY_PLAYER_MEDIA_RESUME,
+    SERVICE_SPOTIFY_PLAYER_MEDIA_SEEK,
+    SERVICE_SPOTIFY_PLAYER_MEDIA_SKIP_NEXT,
+    SERVICE_SPOTIFY_PLAYER_MEDIA_SKIP_PREVIOUS,
+    SERVICE_SPOTIFY_PLAYER_SET_REPEAT_MODE,
+    SERVICE_SPOTIFY_PLAYER_SET_SHUFFLE_MODE,
+    SERVICE_SPOTIFY_PLAYER_SET_VOLUME_LEVEL,
+    SERVICE_SPOTIFY_PLAYER_TRANSFER_PLAYBACK,
+    SERVICE_VOLUME_SET_STEP,
+]
+""" Services that are run in the TRANSPORT request lane. """
+
+# media browser node types that are removed from the browse cache when a service changes
+# the data they are built from; playlist content nodes are handled separately.
+SERVICE_BROWSE_CACHE_INVALIDATIONS:dict[str, list[str]] = {
+    SERVICE_SPOTIFY_FOLLOW_ARTISTS: [BrowsableMedia.SPOTIFY_USER_FOLLOWED_ARTISTS],
+    SERVICE_SPOTIFY_FOLLOW_PLAYLIST: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_CHANGE: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_COVER_IMAGE_ADD: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_CREATE: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_ADD: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_CLEAR: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_REMOVE: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_REORDER: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_REPLACE: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+    SERVICE_SPOTIFY_REMOVE_ALBUM_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS],
+    SERVICE_SPOTIFY_REMOVE_AUDIOBOOK_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_AUDIOBOOKS],
+    SERVICE_SPOTIFY_REMOVE_SHOW_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS],
+    SERVICE_SPOTIFY_REMOVE_TRACK_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS],
+    SERVICE_SPOTIFY_REMOVE_USER_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS, BrowsableMedia.SPOTIFY_USER_SAVED_AUDIOBOOKS, BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS, BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS],
+    SERVICE_SPOTIFY_SAVE_ALBUM_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS],
+    SERVICE_SPOTIFY_SAVE_AUDIOBOOK_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_AUDIOBOOKS],
+    SERVICE_SPOTIFY_SAVE_SHOW_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS],
+    SERVICE_SPOTIFY_SAVE_TRACK_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS],
+    SERVICE_SPOTIFY_SAVE_USER_FAVORITES: [BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS, BrowsableMedia.SPOTIFY_USER_SAVED_AUDIOBOOKS, BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS, BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS],
+    SERVICE_SPOTIFY_UNFOLLOW_ARTISTS: [BrowsableMedia.SPOTIFY_USER_FOLLOWED_ARTISTS],
+    SERVICE_SPOTIFY_UNFOLLOW_PLAYLIST: [BrowsableMedia.SPOTIFY_USER_PLAYLISTS],
+}
+""" Media browser node types to remove from the browse cache, keyed by service name. """
+
+SERVICE_BROWSE_CACHE_PLAYLIST_INVALIDATIONS:list[str] = [
+    SERVICE_SPOTIFY_PLAYLIST_CHANGE,
+    SERVICE_SPOTIFY_PLAYLIST_COVER_IMAGE_ADD,
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_ADD,
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_CLEAR,
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_REMOVE,
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_REORDER,
+    SERVICE_SPOTIFY_PLAYLIST_ITEMS_REPLACE,
+]
+""" Services that change the playlist node of their `playlist_id` service data value. """
+
+
 def _get_file_contents_json(filePath: str, title: str) -> dict:
     """
     Retrieves the contents of the specified JSON text file.
@@ -1377,6 +1445,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 service (ServiceCall):
                     ServiceCall instance that contains service data (requested service name, field parameters, etc).
             """
+            entity:MediaPlayerEntity = None
+            startTime:float = time.perf_counter()
+            isError:bool = False
+
             try:
 
                 _logsi.EnterMethod(SILevel.Debug)
@@ -1398,14 +1470,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     verify_device_id = service.data.get("verify_device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_add_player_queue_items, uris, device_id, verify_device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_add_player_queue_items, uris, device_id, verify_device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_FOLLOW_ARTISTS:
 
                     # follow artist(s).
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_follow_artists, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_follow_artists, ids)
 
                 elif service.service == SERVICE_SPOTIFY_FOLLOW_PLAYLIST:
 
@@ -1413,14 +1485,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     playlist_id = service.data.get("playlist_id")
                     public = service.data.get("public")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_follow_playlist, playlist_id, public)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_follow_playlist, playlist_id, public)
 
                 elif service.service == SERVICE_SPOTIFY_FOLLOW_USERS:
 
                     # follow user(s).
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_follow_users, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_follow_users, ids)
 
                 elif service.service == SERVICE_SPOTIFY_GET_COVER_IMAGE_FILE:
 
@@ -1428,7 +1500,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     image_url = service.data.get("image_url")
                     output_path = service.data.get("output_path")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_get_cover_image_file, image_url, output_path)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_cover_image_file, image_url, output_path)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_PAUSE:
 
@@ -1436,7 +1508,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_pause, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_pause, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_PLAY_CONTEXT:
 
@@ -1450,7 +1522,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     shuffle = service.data.get("shuffle")
                     play_show_latest_episode = service.data.get("play_show_latest_episode")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_play_context, context_uri, offset_uri, offset_position, position_ms, device_id, delay, shuffle, play_show_latest_episode)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_play_context, context_uri, offset_uri, offset_position, position_ms, device_id, delay, shuffle, play_show_latest_episode)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_PLAY_TRACK_FAVORITES:
 
@@ -1463,7 +1535,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     filter_artist = service.data.get("filter_artist")
                     filter_album = service.data.get("filter_album")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_play_track_favorites, device_id, shuffle, delay, resolve_device_id, limit_total, filter_artist, filter_album)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_play_track_favorites, device_id, shuffle, delay, resolve_device_id, limit_total, filter_artist, filter_album)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_PLAY_TRACKS:
 
@@ -1474,7 +1546,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     delay = service.data.get("delay")
                     shuffle = service.data.get("shuffle")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_play_tracks, uris, position_ms, device_id, delay, shuffle)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_play_tracks, uris, position_ms, device_id, delay, shuffle)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_RESUME:
 
@@ -1482,7 +1554,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_resume, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_resume, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_SEEK:
 
@@ -1492,7 +1564,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     delay = service.data.get("delay")
                     relative_position_ms = service.data.get("relative_position_ms")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_seek, position_ms, device_id, delay, relative_position_ms)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_seek, position_ms, device_id, delay, relative_position_ms)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_SKIP_NEXT:
 
@@ -1500,7 +1572,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_skip_next, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_skip_next, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_MEDIA_SKIP_PREVIOUS:
 
@@ -1508,7 +1580,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_media_skip_previous, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_media_skip_previous, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_SET_REPEAT_MODE:
 
@@ -1517,7 +1589,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_set_repeat_mode, state, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_set_repeat_mode, state, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_SET_SHUFFLE_MODE:
 
@@ -1526,7 +1598,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_set_shuffle_mode, state, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_set_shuffle_mode, state, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_SET_VOLUME_LEVEL:
 
@@ -1535,7 +1607,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     device_id = service.data.get("device_id")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_set_volume_level, volume_level, device_id, delay)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_set_volume_level, volume_level, device_id, delay)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYER_TRANSFER_PLAYBACK:
 
@@ -1547,7 +1619,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     force_activate_device = service.data.get("force_activate_device")
                     device_id_from = service.data.get("device_id_from")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_player_transfer_playback, device_id, play, delay, refresh_device_list, force_activate_device, device_id_from)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_player_transfer_playback, device_id, play, delay, refresh_device_list, force_activate_device, device_id_from)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_CHANGE:
 
@@ -1559,7 +1631,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     collaborative = service.data.get("collaborative")
                     image_path = service.data.get("image_path")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_playlist_change, playlist_id, name, description, public, collaborative, image_path)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_change, playlist_id, name, description, public, collaborative, image_path)
                     
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_COVER_IMAGE_ADD:
 
@@ -1567,125 +1639,125 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     playlist_id = service.data.get("playlist_id")
                     image_path = service.data.get("image_path")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_playlist_cover_image_add, playlist_id, image_path)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_cover_image_add, playlist_id, image_path)
 
                 elif service.service == SERVICE_SPOTIFY_REMOVE_ALBUM_FAVORITES:
 
                     # remove album(s) from favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_remove_album_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_remove_album_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_REMOVE_AUDIOBOOK_FAVORITES:
 
                     # remove audiobook(s) from favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_remove_audiobook_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_remove_audiobook_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_REMOVE_EPISODE_FAVORITES:
 
                     # remove episode(s) from favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_remove_episode_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_remove_episode_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_REMOVE_SHOW_FAVORITES:
 
                     # remove show(s) from favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_remove_show_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_remove_show_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_REMOVE_TRACK_FAVORITES:
 
                     # remove track(s) from favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_remove_track_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_remove_track_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_REMOVE_USER_FAVORITES:
 
                     # remove items from user library favorites.
                     uris = service.data.get("uris")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_remove_user_favorites, uris)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_remove_user_favorites, uris)
 
                 elif service.service == SERVICE_SPOTIFY_SAVE_ALBUM_FAVORITES:
 
                     # save album(s) to favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_save_album_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_save_album_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_SAVE_AUDIOBOOK_FAVORITES:
 
                     # save audiobook(s) to favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_save_audiobook_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_save_audiobook_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_SAVE_EPISODE_FAVORITES:
 
                     # save episode(s) to favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_save_episode_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_save_episode_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_SAVE_SHOW_FAVORITES:
 
                     # save show(s) to favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_save_show_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_save_show_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_SAVE_TRACK_FAVORITES:
 
                     # save track(s) to favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_save_track_favorites, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_save_track_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_SAVE_USER_FAVORITES:
 
                     # save item(s) to user library favorites.
                     uris = service.data.get("uris")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_save_user_favorites, uris)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_save_user_favorites, uris)
 
                 elif service.service == SERVICE_SPOTIFY_TRIGGER_SCAN_INTERVAL:
 
                     # test token expiration.
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_trigger_scan_interval)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_trigger_scan_interval)
 
                 elif service.service == SERVICE_SPOTIFY_UNFOLLOW_ARTISTS:
 
                     # unfollow artist(s).
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_unfollow_artists, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_unfollow_artists, ids)
 
                 elif service.service == SERVICE_SPOTIFY_UNFOLLOW_PLAYLIST:
 
                     # unfollow playlist.
                     playlist_id = service.data.get("playlist_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_unfollow_playlist, playlist_id)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_unfollow_playlist, playlist_id)
 
                 elif service.service == SERVICE_SPOTIFY_UNFOLLOW_USERS:
 
                     # unfollow user(s).
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    await hass.async_add_executor_job(entity.service_spotify_unfollow_users, ids)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_spotify_unfollow_users, ids)
 
                 elif service.service == SERVICE_TEST_TOKEN_EXPIRE:
 
                     # test token expiration.
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
                     reason = service.data.get("reason")
-                    await hass.async_add_executor_job(entity.service_test_token_expire, reason)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_test_token_expire, reason)
 
                 elif service.service == SERVICE_VOLUME_SET_STEP:
 
@@ -1693,7 +1765,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
                     level = service.data.get("level")
                     level_percent = service.data.get("level_percent")
-                    await hass.async_add_executor_job(entity.service_volume_set_step, level, level_percent)
+                    await _async_RunServiceInExecutor(entity, service, entity.service_volume_set_step, level, level_percent)
 
                 else:
                     
@@ -1705,16 +1777,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             except HomeAssistantError as ex: 
                 
                 # log error, but not to system logger as HA will take care of it.
+                isError = True
                 _logsi.LogError(str(ex), logToSystemLogger=False)
                 raise
             
             except Exception as ex:
 
                 # log exception, but not to system logger as HA will take care of it.
+                isError = True
                 _logsi.LogException(STAppMessages.MSG_SERVICE_REQUEST_EXCEPTION % (service.service, "service_handle_spotify_command"), ex, logToSystemLogger=False)
                 raise
 
             finally:
+
+                # remove media browser nodes that the service may have changed from the browse cache;
+                # this is done even if the service failed, as the change may have been applied.
+                if (entity is not None):
+                    _InvalidateBrowseCache(entity, service)
+
+                # record the service call duration and outcome (if instrumentation is enabled).
+                if (entity is not None) and (entity.data.playstateCoordinator.Instrumentation.Enabled):
+                    entity.data.playstateCoordinator.Instrumentation.Record(InstrumentationCategory.ENTRY_POINT, "service:%s" % service.service, time.perf_counter() - startTime, isError)
             
                 # trace.
                 _logsi.LeaveMethod(SILevel.Debug)
@@ -1728,6 +1811,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 service (ServiceCall):
                     ServiceCall instance that contains service data (requested service name, field parameters, etc).
             """
+            entity:MediaPlayerEntity = None
+            startTime:float = time.perf_counter()
+            isError:bool = False
+
             try:
 
                 _logsi.EnterMethod(SILevel.Debug)
@@ -1748,28 +1835,28 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     # check album favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_album_favorites, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_album_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_ARTISTS_FOLLOWING:
 
                     # check artists following.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_artists_following, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_artists_following, ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_AUDIOBOOK_FAVORITES:
 
                     # check audiobook favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_audiobook_favorites, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_audiobook_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_EPISODE_FAVORITES:
 
                     # check episode favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_episode_favorites, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_episode_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_PLAYLIST_FOLLOWERS:
 
@@ -1777,35 +1864,35 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     playlist_id = service.data.get("playlist_id")
                     user_ids = service.data.get("user_ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_playlist_followers, playlist_id, user_ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_playlist_followers, playlist_id, user_ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_SHOW_FAVORITES:
 
                     # check show favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_show_favorites, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_show_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_TRACK_FAVORITES:
 
                     # check track favorites.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_track_favorites, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_track_favorites, ids)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_USER_FAVORITES:
 
                     # check user library favorites.
                     uris = service.data.get("uris")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_user_favorites, uris)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_user_favorites, uris)
 
                 elif service.service == SERVICE_SPOTIFY_CHECK_USERS_FOLLOWING:
 
                     # check users following.
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_check_users_following, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_check_users_following, ids)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ALBUM:
 
@@ -1813,7 +1900,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     album_id = service.data.get("album_id")
                     market = service.data.get("market")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_album, album_id, market)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_album, album_id, market)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ALBUM_FAVORITES:
 
@@ -1825,7 +1912,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_album_favorites, limit, offset, market, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_album_favorites, limit, offset, market, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ALBUM_NEW_RELEASES:
 
@@ -1837,7 +1924,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_album_new_releases, limit, offset, country, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_album_new_releases, limit, offset, country, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ALBUM_TRACKS:
 
@@ -1848,14 +1935,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     market = service.data.get("market")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_album_tracks, album_id, limit, offset, market, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_album_tracks, album_id, limit, offset, market, limit_total)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ARTIST:
 
                     # get spotify artist.
                     artist_id = service.data.get("artist_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_artist, artist_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_artist, artist_id)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ARTIST_ALBUMS:
 
@@ -1868,14 +1955,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit_total = service.data.get("limit_total")                   
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_artist_albums, artist_id, include_groups, limit, offset, market, limit_total, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_artist_albums, artist_id, include_groups, limit, offset, market, limit_total, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ARTIST_INFO:
 
                     # get spotify artist info.
                     artist_id = service.data.get("artist_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_artist_info, artist_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_artist_info, artist_id)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ARTIST_RELATED_ARTISTS:
 
@@ -1883,7 +1970,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     artist_id = service.data.get("artist_id")
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_artist_related_artists, artist_id, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_artist_related_artists, artist_id, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ARTIST_TOP_TRACKS:
 
@@ -1892,7 +1979,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     market = service.data.get("market")
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_artist_top_tracks, artist_id, market, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_artist_top_tracks, artist_id, market, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ARTISTS_FOLLOWED:
 
@@ -1903,7 +1990,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_artists_followed, after, limit, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_artists_followed, after, limit, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_AUDIOBOOK:
 
@@ -1911,7 +1998,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     audiobook_id = service.data.get("audiobook_id")
                     market = service.data.get("market")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_audiobook, audiobook_id, market)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_audiobook, audiobook_id, market)
 
                 elif service.service == SERVICE_SPOTIFY_GET_AUDIOBOOK_CHAPTERS:
 
@@ -1922,7 +2009,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     market = service.data.get("market")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_audiobook_chapters, audiobook_id, limit, offset, market, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_audiobook_chapters, audiobook_id, limit, offset, market, limit_total)
 
                 elif service.service == SERVICE_SPOTIFY_GET_AUDIOBOOK_FAVORITES:
 
@@ -1933,7 +2020,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_audiobook_favorites, limit, offset, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_audiobook_favorites, limit, offset, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_BROWSE_CATEGORYS_LIST:
 
@@ -1942,7 +2029,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     locale = service.data.get("locale")
                     refresh = service.data.get("refresh")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_browse_categorys_list, country, locale, refresh)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_browse_categorys_list, country, locale, refresh)
 
                 elif service.service == SERVICE_SPOTIFY_GET_CATEGORY_PLAYLISTS:
 
@@ -1954,7 +2041,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit_total = service.data.get("limit_total")
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_category_playlists, category_id, limit, offset, country, limit_total, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_category_playlists, category_id, limit, offset, country, limit_total, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_CHAPTER:
 
@@ -1962,14 +2049,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     chapter_id = service.data.get("chapter_id")
                     market = service.data.get("market")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_chapter, chapter_id, market)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_chapter, chapter_id, market)
 
                 elif service.service == SERVICE_SPOTIFY_GET_DEVICE_PLAYBACK_STATE:
 
                     # get spotify device playback state.
                     device_id = service.data.get("device_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_device_playback_state, device_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_device_playback_state, device_id)
 
                 elif service.service == SERVICE_SPOTIFY_GET_EPISODE:
 
@@ -1977,7 +2064,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     episode_id = service.data.get("episode_id")
                     market = service.data.get("market")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_episode, episode_id, market)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_episode, episode_id, market)
 
                 elif service.service == SERVICE_SPOTIFY_GET_EPISODE_FAVORITES:
 
@@ -1988,7 +2075,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_episode_favorites, limit, offset, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_episode_favorites, limit, offset, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_FEATURED_PLAYLISTS:
 
@@ -2001,14 +2088,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit_total = service.data.get("limit_total")
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_featured_playlists, limit, offset, country, locale, timestamp, limit_total, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_featured_playlists, limit, offset, country, locale, timestamp, limit_total, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_ID_FROM_URI:
 
                     # get id from uri.
                     uri = service.data.get("uri")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_id_from_uri, uri)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_id_from_uri, uri)
 
                 elif service.service == SERVICE_SPOTIFY_GET_IMAGE_PALETTE_COLORS:
 
@@ -2020,7 +2107,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     brightness_filter_high = service.data.get("brightness_filter_high")
                     hue_distance_filter = service.data.get("hue_distance_filter")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_image_palette_colors, image_source, color_count, color_quality, brightness_filter_low, brightness_filter_high, hue_distance_filter)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_image_palette_colors, image_source, color_count, color_quality, brightness_filter_low, brightness_filter_high, hue_distance_filter)
 
                 elif service.service == SERVICE_SPOTIFY_GET_IMAGE_VIBRANT_COLORS:
 
@@ -2029,7 +2116,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     color_count = service.data.get("color_count")
                     color_quality = service.data.get("color_quality")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_image_vibrant_colors, image_source, color_count, color_quality)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_image_vibrant_colors, image_source, color_count, color_quality)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYER_DEVICES:
 
@@ -2037,13 +2124,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     refresh = service.data.get("refresh")
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_player_devices, refresh, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_player_devices, refresh, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYER_LAST_PLAYED_INFO:
 
                     # get spotify player last played information.
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_player_last_played_info)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_player_last_played_info)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYER_NOW_PLAYING:
 
@@ -2051,7 +2138,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     market = service.data.get("market")
                     additional_types = service.data.get("additional_types")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_player_now_playing, market, additional_types)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_player_now_playing, market, additional_types)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYER_PLAYBACK_STATE:
 
@@ -2059,13 +2146,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     market = service.data.get("market")
                     additional_types = service.data.get("additional_types")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_player_playback_state, market, additional_types)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_player_playback_state, market, additional_types)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYER_QUEUE_INFO:
 
                     # get spotify queue info.
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_player_queue_info)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_player_queue_info)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYER_RECENT_TRACKS:
 
@@ -2076,7 +2163,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit_total = service.data.get("limit_total")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_player_recent_tracks, limit, after, before, limit_total, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_player_recent_tracks, limit, after, before, limit_total, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYLIST:
 
@@ -2087,14 +2174,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     additional_types = service.data.get("additional_types")
                     exclude_items = service.data.get("exclude_items")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_playlist, playlist_id, market, fields, additional_types, exclude_items)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_playlist, playlist_id, market, fields, additional_types, exclude_items)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYLIST_COVER_IMAGE:
 
                     # get spotify playlist cover image.
                     playlist_id = service.data.get("playlist_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_playlist_cover_image, playlist_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_playlist_cover_image, playlist_id)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYLIST_FAVORITES:
 
@@ -2105,7 +2192,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_playlist_favorites, limit, offset, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_playlist_favorites, limit, offset, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYLIST_ITEMS:
 
@@ -2118,7 +2205,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     additional_types = service.data.get("additional_types")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_playlist_items, playlist_id, limit, offset, market, fields, additional_types, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_playlist_items, playlist_id, limit, offset, market, fields, additional_types, limit_total)
 
                 elif service.service == SERVICE_SPOTIFY_GET_PLAYLISTS_FOR_USER:
 
@@ -2129,7 +2216,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit_total = service.data.get("limit_total")
                     sort_result = service.data.get("sort_result")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_playlists_for_user, user_id, limit, offset, limit_total, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_playlists_for_user, user_id, limit, offset, limit_total, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_SHOW:
 
@@ -2137,7 +2224,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     show_id = service.data.get("show_id")
                     market = service.data.get("market")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_show, show_id, market)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_show, show_id, market)
 
                 elif service.service == SERVICE_SPOTIFY_GET_SHOW_EPISODES:
 
@@ -2148,7 +2235,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     market = service.data.get("market")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_show_episodes, show_id, limit, offset, market, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_show_episodes, show_id, limit, offset, market, limit_total)
 
                 elif service.service == SERVICE_SPOTIFY_GET_SHOW_FAVORITES:
 
@@ -2160,7 +2247,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     exclude_audiobooks = service.data.get("exclude_audiobooks")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_show_favorites, limit, offset, limit_total, sort_result, exclude_audiobooks, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_show_favorites, limit, offset, limit_total, sort_result, exclude_audiobooks, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_SPOTIFY_CONNECT_DEVICE:
 
@@ -2172,7 +2259,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     refresh_device_list = service.data.get("refresh_device_list")
                     activate_device = service.data.get("activate_device")
                     delay = service.data.get("delay")
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_spotify_connect_device, device_value, verify_user_context, verify_timeout, refresh_device_list, activate_device, delay)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_spotify_connect_device, device_value, verify_user_context, verify_timeout, refresh_device_list, activate_device, delay)
 
                 elif service.service == SERVICE_SPOTIFY_GET_SPOTIFY_CONNECT_DEVICES:
 
@@ -2180,7 +2267,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
                     refresh = service.data.get("refresh")
                     sort_result = service.data.get("sort_result")
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_spotify_connect_devices, refresh, sort_result)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_spotify_connect_devices, refresh, sort_result)
 
                 elif service.service == SERVICE_SPOTIFY_GET_TRACK:
 
@@ -2188,7 +2275,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     track_id = service.data.get("track_id")
                     market = service.data.get("market")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_track, track_id, market)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_track, track_id, market)
 
                 elif service.service == SERVICE_SPOTIFY_GET_TRACK_AUDIO_FEATURES:
 
@@ -2196,7 +2283,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit = service.data.get("limit")
                     track_id = service.data.get("track_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_track_audio_features, track_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_track_audio_features, track_id)
 
                 elif service.service == SERVICE_SPOTIFY_GET_TRACK_FAVORITES:
 
@@ -2210,7 +2297,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     filter_album = service.data.get("filter_album")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_track_favorites, limit, offset, market, limit_total, sort_result, filter_artist, filter_album, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_track_favorites, limit, offset, market, limit_total, sort_result, filter_artist, filter_album, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_TRACK_RECOMMENDATIONS:
 
@@ -2263,7 +2350,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     max_valence = service.data.get("max_valence")
                     target_valence = service.data.get("target_valence")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(
+                    response = await _async_RunServiceInExecutor(
+                        entity, service, 
                         entity.service_spotify_get_track_recommendations, 
                         limit, market, 
                         seed_artists, seed_genres, seed_tracks, 
@@ -2288,7 +2376,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     limit = service.data.get("limit")
                     ids = service.data.get("ids")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_tracks_audio_features, ids)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_tracks_audio_features, ids)
 
                 elif service.service == SERVICE_SPOTIFY_GET_USERS_TOP_ARTISTS:
 
@@ -2300,7 +2388,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     sort_result = service.data.get("sort_result")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_users_top_artists, time_range, limit, offset, limit_total, sort_result, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_users_top_artists, time_range, limit, offset, limit_total, sort_result, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_GET_USERS_TOP_TRACKS:
 
@@ -2314,7 +2402,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     filter_album = service.data.get("filter_album")
                     filter_criteria = service.data.get("filter_criteria")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_get_users_top_tracks, time_range, limit, offset, limit_total, sort_result, filter_artist, filter_album, filter_criteria)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_get_users_top_tracks, time_range, limit, offset, limit_total, sort_result, filter_artist, filter_album, filter_criteria)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_ITEMS_ADD:
 
@@ -2323,14 +2411,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     uris = service.data.get("uris")
                     position = service.data.get("position")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_playlist_items_add, playlist_id, uris, position)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_items_add, playlist_id, uris, position)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_ITEMS_CLEAR:
 
                     # clear all items from playlist.
                     playlist_id = service.data.get("playlist_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_playlist_items_clear, playlist_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_items_clear, playlist_id)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_CREATE:
 
@@ -2342,7 +2430,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     collaborative = service.data.get("collaborative")
                     image_path = service.data.get("image_path")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_playlist_create, user_id, name, description, public, collaborative, image_path)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_create, user_id, name, description, public, collaborative, image_path)
                     
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_ITEMS_REMOVE:
 
@@ -2351,7 +2439,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     uris = service.data.get("uris")
                     snapshot_id = service.data.get("snapshot_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_playlist_items_remove, playlist_id, uris, snapshot_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_items_remove, playlist_id, uris, snapshot_id)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_ITEMS_REORDER:
 
@@ -2362,7 +2450,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     range_length = service.data.get("range_length")
                     snapshot_id = service.data.get("snapshot_id")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_playlist_items_reorder, playlist_id, range_start, insert_before, range_length, snapshot_id)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_items_reorder, playlist_id, range_start, insert_before, range_length, snapshot_id)
 
                 elif service.service == SERVICE_SPOTIFY_PLAYLIST_ITEMS_REPLACE:
 
@@ -2370,7 +2458,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     playlist_id = service.data.get("playlist_id")
                     uris = service.data.get("uris")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_playlist_items_replace, playlist_id, uris)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_playlist_items_replace, playlist_id, uris)
 
                 elif service.service == SERVICE_SPOTIFY_SEARCH_ALL:
 
@@ -2381,7 +2469,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_all, criteria, criteria_type, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_all, criteria, criteria_type, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_ALBUMS:
 
@@ -2393,7 +2481,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_albums, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_albums, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_ARTISTS:
 
@@ -2405,7 +2493,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_artists, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_artists, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_AUDIOBOOKS:
 
@@ -2417,7 +2505,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_audiobooks, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_audiobooks, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_EPISODES:
 
@@ -2429,7 +2517,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_episodes, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_episodes, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_PLAYLISTS:
 
@@ -2441,7 +2529,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_playlists, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_playlists, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_SHOWS:
 
@@ -2453,7 +2541,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_shows, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_shows, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_SEARCH_TRACKS:
 
@@ -2465,7 +2553,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     include_external = service.data.get("include_external")
                     limit_total = service.data.get("limit_total")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_search_tracks, criteria, limit, offset, market, include_external, limit_total)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_search_tracks, criteria, limit, offset, market, include_external, limit_total)
                     
                 elif service.service == SERVICE_SPOTIFY_ZEROCONF_DEVICE_CONNECT:
 
@@ -2482,7 +2570,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     verify_device_list_entry = service.data.get("verify_device_list_entry")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_zeroconf_device_connect, username, password, loginid, host_ipv4_address, host_ip_port, cpath, version, use_ssl, pre_disconnect, verify_device_list_entry, delay)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_zeroconf_device_connect, username, password, loginid, host_ipv4_address, host_ip_port, cpath, version, use_ssl, pre_disconnect, verify_device_list_entry, delay)
                     
                 elif service.service == SERVICE_SPOTIFY_ZEROCONF_DEVICE_DISCONNECT:
 
@@ -2494,7 +2582,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     use_ssl = service.data.get("use_ssl")
                     delay = service.data.get("delay")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_zeroconf_device_disconnect, host_ipv4_address, host_ip_port, cpath, version, use_ssl, delay)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_zeroconf_device_disconnect, host_ipv4_address, host_ip_port, cpath, version, use_ssl, delay)
                     
                 elif service.service == SERVICE_SPOTIFY_ZEROCONF_DEVICE_GETINFO:
 
@@ -2505,14 +2593,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                     version = service.data.get("version")
                     use_ssl = service.data.get("use_ssl")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_zeroconf_device_getinfo, host_ipv4_address, host_ip_port, cpath, version, use_ssl)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_zeroconf_device_getinfo, host_ipv4_address, host_ip_port, cpath, version, use_ssl)
                     
                 elif service.service == SERVICE_SPOTIFY_ZEROCONF_DISCOVER_DEVICES:
 
                     # zeroconf discover devices service.
                     timeout = service.data.get("timeout")
                     _logsi.LogVerbose(STAppMessages.MSG_SERVICE_EXECUTE % (service.service, entity.name))
-                    response = await hass.async_add_executor_job(entity.service_spotify_zeroconf_discover_devices, timeout)
+                    response = await _async_RunServiceInExecutor(entity, service, entity.service_spotify_zeroconf_discover_devices, timeout)
                     
                 else:
                     
@@ -2525,16 +2613,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             except HomeAssistantError as ex: 
                 
                 # log error, but not to system logger as HA will take care of it.
+                isError = True
                 _logsi.LogError(str(ex), logToSystemLogger=False)
                 raise
             
             except Exception as ex:
 
                 # log exception, but not to system logger as HA will take care of it.
+                isError = True
                 _logsi.LogException(STAppMessages.MSG_SERVICE_REQUEST_EXCEPTION % (service.service, "service_handle_spotify_serviceresponse"), ex, logToSystemLogger=False)
                 raise
 
             finally:
+
+                # remove media browser nodes that the service may have changed from the browse cache;
+                # this is done even if the service failed, as the change may have been applied.
+                if (entity is not None):
+                    _InvalidateBrowseCache(entity, service)
+
+                # record the service call duration and outcome (if instrumentation is enabled).
+                if (entity is not None) and (entity.data.playstateCoordinator.Instrumentation.Enabled):
+                    entity.data.playstateCoordinator.Instrumentation.Record(InstrumentationCategory.ENTRY_POINT, "service:%s" % service.service, time.perf_counter() - startTime, isError)
             
                 # trace.
                 _logsi.LeaveMethod(SILevel.Debug)
@@ -2792,6 +2891,56 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             return player
         
 
+        async def _async_RunServiceInExecutor(entity:MediaPlayerEntity, service:ServiceCall, func:Callable[..., Any], *args:Any) -> Any:
+            """
+            Runs a blocking service method in the executor of the entity's Spotify user account.
+
+            Args:
+                entity (MediaPlayerEntity):
+                    MediaPlayerEntity instance that the service was called for.
+                service (ServiceCall):
+                    ServiceCall instance that contains service data (requested service name, field parameters, etc).
+                func (Callable):
+                    Entity service method to run.
+                *args:
+                    Positional arguments to pass to the service method.
+
+            Player transport services (see `SERVICE_TRANSPORT_LANE_SERVICES`) are run in the
+            TRANSPORT lane, so that they are started ahead of queued work; all other services are
+            run in the BULK lane, and are rejected if the account executor is saturated.
+            """
+            lane:SpotifyRequestLane = SpotifyRequestLane.BULK
+            if (service.service in SERVICE_TRANSPORT_LANE_SERVICES):
+                lane = SpotifyRequestLane.TRANSPORT
+            return await entity.data.playstateCoordinator.async_RunInExecutor(lane, func, *args)
+
+
+        @callback
+        def _InvalidateBrowseCache(entity:MediaPlayerEntity, service:ServiceCall) -> None:
+            """
+            Removes media browser nodes that were changed by a service call from the browse
+            cache of the entity's Spotify user account.
+
+            Args:
+                entity (MediaPlayerEntity):
+                    MediaPlayerEntity instance that the service was called for.
+                service (ServiceCall):
+                    ServiceCall instance that contains service data (requested service name, field parameters, etc).
+            """
+            browseCache = entity.data.playstateCoordinator.BrowseCache
+            for mediaContentType in SERVICE_BROWSE_CACHE_INVALIDATIONS.get(service.service, []):
+                browseCache.Invalidate(mediaContentType)
+
+            # if a playlist id was not specified, then the service used the playing context
+            # playlist; in that case, remove all playlist nodes.
+            if (service.service in SERVICE_BROWSE_CACHE_PLAYLIST_INVALIDATIONS):
+                playlistId:str = service.data.get("playlist_id", None)
+                if (playlistId):
+                    browseCache.Invalidate(MediaType.PLAYLIST, "spotify:playlist:%s" % playlistId)
+                else:
+                    browseCache.Invalidate(MediaType.PLAYLIST)
+
+
         # register all services this component provides, and their corresponding schemas.
         _logsi.LogObject(SILevel.Verbose, STAppMessages.MSG_SERVICE_REQUEST_REGISTER % SERVICE_SPOTIFY_ADD_PLAYER_QUEUE_ITEMS, SERVICE_SPOTIFY_ADD_PLAYER_QUEUE_ITEMS_SCHEMA)
         hass.services.async_register(
@@ -3829,6 +3978,8 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
         # ** no custom options for this integration.
 
         spotifyClient:SpotifyClient = None
+        playstateCoordinator:SpotifyPlusPlayStateCoordinator = None
+        tokenRefresher:SpotifyPlusTokenRefresher = None
 
         # get OAuth2 implementation and create an OAuth2 session.
         implementation = await async_get_config_entry_implementation(hass, entry)
@@ -3842,202 +3993,184 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
         await session.async_ensure_token_valid()
            
         # -----------------------------------------------------------------------------------
-        # Define OAuth2 Session Token Updater.
+        # Define OAuth2 Session Token Refresh.
         # -----------------------------------------------------------------------------------
-        def _TokenUpdater() -> dict:
+        async def _async_TokenRefresh() -> dict:
             """
-            Callback function that will inform HA OAuth2 that a token needs to be refreshed.
-            This method is called from SpotifyClient whenever a token needs to be refreshed.
+            Coroutine that asks HA OAuth2 to refresh the session token, and persists the
+            refreshed token to the configuration entry.  This method is called in the event
+            loop by the token refresher, which ensures only one refresh is in flight at a time.
 
             Returns:
                 A dictionaty that contains the refreshed token.
             """
-            token:dict = None
-            
-            # trace.
-            _logsi.LogVerbose("'%s': TOKENUPDATER_LOCK is preparing to set the lock for method _TokenUpdater" % entry.title, colorValue=SIColors.Gold)
-            if TOKENUPDATER_LOCK.locked():
-                _logsi.LogVerbose("'%s': _TokenUpdater is waiting on a previous token update to complete" % entry.title, colorValue=SIColors.Orange)
+            reauth_account_name = "unknown"
+            reauth_client_id = "unknown"
+            reauth_token_expire_reason = 0
 
-            # only allow one thread to update authorization token at a time; otherwise a deadlock
-            # occurs in the `run_coroutine_threadsafe(session.implementation.async_refresh_token)` line!
-            with TOKENUPDATER_LOCK:
+            try:
 
                 # trace.
-                _logsi.LogVerbose("'%s': TOKENUPDATER_LOCK is set for method _TokenUpdater" % entry.title, colorValue=SIColors.Gold)
+                _logsi.EnterMethod(SILevel.Debug)
+                _logsi.LogVerbose("'%s': Component OAuth2 session token is either expired, not valid, or about to expire; starting token refresh processing" % entry.title, colorValue=SIColors.Gold)
+
+                # note that we do NOT use the `async_ensure_token_valid` method here, as it may
+                # determine that the token does not yet need to be refreshed (via self.valid_token).
+                # at this point, the token refresher KNOWS that the token needs to be refreshed.
+                # we will call HA to refresh the token, and store the new token in the integration config entry.
+                # 
+                # the following steps will be performed to accomplish the above:
+                # - call `async_refresh_token` to refresh the expired token.
+                # - set a token `status` attribute to denote the configuration update is for a token refresh event.  this allows the
+                #   `options_update_listener` to bypass the configuration reload processing since we only need to reload the configuration
+                #   if the user initiated an options change via the UI (e.g. no need to reload the configuration for token updates).
+                # - call `async_update_entry` to persist the refreshed token to config storage.
+                # - return the refreshed token to the caller.
 
-                reauth_account_name = "unknown"
-                reauth_client_id = "unknown"
-                reauth_token_expire_reason = 0
+                # trace.
+                _logsi.LogObject(SILevel.Debug, "'%s': Component OAuth2 implementation object" % entry.title, implementation, colorValue=SIColors.Gold)
+                _logsi.LogDictionary(SILevel.Verbose, "'%s': Component OAuth2 session.token (pre-update, dictionary)" % entry.title, session.token, prettyPrint=True, colorValue=SIColors.Gold)
+
+                # address configuration instance data area.
+                data:InstanceDataSpotifyPlus = hass.data[DOMAIN].get(entry.entry_id, None)
+                runtime_data:dict = data.runtime_data if (data is not None) else {}
+                _logsi.LogDictionary(SILevel.Verbose, "'%s': Component runtime_data (dictionary)" % entry.title, runtime_data, prettyPrint=True, colorValue=SIColors.Gold)
+
+                # get token reauthentication details.
+                reauth_account_name = implementation.name
+                reauth_client_id = (implementation.domain or "").replace(DOMAIN + "_","")
+                reauth_token_expire_reason = runtime_data.pop(TOKEN_EXPIRE_REASON, None)
+                _logsi.LogVerbose("'%s': Token refresh summary: AccountName=%s, ClientId=%s, ExpireReason=%s" % (entry.title, reauth_account_name, reauth_client_id, reauth_token_expire_reason), colorValue=SIColors.Gold)
+
+                # is this a forced token expire request?
+                if (reauth_token_expire_reason == 1):  
+                    # used to test Spotify forced token expiration after 6 months.
+                    _logsi.LogVerbose("'%s': Testing token expired invalid_grant event" % entry.title, colorValue=SIColors.Red)
+                    raise Exception("TEST: Token refresh failed: invalid_grant: Token has been expired or revoked. TEST")
+
+                # refresh the session token. 
+                # we will refresh the token from the `session.config_entry.data['token']` value, as
+                # that is where the most recently refreshed token is stored.
+                _logsi.LogVerbose("'%s': Component is calling async_refresh_token to refresh the session token" % entry.title, colorValue=SIColors.Gold)
+                token:dict = await session.implementation.async_refresh_token(session.config_entry.data['token'])
+
+                # store token event details in our runtime data area.
+                runtime_data[TOKEN_STATUS] = TOKEN_STATUS_REFRESH_EVENT
+
+                # update token value in configuration entry data.
+                _logsi.LogDictionary(SILevel.Verbose, "'%s': Component is calling async_update_entry to update configuration entry data with refreshed token" % entry.title, token, prettyPrint=True, colorValue=SIColors.Gold)
+                hass.config_entries.async_update_entry(
+                    session.config_entry, 
+                    data={**session.config_entry.data, 
+                          "token": token
+                    }
+                )
+            
+                # trace.
+                _logsi.LogVerbose("'%s': Component OAuth2 session token refresh complete" % entry.title, colorValue=SIColors.Gold)
+                tokenObj:SpotifyAuthToken = SpotifyAuthToken("TokenRefreshAuthType", "TokenRefreshProfileId", root=token)
+                _logsi.LogObject(SILevel.Verbose, "'%s': Component OAuth2 session token (post-update, token)" % entry.title, tokenObj, excludeNonPublic=True, colorValue=SIColors.Gold)
 
-                try:
+                # return refreshed token to caller.
+                return token
 
-                    # trace.
-                    _logsi.EnterMethod(SILevel.Debug)
-                    _logsi.LogVerbose("'%s': Component OAuth2 session token is either expired, not valid, or just refreshed by another HA worker thread; starting token refresh processing" % entry.title, colorValue=SIColors.Gold)
-
-                    # note that we do NOT use the `async_ensure_token_valid` method here, as it may
-                    # determine that the token does not yet need to be refreshed (via self.valid_token).
-                    # at this point, the SpotifyClient instance KNOWS that the token needs to be refreshed.
-                    # we will call HA to refresh the token, and store the new token in the integration config entry.
-                    # 
-                    # note that the `config_entry.data['token']` and `session.token` values should match, BUT
-                    # the refreshed `session.token` value will not change until AFTER `async_update_entry` is processed!
-                    #
-                    # the following steps will be performed to accomplish the above:
-                    # - get a reference to the HA OAuth2 session instance.
-                    # - call `async_refresh_token` to refresh the expired token.
-                    # - set a token `status` attribute to denote the configuration update is for a token refresh event.  this allows the
-                    #   `options_update_listener` to bypass the configuration reload processing since we only need to reload the configuration
-                    #   if the user initiated an options change via the UI (e.g. no need to reload the configuration for token updates).
-                    # - call the `add_job` method to add a job that will call `async_update_entry` to persist the refreshed token to config storage.
-                    # - return the refreshed token to the caller.
+            except Exception as ex:
+
+                # check for invalid grant error, as Spotify will deactivate refresh tokens
+                # after a 6 month period (starting 2026/07/20).
+                if "invalid_grant" in str(ex).lower():
 
                     # trace.
-                    _logsi.LogObject(SILevel.Debug, "'%s': Component OAuth2 implementation object" % entry.title, implementation, colorValue=SIColors.Gold)
-                    _logsi.LogDictionary(SILevel.Verbose, "'%s': Component OAuth2 session.token (pre-update, dictionary)" % entry.title, session.token, prettyPrint=True, colorValue=SIColors.Gold)
-
-                    # address configuration instance data area.
-                    data:InstanceDataSpotifyPlus = hass.data[DOMAIN].get(entry.entry_id, None)
-                    _logsi.LogDictionary(SILevel.Verbose, "'%s': Component runtime_data (dictionary)" % entry.title, data.runtime_data, prettyPrint=True, colorValue=SIColors.Gold)
-
-                    # get token reauthentication details.
-                    reauth_account_name = implementation.name
-                    reauth_client_id = (implementation.domain or "").replace(DOMAIN + "_","")
-                    reauth_token_expire_reason = data.runtime_data.pop(TOKEN_EXPIRE_REASON, None)
-                    _logsi.LogVerbose("'%s': Token refresh summary: AccountName=%s, ClientId=%s, ExpireReason=%s" % (entry.title, reauth_account_name, reauth_client_id, reauth_token_expire_reason), colorValue=SIColors.Gold)
-
-                    # create token object from token dictionary, to make expiration checks easier.
-                    tokenObj:SpotifyAuthToken = SpotifyAuthToken("TokenRefreshAuthType", "TokenRefreshProfileId", root=session.token)
-                    _logsi.LogObject(SILevel.Verbose, "'%s': Component OAuth2 session token (pre-update, SpotifyAuthToken object)" % entry.title, tokenObj, excludeNonPublic=True, colorValue=SIColors.Gold)
-
-                    # is this a forced token expire request?
-                    if (reauth_token_expire_reason == 1):  
-                        # used to test Spotify forced token expiration after 6 months.
-                        _logsi.LogVerbose("'%s': Testing token expired invalid_grant event" % entry.title, colorValue=SIColors.Red)
-                        raise Exception("TEST: Token refresh failed: invalid_grant: Token has been expired or revoked. TEST")
-
-                    # a quick check to see if session token is expired.  the session token update may have already occured
-                    # by another HA worker thread while we were waiting for the lock to free; if that is the case, then we 
-                    # don't need to refresh the token since it was just refreshed by the other thread!
-                    if (not tokenObj.IsExpired):
-                        _logsi.LogObject(SILevel.Verbose, "'%s': Component OAuth2 session.token was updated by another HA worker thread; refresh not necessary" % entry.title, tokenObj, excludeNonPublic=True, colorValue=SIColors.Gold)
-                        return session.token
-
-                    # we will refresh the token from the `session.config_entry.data['token']` value (instead of
-                    # the `session.token` value) in case the token was refreshed in the `update` method.
-                    # note - the `session.token` value will not change until AFTER `async_update_entry` is processed!
-
-                    # refresh the session token. 
-                    _logsi.LogVerbose("'%s': Component is calling async_refresh_token to refresh the session token" % entry.title, colorValue=SIColors.Gold)
-                    token = run_coroutine_threadsafe(
-                        session.implementation.async_refresh_token(session.config_entry.data['token']), 
-                        hass.loop
-                    ).result()
-
-                    # store token event details in our runtime data area.
-                    data.runtime_data[TOKEN_STATUS] = TOKEN_STATUS_REFRESH_EVENT
-
-                    # update token value in configuration entry data.
-                    # updating a config entry must be done in the event loop thread, as there is no sync API to update config entries!
-                    # the "hass.add_job" method is used to schedule a function in the event loop that calls hass.config_entries.async_update_entry.
-                    _logsi.LogDictionary(SILevel.Verbose, "'%s': Component is submitting add_job to call async_update_entry to update configuration entry data with refreshed token" % entry.title, token, prettyPrint=True, colorValue=SIColors.Gold)
-                    hass.add_job(
-                        functools.partial(
-                            hass.config_entries.async_update_entry,
-                            session.config_entry, 
-                            data={**session.config_entry.data, 
-                                  "token": token
-                            }
-                        )
+                    _logsi.LogWarning("The SpotifyPlus authorization refresh token for user name \"%s\" (OAuth client id \"%s\") has expired due to Spotify regulations. Please re-authenticate to Spotify for this account via the \"Settings \\ Devices & Services\" UI, using the discovered \"SpotifyPlus Reconfigure\" option" % (reauth_account_name, reauth_client_id), colorValue=SIColors.Gold)
+
+                    # force user to reauth application credentials.
+                    _logsi.LogVerbose("'%s': Component is calling async_create_task to reauthorize Spotify application credentials" % entry.title, colorValue=SIColors.Gold)
+                    hass.async_create_task(
+                        hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={
+                                "source": "reauth",
+                                "entry_id": entry.entry_id,
+                            },
+                            data=entry.data,
+                        ),
                     )
-                
-                    # trace.
-                    _logsi.LogVerbose("'%s': Component OAuth2 session token refresh complete" % entry.title, colorValue=SIColors.Gold)
-                    tokenObj:SpotifyAuthToken = SpotifyAuthToken("TokenRefreshAuthType", "TokenRefreshProfileId", root=token)
-                    _logsi.LogObject(SILevel.Verbose, "'%s': Component OAuth2 session token (post-update, token)" % entry.title, tokenObj, excludeNonPublic=True, colorValue=SIColors.Gold)
-
-                    # return refreshed token to caller.
-                    return token
-
-                except Exception as ex:
-
-                    # check for invalid grant error, as Spotify will deactivate refresh tokens
-                    # after a 6 month period (starting 2026/07/20).
-                    if "invalid_grant" in str(ex).lower():
-
-                        # trace.
-                        _logsi.LogWarning("The SpotifyPlus authorization refresh token for user name \"%s\" (OAuth client id \"%s\") has expired due to Spotify regulations. Please re-authenticate to Spotify for this account via the \"Settings \\ Devices & Services\" UI, using the discovered \"SpotifyPlus Reconfigure\" option" % (reauth_account_name, reauth_client_id), colorValue=SIColors.Gold)
-
-                        # force user to reauth application credentials (done via the event thread).
-                        _logsi.LogVerbose("'%s': Component is calling async_create_task to reauthorize Spotify application credentials" % entry.title, colorValue=SIColors.Gold)
-                        hass.loop.call_soon_threadsafe(
-                            functools.partial(
-                                hass.async_create_task,
-                                hass.config_entries.flow.async_init(
-                                    DOMAIN,
-                                    context={
-                                        "source": "reauth",
-                                        "entry_id": entry.entry_id,
-                                    },
-                                    data=entry.data,
-                                ),
-                            )
-                        )
-
-                        # create an issue / persistent notification (done via the event thread).
-                        _logsi.LogVerbose("'%s': Component is calling async_create_issue to create a new issue for Spotify token reauthorization" % entry.title, colorValue=SIColors.Gold)
-                        hass.loop.call_soon_threadsafe(
-                            functools.partial(
-                                async_create_issue,
-                                hass,
-                                DOMAIN,
-                                f"reauth_{entry.entry_id}",
-                                is_fixable=False,
-                                severity=IssueSeverity.WARNING,
-                                learn_more_url="https://github.com/thlucas1/homeassistantcomponent_spotifyplus/wiki/Frequently-Asked-Questions#why-do-i-have-to-reauthenticate-to-spotify-every-six-months",
-                                translation_key="reauth_required",
-                                translation_placeholders={
-                                    "account_name": reauth_account_name,
-                                    "client_id": reauth_client_id,
-                                },
-                            )
-                        )
-
-                        # TEST TODO - we may need to add something here to runtime_data, then check for it
-                        # in the media_player update() method to prevent further calls to the Spotify
-                        # Web API until the user reauthenticates the application credentials!
-
-                        # # address configuration instance data area.
-                        # # store token event details in our runtime data area.
-                        # data:InstanceDataSpotifyPlus = hass.data[DOMAIN].get(entry.entry_id)
-                        # data.runtime_data[TOKEN_STATUS] = TOKEN_STATUS_REAUTH_EVENT
-                        # data.runtime_data[TOKEN_STATUS_ACCOUNT_NAME] = reauth_account_name
-                        # data.runtime_data[TOKEN_STATUS_CLIENT_ID] = reauth_client_id
-
-                        # )
-                
-                        # return original (expired) token, as we will generate an exception in 
-                        # the `async_update_entry` method.
-                        return session.config_entry.data['token']
 
-                    # trace.
-                    _logsi.LogException("'%s': Component OAuth2 session token refresh exception: %s" % (entry.title, str(ex)), ex, colorValue=SIColors.Gold)
-                    raise
+                    # create an issue / persistent notification.
+                    _logsi.LogVerbose("'%s': Component is calling async_create_issue to create a new issue for Spotify token reauthorization" % entry.title, colorValue=SIColors.Gold)
+                    async_create_issue(
+                        hass,
+                        DOMAIN,
+                        f"reauth_{entry.entry_id}",
+                        is_fixable=False,
+                        severity=IssueSeverity.WARNING,
+                        learn_more_url="https://github.com/thlucas1/homeassistantcomponent_spotifyplus/wiki/Frequently-Asked-Questions#why-do-i-have-to-reauthenticate-to-spotify-every-six-months",
+                        translation_key="reauth_required",
+                        translation_placeholders={
+                            "account_name": reauth_account_name,
+                            "client_id": reauth_client_id,
+                        },
+                    )
 
-                finally:
+                    # TEST TODO - we may need to add something here to runtime_data, then check for it
+                    # in the media_player update() method to prevent further calls to the Spotify
+                    # Web API until the user reauthenticates the application credentials!
 
-                    # trace.
-                    _logsi.LeaveMethod(SILevel.Debug)
+                    # # address configuration instance data area.
+                    # # store token event details in our runtime data area.
+                    # data:InstanceDataSpotifyPlus = hass.data[DOMAIN].get(entry.entry_id)
+                    # data.runtime_data[TOKEN_STATUS] = TOKEN_STATUS_REAUTH_EVENT
+                    # data.runtime_data[TOKEN_STATUS_ACCOUNT_NAME] = reauth_account_name
+                    # data.runtime_data[TOKEN_STATUS_CLIENT_ID] = reauth_client_id
 
-            # trace.
-            _logsi.LogVerbose("'%s': TOKENUPDATER_LOCK is RESET for method _TokenUpdater" % entry.title, colorValue=SIColors.Gold)
+                    # )
+            
+                    # return original (expired) token, as we will generate an exception in 
+                    # the `async_update_entry` method.
+                    return session.config_entry.data['token']
+
+                # trace.
+                _logsi.LogException("'%s': Component OAuth2 session token refresh exception: %s" % (entry.title, str(ex)), ex, colorValue=SIColors.Gold)
+                raise
+
+            finally:
+
+                # trace.
+                _logsi.LeaveMethod(SILevel.Debug)
+
+
+        # -----------------------------------------------------------------------------------
+        # Define OAuth2 Session Token Updater.
+        # -----------------------------------------------------------------------------------
+        def _TokenUpdater() -> dict:
+            """
+            Callback function that will inform HA OAuth2 that a token needs to be refreshed.
+            This method is called from SpotifyClient (on a worker thread) whenever a token 
+            needs to be refreshed.
+
+            Returns:
+                A dictionaty that contains the refreshed token.
+
+            The refresh itself runs in the event loop; this thread only waits (with a timeout)
+            on the refresh that is in flight, which is shared by all threads that need it.
+            """
+            return tokenRefresher.RefreshTokenWait()
 
 
         # -----------------------------------------------------------------------------------
         # Continue with async_setup_entry
         # -----------------------------------------------------------------------------------
 
+        # create the token refresher; it performs all token refreshes (one at a time) in the
+        # event loop, and refreshes the token in the background before it expires, rather 
+        # than by the first Spotify Web API request that finds it expired.
+        tokenRefresher = SpotifyPlusTokenRefresher(
+            hass,
+            entry,
+            _async_TokenRefresh,
+            entry.options.get(CONF_OPTION_TOKEN_REFRESH_MARGIN, None) or DEFAULT_OPTION_TOKEN_REFRESH_MARGIN,
+        )
+
         # get shared zeroconf instance.
         _logsi.LogVerbose("'%s': MediaPlayer async_setup_entry is storing the Zeroconf reference to the instanceData object" % entry.title)
         zeroconf_instance = await zeroconf.async_get_instance(hass)
@@ -4088,6 +4221,9 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
             # trace.
             _logsi.LogVerbose("'%s': ha_stop_event was detected" % entry.title)
 
+            # stop the background token refresher.
+            tokenRefresher.Stop()
+
             # dispose of SpotifyClient resources (stops directory task, unwires events, etc).
             if (spotifyClient is not None):
                 _logsi.LogVerbose("'%s': Component handle_ha_stop_event is disposing the SpotifyClient object" % entry.title)
@@ -4105,6 +4241,10 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
         unsubscribe_event_ha_stop = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, handle_ha_stop_event)
         runtime_data["unsubscribe_event_ha_stop"] = unsubscribe_event_ha_stop
 
+        # get the playstate coordinator that is shared by all entries of this Spotify user account.
+        _logsi.LogVerbose("'%s': Component async_setup_entry is acquiring the shared playstate coordinator" % entry.title)
+        playstateCoordinator = async_acquire_playstate_coordinator(hass, spotifyClient, tokenRefresher)
+
         # create media player entity platform instance data.
         _logsi.LogVerbose("'%s': Component async_setup_entry is creating the media player platform instance data object" % entry.title)
         hass.data.setdefault(DOMAIN, {})
@@ -4113,11 +4253,26 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
             spotifyClient=spotifyClient,
             media_player=None,
             options=entry.options,
-            tokenUpdater_lock=TOKENUPDATER_LOCK,
+            playlistCache=playstateCoordinator.PlaylistCache,
+            playstateCoordinator=playstateCoordinator,
+            tokenRefresher=tokenRefresher,
             runtime_data=runtime_data,
         )
         _logsi.LogObject(SILevel.Verbose, "'%s': Component async_setup_entry media player platform instance data object" % entry.title, hass.data[DOMAIN][entry.entry_id])
 
+        # enable latency metrics for the Spotify user account if any entry of the account enabled them.
+        playstateCoordinator.Instrumentation.Enabled = any(data.OptionMetricsEnabled for data in hass.data[DOMAIN].values() if data.playstateCoordinator is playstateCoordinator)
+
+        # size the Spotify user account executor to the largest values of the account entries.
+        accountData:list[InstanceDataSpotifyPlus] = [data for data in hass.data[DOMAIN].values() if data.playstateCoordinator is playstateCoordinator]
+        playstateCoordinator.Executor.Configure(
+            max(data.OptionExecutorMaxWorkers for data in accountData),
+            max(data.OptionExecutorQueueLimit for data in accountData),
+        )
+
+        # start refreshing the authentication token in the background.
+        tokenRefresher.Start(spotifyClient, playstateCoordinator)
+
         # ensure authentication token scopes have not changed.
         if not set(session.token["scope"].split(" ")).issuperset(SPOTIFY_SCOPES):
             _logsi.LogWarning("'%s': Spotify authentication token scopes have changed; user needs to re-authenticate their application credentials" % (entry.title), colorValue=SIColors.Tan)
@@ -4172,6 +4327,14 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
         # trace.
         _logsi.LogException("'%s': Component async_setup_entry exception" % entry.title, ex, logToSystemLogger=False)
         
+        # stop the background token refresher (if one was created).
+        if (tokenRefresher is not None):
+            tokenRefresher.Stop()
+
+        # release our reference to the shared playstate coordinator (if one was acquired).
+        if (playstateCoordinator is not None):
+            async_release_playstate_coordinator(hass, playstateCoordinator, spotifyClient)
+
         # reset storage.
         spotifyClient = None
         
@@ -4229,6 +4392,16 @@ async def async_unload_entry(hass:HomeAssistant, entry:ConfigEntry) -> bool:
             if (data is not None):
                 if (data.spotifyClient is not None):
 
+                    # stop the background token refresher.
+                    if (data.tokenRefresher is not None):
+                        _logsi.LogVerbose("'%s': Component async_unload_entry is stopping the background token refresher" % entry.title)
+                        data.tokenRefresher.Stop()
+
+                    # release our reference to the shared playstate coordinator.
+                    if (data.playstateCoordinator is not None):
+                        _logsi.LogVerbose("'%s': Component async_unload_entry is releasing the shared playstate coordinator" % entry.title)
+                        async_release_playstate_coordinator(hass, data.playstateCoordinator, data.spotifyClient)
+
                     # dispose of the spotifyClient object.
                     _logsi.LogVerbose("'%s': Component async_unload_entry is disposing the SpotifyClient object" % entry.title)
                     await hass.async_add_executor_job(
@@ -4355,27 +4528,15 @@ async def options_update_listener(hass:HomeAssistant, entry:ConfigEntry) -> None
         # reload the configuration entry (if necessary).
         if shouldReload:
 
-            # trace.
-            _logsi.LogVerbose("'%s': TOKENUPDATER_LOCK is preparing to set the lock for method options_update_listener" % entry.title, colorValue=SIColors.Gold)
-            if TOKENUPDATER_LOCK.locked():
-                _logsi.LogVerbose("'%s': options_update_listener is waiting on TOKENUPDATER_LOCK to free" % entry.title, colorValue=SIColors.Gold)
-
-            try:
-
-                # only allow one thread to update authorization token at a time; otherwise a deadlock
-                # occurs in the `run_coroutine_threadsafe(session.implementation.async_refresh_token)` line!
-                with TOKENUPDATER_LOCK:
-
-                    # trace.
-                    _logsi.LogVerbose("'%s': TOKENUPDATER_LOCK is set for method options_update_listener" % entry.title, colorValue=SIColors.Gold)
-
-                    _logsi.LogVerbose("'%s': Component options_update_listener is reloading the configuration (due to UI options change)" % entry.title)
-                    await hass.config_entries.async_reload(entry.entry_id)
-
-            finally:
+            # wait for a token refresh that is in flight to complete, so that the reload does
+            # not dispose of the SpotifyClient instance while its token is being swapped.
+            data:InstanceDataSpotifyPlus = hass.data[DOMAIN].get(entry.entry_id, None)
+            if (data is not None) and (data.tokenRefresher is not None) and (data.tokenRefresher.IsRefreshing):
+                _logsi.LogVerbose("'%s': options_update_listener is waiting on a token refresh to complete" % entry.title, colorValue=SIColors.Gold)
+                await data.tokenRefresher.async_WaitIdle()
 
-                # trace.
-                _logsi.LogVerbose("'%s': TOKENUPDATER_LOCK is RESET for method options_update_listener" % entry.title, colorValue=SIColors.Gold)
+            _logsi.LogVerbose("'%s': Component options_update_listener is reloading the configuration (due to UI options change)" % entry.title)
+            await hass.config_entries.async_reload(entry.entry_id)
 
         else:
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from functools import partial
 import logging
 import base64
+import io
 import os
 import pickle
 from typing import Any
@@ -19,11 +20,17 @@ from homeassistant.components.media_player import (
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import IntegrationError
 
+from .catalogstore import SpotifyPlusCatalogStore
 from .const import (
     DOMAIN, 
     BrowsableMedia, 
-    SPOTIFY_BROWSE_LIMIT_TOTAL,
+    CATALOG_TTL_CATEGORIES,
+    CATALOG_TTL_FEATURED_PLAYLISTS,
+    CATALOG_TTL_NEW_RELEASES,
+    SPOTIFY_BROWSE_PAGE_SIZE,
+    SPOTIFY_BROWSE_PAGE_TOKEN,
 )
+from .executor import RunConcurrently
 
 # get smartinspect logger reference; create a new session for this module name.
 from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIMethodParmListContext
@@ -52,6 +59,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.PLAYLIST,
         "can_search": True,
+        "cache_ttl": 300,
     },
     BrowsableMedia.SPOTIFY_USER_FOLLOWED_ARTISTS.value:  {
         "title": "Favorite Artists",
@@ -60,6 +68,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.ARTIST,
         "can_search": True,
+        "cache_ttl": 300,
     },
     BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS.value:  {
         "title": "Favorite Albums",
@@ -68,6 +77,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.ALBUM,
         "can_search": True,
+        "cache_ttl": 300,
     },
     BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS.value:  {
         "title": "Favorite Tracks",
@@ -76,6 +86,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.TRACK,
         "can_search": True,
+        "cache_ttl": 300,
     },
     BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS.value:  {
         "title": "Favorite Podcasts",
@@ -84,6 +95,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.PODCAST,
         "can_search": True,
+        "cache_ttl": 300,
     },
     BrowsableMedia.SPOTIFY_USER_SAVED_AUDIOBOOKS.value:  {
         "title": "Favorite Audiobooks",
@@ -92,6 +104,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.APP,  # spotify audiobook support
         "can_search": True,
+        "cache_ttl": 300,
     },
     BrowsableMedia.SPOTIFY_USER_TOP_ARTISTS.value:  {
         "title": "My Top Artists",
@@ -100,6 +113,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.ARTIST,
         "can_search": True,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_USER_TOP_TRACKS.value:  {
         "title": "My Top Tracks",
@@ -108,6 +122,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.TRACK,
         "can_search": True,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_FEATURED_PLAYLISTS.value:  {
         "title": "Featured Playlists",
@@ -116,6 +131,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.PLAYLIST,
         "can_search": True,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_NEW_RELEASES.value:  {
         "title": "New Releases",
@@ -124,6 +140,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.ALBUM,
         "can_search": True,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_CATEGORYS.value:  {
         "title": "Categories",
@@ -132,6 +149,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.GENRE,
         "can_search": False,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS.value:  {
         "title": "Category Playlists",
@@ -141,6 +159,7 @@ SPOTIFY_LIBRARY_MAP = {
         "children": MediaClass.PLAYLIST,
         "is_index_item": False,
         "can_search": False,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS_MADEFORYOU.value:  {
         "title": "Made For You",
@@ -149,6 +168,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.PLAYLIST,
         "can_search": False,
+        "cache_ttl": 3600,
     },
     BrowsableMedia.SPOTIFY_USER_RECENTLY_PLAYED.value:  {
         "title": "Recently Played",
@@ -157,6 +177,7 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.DIRECTORY,
         "children": MediaClass.TRACK,
         "can_search": True,
+        "cache_ttl": 60,
     },
     BrowsableMedia.SPOTIFY_SEARCH_PLAYLISTS.value: {
         "title": "Search Playlists",
@@ -212,16 +233,19 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.ALBUM, 
         "children": MediaClass.TRACK,
         "is_index_item": False,
+        "cache_ttl": 3600,
     },
     MediaType.ARTIST: {
         "parent": MediaClass.ARTIST, 
         "children": MediaClass.ALBUM,
         "is_index_item": False,
+        "cache_ttl": 3600,
     },
     MediaType.APP: {  # spotify audiobook support
         "parent": MediaClass.APP, 
         "children": MediaClass.TRACK,
         "is_index_item": False,
+        "cache_ttl": 3600,
     },
     MediaType.EPISODE: {
         "parent": MediaClass.EPISODE, 
@@ -232,16 +256,19 @@ SPOTIFY_LIBRARY_MAP = {
         "parent": MediaClass.PLAYLIST,
         "children": MediaClass.TRACK,
         "is_index_item": False,
+        "cache_ttl": 600,
     },
     MediaType.PLAYLIST: {
         "parent": MediaClass.PLAYLIST,
         "children": MediaClass.TRACK,
         "is_index_item": False,
+        "cache_ttl": 300,
     },
     MediaType.PODCAST: {
         "parent": MediaClass.PODCAST, 
         "children": MediaClass.EPISODE,
         "is_index_item": False,
+        "cache_ttl": 600,
     },
     MediaType.TRACK: {
         "parent": MediaClass.TRACK, 
@@ -252,13 +279,30 @@ SPOTIFY_LIBRARY_MAP = {
 """ 
 # Spotify Library index definitions, containing media attributes that control content display.
 # The order listed is how they are displayed in the media browser.
+# The "cache_ttl" attribute is the time (in seconds) that a built node remains fresh in the
+# browse cache; nodes without a "cache_ttl" attribute are not cached.
 """
 
 BROWSE_LIMIT = 50
 """ Max number of items to return from a Spotify Web API query. """
 
 CATEGORY_BASE64:str = "category_base64::"
-""" Eye-catcher used to denote a serialized ContentItem. """
+"""
+Eye-catcher used to denote a serialized Category object; only used by content ids that
+were created by previous versions, which are still accepted for compatibility.
+"""
+
+CATEGORY_URI_PREFIX:str = "spotify:category:"
+""" Prefix of a category playlists node content id (followed by the category id). """
+
+CATEGORY_REGISTRY_CACHE_KEY:str = "SpotifyPlusCategoryRegistry"
+"""
+SpotifyClient `ConfigurationCache` key of the category registry, which indexes the cached
+`GetBrowseCategorysList` results by category id.
+"""
+
+BROWSE_MORE_TITLE:str = "More…"
+""" Title of the child node that displays the next page of a paged media browser node. """
 
 LOCAL_IMAGE_PREFIX:str = "/local/"
 """ Local image prefix value. """
@@ -283,9 +327,22 @@ class UnknownMediaType(BrowseError):
     """Unknown media type."""
 
 
+class _CategoryUnpickler(pickle.Unpickler):
+    """
+    Unpickler that only loads the classes that a serialized Category object is made of,
+    so that a content id supplied by a client cannot load (or run) anything else.
+    """
+
+    def find_class(self, module:str, name:str) -> Any:
+        if ((module, name) in [("copyreg", "_reconstructor"), ("builtins", "object")]) \
+        or (module.startswith("spotifywebapipython.models.") and (name in ["Category", "ImageObject"])):
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError("'%s.%s' is not allowed in a serialized Category object" % (module, name))
+
+
 def deserialize_object(txt:str) -> object:
     """
-    Deserialize an object from a plain text string.
+    Deserialize a Category object from a plain text string.
     
     Args:
         txt (str):
@@ -293,29 +350,117 @@ def deserialize_object(txt:str) -> object:
             
     Returns:
         An object that was deserialized from a base64 string representation.
+
+    This is only used to resolve content ids that were created by previous versions;
+    current versions use the category id (see `CATEGORY_URI_PREFIX`).
     """
     base64_bytes = txt.encode('ascii')
     message_bytes = base64.b64decode(base64_bytes)
-    obj = pickle.loads(message_bytes)
+    obj = _CategoryUnpickler(io.BytesIO(message_bytes)).load()
     return obj
 
 
-@staticmethod
-def serialize_object(obj:object) -> str:
+def _GetCatalogKey(client:SpotifyClient, name:str) -> str:
     """
-    Serialize an object into a plain text string.
-    
+    Returns the catalog store key of a data item for the Spotify user account of a client.
+
     Args:
-        obj (object):
-            The object to serialize.
-            
+        client (SpotifyClient):
+            The SpotifyClient instance that requests the data.
+        name (str):
+            Name of the data item.
+    """
+    return SpotifyPlusCatalogStore.GetKey(client.UserProfile.Id, client.UserProfile.Country, None, name)
+
+
+def _GetBrowseCategorysList(client:SpotifyClient, catalogStore:SpotifyPlusCatalogStore|None) -> list[Category]:
+    """
+    Returns the browse categories list from the client configuration cache or, after a
+    restart, from the catalog store; it is only requested from Spotify if neither has it.
+
+    Args:
+        client (SpotifyClient):
+            The SpotifyClient instance that owns the configuration cache.
+        catalogStore (SpotifyPlusCatalogStore):
+            Persistent catalog store, or None to not use it.
+    """
+    if (catalogStore is None) or ("GetBrowseCategorysList" in client.ConfigurationCache):
+        return client.GetBrowseCategorysList(refresh=False)
+
+    categories:list[Category] = catalogStore.GetOrCreate(
+        _GetCatalogKey(client, "GetBrowseCategorysList"),
+        CATALOG_TTL_CATEGORIES,
+        partial(client.GetBrowseCategorysList, refresh=False),
+        lambda result: [category.ToDictionary() for category in result],
+        lambda value: [Category(root=item) for item in value],
+    )
+    client.ConfigurationCache["GetBrowseCategorysList"] = categories
+    return categories
+
+
+def _GetCategoryRegistry(client:SpotifyClient, catalogStore:SpotifyPlusCatalogStore|None) -> dict[str, Category]:
+    """
+    Returns the category registry, which indexes the cached browse categories list by
+    category id.  The registry is rebuilt whenever the cached list is replaced.
+
+    Args:
+        client (SpotifyClient):
+            The SpotifyClient instance that owns the configuration cache.
+        catalogStore (SpotifyPlusCatalogStore):
+            Persistent catalog store, or None to not use it.
+
+    Returns:
+        A dictionary of Category objects, keyed by category id.
+
+    The browse categories list is only requested from Spotify if it is not cached.  An
+    empty registry is returned if the list could not be retrieved, as the registry only
+    supplies display values (category name and image).
+    """
+    try:
+        categories:list[Category] = _GetBrowseCategorysList(client, catalogStore)
+    except Exception as ex:
+        _logsi.LogVerbose("Browse categories list could not be retrieved for the category registry: %s" % str(ex))
+        return {}
+    registry:tuple[list[Category], dict[str, Category]] = client.ConfigurationCache.get(CATEGORY_REGISTRY_CACHE_KEY, None)
+    if (registry is None) or (registry[0] is not categories):
+        registry = (categories, {category.Id: category for category in categories})
+        client.ConfigurationCache[CATEGORY_REGISTRY_CACHE_KEY] = registry
+    return registry[1]
+
+
+def _GetNextPageOffset(page:PageObject, offset:int) -> str | None:
+    """
+    Returns the page token (offset) of the page that follows a page of items.
+
+    Args:
+        page (PageObject):
+            Page of items returned by the Spotify Web API.
+        offset (int):
+            Offset of the first item of the page.
+
     Returns:
-        A serialized base64 string representation of the object.
+        The offset of the next page (as a string), or None if there are no more pages.
     """
-    message_bytes = pickle.dumps(obj)
-    base64_bytes = base64.b64encode(message_bytes)
-    txt = base64_bytes.decode('ascii')
-    return txt
+    if (page is None) or (page.Next is None) or (len(page.Items) == 0):
+        return None
+    return str(offset + len(page.Items))
+
+
+def _SplitPageToken(media_content_id:str|None) -> tuple[str|None, str|None]:
+    """
+    Splits a media browser node content id into its base content id and page token.
+
+    Args:
+        media_content_id (str):
+            Media content id, which may contain a page token.
+
+    Returns:
+        A tuple of the base content id and the page token (None if not a continuation page).
+    """
+    if (media_content_id is None) or (SPOTIFY_BROWSE_PAGE_TOKEN not in media_content_id):
+        return media_content_id, None
+    baseId, pageToken = media_content_id.rsplit(SPOTIFY_BROWSE_PAGE_TOKEN, 1)
+    return baseId, pageToken
 
 
 async def async_browse_media_library_index(
@@ -455,6 +600,7 @@ def browse_media_node(
     libraryMap:dict,
     media_content_type:str|None,
     media_content_id:str|None,
+    catalogStore:SpotifyPlusCatalogStore=None,
     ) -> BrowseMedia:
     """
     Builds a BrowseMedia object for a selected media content type, and all of it's
@@ -478,6 +624,9 @@ def browse_media_node(
         media_content_id (str):
             Selected media content id in the media browser.
             This value will be None upon the initial entry to the media browser.
+        catalogStore (SpotifyPlusCatalogStore):
+            Persistent store of slow-changing catalog data (e.g. categories, new releases),
+            or None to always request it from Spotify.
     """
     methodParms:SIMethodParmListContext = None
         
@@ -501,159 +650,223 @@ def browse_media_node(
         image:str = None
         media:object = None
         items:list = []
+
+        # is this a continuation page of a paged node?  if so, then get the page token
+        # (an offset for most nodes, or a cursor for followed artists).
+        pageContentId:str = media_content_id
+        media_content_id, pageToken = _SplitPageToken(media_content_id)
+        offset:int = int(pageToken) if (pageToken is not None) and (pageToken.isdigit()) else 0
+        nextPageToken:str = None
         
         # build selection list based upon the browsable media type.
         # - media: will contain the result of the spotify web api call.
         # - items: will contain the child items to display for the parent media item.
+        # - nextPageToken: the page token of the next page of items (if any).
         # - title: the title to display in the media browser.
         # - image: the image (if any) to display in the media browser (can be none).
         if media_content_type == BrowsableMedia.SPOTIFY_USER_PLAYLISTS:
             _logsi.LogVerbose("'%s': querying spotify for Playlist Favorites" % playerName)
-            media:PlaylistPageSimplified = client.GetPlaylistFavorites(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:PlaylistPageSimplified = client.GetPlaylistFavorites(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_FOLLOWED_ARTISTS:
             _logsi.LogVerbose("'%s': querying spotify for Artists Followed" % playerName)
-            media:ArtistPage = client.GetArtistsFollowed(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:ArtistPage = client.GetArtistsFollowed(after=pageToken, limit=SPOTIFY_BROWSE_PAGE_SIZE, sortResult=False)
             items = media.Items
+            if (media.Next is not None) and (media.CursorAfter is not None):
+                nextPageToken = str(media.CursorAfter)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_ALBUMS:
             _logsi.LogVerbose("Getting Spotify user Album favorites")
-            media:AlbumPageSaved = client.GetAlbumFavorites(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:AlbumPageSaved = client.GetAlbumFavorites(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.GetAlbums()
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_TRACKS:
             _logsi.LogVerbose("Getting Spotify user Track favorites")
-            media:TrackPageSaved = client.GetTrackFavorites(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:TrackPageSaved = client.GetTrackFavorites(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.GetTracks()
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_SHOWS:
             _logsi.LogVerbose("Getting Spotify user Show favorites")
-            media:ShowPageSaved = client.GetShowFavorites(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:ShowPageSaved = client.GetShowFavorites(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.GetShows()
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_SAVED_AUDIOBOOKS:
             _logsi.LogVerbose("Getting Spotify user Audiobook favorites")
-            media:AudiobookPageSimplified = client.GetAudiobookFavorites(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:AudiobookPageSimplified = client.GetAudiobookFavorites(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_RECENTLY_PLAYED:
             _logsi.LogVerbose("Getting Spotify user Recently Played Tracks")
-            media:PlayHistoryPage = client.GetPlayerRecentTracks(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:PlayHistoryPage = client.GetPlayerRecentTracks(limit=SPOTIFY_BROWSE_PAGE_SIZE)
             items = media.GetTracks()
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_TOP_ARTISTS:
             _logsi.LogVerbose("Getting Spotify user Top Artists")
-            media:ArtistPage = client.GetUsersTopArtists(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:ArtistPage = client.GetUsersTopArtists(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_USER_TOP_TRACKS:
             _logsi.LogVerbose("Getting Spotify user Top Tracks")
-            media:TrackPage = client.GetUsersTopTracks(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            media:TrackPage = client.GetUsersTopTracks(limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_FEATURED_PLAYLISTS:
             _logsi.LogVerbose("Getting Spotify Featured Playlists")
             media:PlaylistPageSimplified
-            media, message = client.GetFeaturedPlaylists(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            getFeatured = partial(client.GetFeaturedPlaylists, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
+            if (offset == 0) and (catalogStore is not None):
+                # the first page is kept in the persistent catalog store.
+                media, message = catalogStore.GetOrCreate(
+                    _GetCatalogKey(client, "GetFeaturedPlaylists"),
+                    CATALOG_TTL_FEATURED_PLAYLISTS,
+                    getFeatured,
+                    lambda result: {"page": result[0].ToDictionary(), "message": result[1]},
+                    lambda value: (PlaylistPageSimplified(root=value["page"]), value["message"]),
+                )
+            else:
+                media, message = getFeatured()
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == BrowsableMedia.SPOTIFY_CATEGORYS:
             _logsi.LogVerbose("Getting Spotify Categories")
-            media:list[Category] = client.GetBrowseCategorysList(refresh=False)
+            media:list[Category] = _GetBrowseCategorysList(client, catalogStore)
             items = media
-            
-            # add a "Uri" attribute to each category in the cached category list.
-            # this is so we can process categories just like other index types, as
-            # spotify categories are simply playlists of tracks.
-            category:Category
-            for category in client.ConfigurationCache["GetBrowseCategorysList"]:
-                if hasattr(category, "Uri"):
-                    _logsi.LogVerbose("Category Uri's have already been set in the cache; don't need to do it again")
-                    break
-                setattr(category, "Uri", f"spotify:category:{category.Id}")
-                _logsi.LogVerbose("Category Uri set: Name='%s', Id='%s', Uri='%s'" % (category.Name, category.Id, category.Uri))
-            
+
         elif media_content_type == BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS:
             _logsi.LogVerbose("Getting Spotify Category Playlist")
             
-            # was a base64 encoded category object supplied?  if not, then it's a problem! 
-            if not media_content_id.startswith(CATEGORY_BASE64):
-                raise ValueError("'%s': media content type '%s' is not a serialized Category object!" % (playerName, media_content_type))
-
-            # drop the eye-ctacher and deserialize the category object.
-            category:Category = Category()
-            media_content_id = media_content_id[len(CATEGORY_BASE64):]
-            category = deserialize_object(media_content_id)
-            _logsi.LogObject(SILevel.Verbose, "'%s': deserialized %s" % (playerName, category.ToString()), category, excludeNonPublic=True)
-            media_content_id = category.Id
-
-            # get the playlists for the category id.
+            # resolve the category id from the content id; a serialized category object is
+            # only supplied by content ids that were created by previous versions.
+            category:Category = None
+            if media_content_id.startswith(CATEGORY_URI_PREFIX):
+                categoryId:str = media_content_id[len(CATEGORY_URI_PREFIX):]
+            elif media_content_id.startswith(CATEGORY_BASE64):
+                category = deserialize_object(media_content_id[len(CATEGORY_BASE64):])
+                _logsi.LogObject(SILevel.Verbose, "'%s': deserialized %s" % (playerName, category.ToString()), category, excludeNonPublic=True)
+                categoryId:str = category.Id
+            else:
+                raise ValueError("'%s': media content type '%s' content id '%s' is not a category id!" % (playerName, media_content_type, media_content_id))
+
+            # get the playlists for the category id; for the first page, resolve the category
+            # name and image from the category registry concurrently.
+            getPlaylists = partial(client.GetCategoryPlaylists, categoryId, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             media:PlaylistPageSimplified
-            media, message = client.GetCategoryPlaylists(media_content_id, limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            if (offset == 0):
+                registry:dict[str, Category]
+                registry, (media, message) = RunConcurrently(partial(_GetCategoryRegistry, client, catalogStore), getPlaylists)
+                category = registry.get(categoryId, category)
+                if (category is not None):
+                    title = category.Name
+                    image = category.ImageUrl
+            else:
+                media, message = getPlaylists()
             items = media.Items
-            title = category.Name
-            image = category.ImageUrl
+            nextPageToken = _GetNextPageOffset(media, offset)
                             
         elif media_content_type == BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS_MADEFORYOU:
             _logsi.LogVerbose("Getting Spotify 'Made For You' Category Playlist")
-            media_content_id = '0JQ5DAt0tbjZptfcdMSKl3'   # special hidden category "Made For You"
-            media, message = client.GetCategoryPlaylists(media_content_id, limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            categoryId:str = '0JQ5DAt0tbjZptfcdMSKl3'   # special hidden category "Made For You"
+            media, message = client.GetCategoryPlaylists(categoryId, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
 
         elif media_content_type == BrowsableMedia.SPOTIFY_NEW_RELEASES:
             _logsi.LogVerbose("Getting Spotify Album New Releases")
-            media:AlbumPageSimplified = client.GetAlbumNewReleases(limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            getNewReleases = partial(client.GetAlbumNewReleases, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
+            if (offset == 0) and (catalogStore is not None):
+                # the first page is kept in the persistent catalog store.
+                media:AlbumPageSimplified = catalogStore.GetOrCreate(
+                    _GetCatalogKey(client, "GetAlbumNewReleases"),
+                    CATALOG_TTL_NEW_RELEASES,
+                    getNewReleases,
+                    lambda result: result.ToDictionary(),
+                    lambda value: AlbumPageSimplified(root=value),
+                )
+            else:
+                media:AlbumPageSimplified = getNewReleases()
             items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
 
         elif media_content_type == MediaType.ALBUM:
             _logsi.LogVerbose("Getting Spotify Album Tracks")
             spotifyId:str = SpotifyClient.GetIdFromUri(media_content_id)
-            media:Album = client.GetAlbum(spotifyId)
-            items = media.Tracks.Items
-            title = media.Name
-            image = media.ImageUrl
+            if (offset == 0):
+                album:Album = client.GetAlbum(spotifyId)
+                media:TrackPageSimplified = album.Tracks
+                title = album.Name
+                image = album.ImageUrl
+            else:
+                media:TrackPageSimplified = client.GetAlbumTracks(spotifyId, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset)
+            items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
             
         elif media_content_type == MediaType.ARTIST:
             _logsi.LogVerbose("Getting Spotify Artist Albums")
             spotifyId:str = SpotifyClient.GetIdFromUri(media_content_id)
-            artist:Artist = client.GetArtist(spotifyId)      # for cover image
-            media:AlbumPageSimplified = client.GetArtistAlbums(spotifyId, include_groups='album', limitTotal=SPOTIFY_BROWSE_LIMIT_TOTAL)
+            getAlbums = partial(client.GetArtistAlbums, spotifyId, include_groups='album', limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset, sortResult=False)
+            if (offset == 0):
+                # get the artist (for cover image) and albums concurrently.
+                artist:Artist
+                artist, media = RunConcurrently(partial(client.GetArtist, spotifyId), getAlbums)
+                title = artist.Name
+                image = artist.ImageUrl
+            else:
+                media:AlbumPageSimplified = getAlbums()
             items = media.Items
-            title = artist.Name
-            image = artist.ImageUrl
+            nextPageToken = _GetNextPageOffset(media, offset)
                             
-        elif media_content_type == MediaType.GENRE:
-            _logsi.LogVerbose("Getting Spotify Genre Playlist")
-            spotifyId:str = SpotifyClient.GetIdFromUri(media_content_id)
-            media:Playlist = client.GetPlaylist(spotifyId)
-            items = media.GetTracks()
-            title = media.Name
-            image = media.ImageUrl
-
-        elif media_content_type == MediaType.PLAYLIST:
+        elif media_content_type in [MediaType.GENRE, MediaType.PLAYLIST]:
             _logsi.LogVerbose("Getting Spotify Playlist")
             spotifyId:str = SpotifyClient.GetIdFromUri(media_content_id)
-            media:Playlist = client.GetPlaylist(spotifyId)
+
+            # get the playlist details (without items) for the first page only, and a single
+            # page of playlist items; the playlist is never loaded in its entirety.
+            getItems = partial(client.GetPlaylistItems, spotifyId, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset)
+            if (offset == 0):
+                # get the playlist details and items concurrently.
+                playlist:Playlist
+                playlist, media = RunConcurrently(partial(client.GetPlaylist, spotifyId, excludeItems=True), getItems)
+                title = playlist.Name
+                image = playlist.ImageUrl
+            else:
+                media:PlaylistPage = getItems()
             items = media.GetTracks()
-            title = media.Name
-            image = media.ImageUrl
+            nextPageToken = _GetNextPageOffset(media, offset)
 
         elif media_content_type == MediaType.PODCAST:
             _logsi.LogVerbose("Getting Spotify Show / Podcast")
             spotifyId:str = SpotifyClient.GetIdFromUri(media_content_id)
-            media:Show = client.GetShow(spotifyId)
-            items = media.Episodes.Items
-            title = media.Name
-            image = media.ImageUrl
+            if (offset == 0):
+                show:Show = client.GetShow(spotifyId)
+                media:EpisodePageSimplified = show.Episodes
+                title = show.Name
+                image = show.ImageUrl
+            else:
+                media:EpisodePageSimplified = client.GetShowEpisodes(spotifyId, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset)
+            items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
                         
         elif media_content_type == MediaType.APP:  # spotify audiobook support
             _logsi.LogVerbose("Getting Spotify Audiobook")
             spotifyId:str = SpotifyClient.GetIdFromUri(media_content_id)
-            media:Audiobook = client.GetAudiobook(spotifyId)
-            items = media.Chapters.Items
-            title = media.Name
-            image = media.ImageUrl
+            if (offset == 0):
+                audiobook:Audiobook = client.GetAudiobook(spotifyId)
+                media:ChapterPageSimplified = audiobook.Chapters
+                title = audiobook.Name
+                image = audiobook.ImageUrl
+            else:
+                media:ChapterPageSimplified = client.GetAudiobookChapters(spotifyId, limit=SPOTIFY_BROWSE_PAGE_SIZE, offset=offset)
+            items = media.Items
+            nextPageToken = _GetNextPageOffset(media, offset)
                         
         # when searching Spotify, display user favorites initially.
         # we have to display something in the media browser before search is allowed.
@@ -694,8 +907,9 @@ def browse_media_node(
         if media is None:
             raise ValueError("'%s': could not find media items for content type '%s'" % (playerName, media_content_type))
 
-        # set index flag indicating if index media can be played or not.
-        canPlay:bool = media_content_type in PLAYABLE_MEDIA_TYPES
+        # set index flag indicating if index media can be played or not; continuation
+        # pages cannot be played, as their content id is not a Spotify uri.
+        canPlay:bool = (media_content_type in PLAYABLE_MEDIA_TYPES) and (pageToken is None)
         
         # track and episode media items cannot be expanded (only played);
         # other media types can be expanded to display child items (e.g. Album, Artist, Playlist, etc).
@@ -716,6 +930,8 @@ def browse_media_node(
         _logsi.LogDictionary(SILevel.Verbose, "'%s': BrowseMedia attributes for parent media content type: '%s'" % (playerName, media_content_type), parentAttrs)
         
         # get parent attributes that are not set.
+        if (title is None) and (offset > 0):
+            title = "%s (%d - %d)" % (parentAttrs.get("title_node", "Items"), offset + 1, offset + len(items))
         if title is None:
             title = parentAttrs.get("title_node", media_content_id)
 
@@ -730,7 +946,7 @@ def browse_media_node(
             children=[],
             children_media_class=parentAttrs["children"],
             media_class=parentAttrs["parent"],
-            media_content_id=media_content_id,
+            media_content_id=pageContentId,
             media_content_type=media_content_type,
             thumbnail=image,
             title=title,
@@ -769,10 +985,10 @@ def browse_media_node(
                 
             elif mediaType == MediaType.GENRE:
                 
-                # if it's GENRE content, then serialize the Category object and use it instead so that
-                # we don't have to go get it again - we will deserialize it when the child node is
-                # selected, and use it to resolve the category Id, Name, and imageUrl values;
-                mediaId = "%s%s" % (CATEGORY_BASE64, serialize_object(item))
+                # if it's GENRE content, then use the category id - it is resolved against the
+                # category registry when the child node is selected, to get the category Name
+                # and imageUrl values.
+                mediaId = "%s%s" % (CATEGORY_URI_PREFIX, item.Id)
                 mediaType = BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS.value
 
             # build the child node.
@@ -798,6 +1014,22 @@ def browse_media_node(
             browseMedia.children.append(browseMediaChild)
             _logsi.LogObject(SILevel.Verbose, "'%s': BrowseMedia Child Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMediaChild.media_content_type, browseMediaChild.media_content_id, browseMediaChild.title), browseMediaChild)
 
+        # are there more items?  if so, then add a child node that displays the next page.
+        if (nextPageToken is not None):
+            browseMediaChild:BrowseMedia = BrowseMedia(
+                can_expand=True,
+                can_play=False,
+                can_search=False,
+                children=None,
+                children_media_class=parentAttrs["children"],
+                media_class=MediaClass.DIRECTORY,
+                media_content_id="%s%s%s" % (media_content_id, SPOTIFY_BROWSE_PAGE_TOKEN, nextPageToken),
+                media_content_type=media_content_type,
+                thumbnail=None,
+                title=BROWSE_MORE_TITLE,
+                )
+            browseMedia.children.append(browseMediaChild)
+
         # trace.
         _logsi.LogObject(SILevel.Verbose, "'%s': BrowseMedia Parent Object: Type='%s', Id='%s', Title='%s'" % (playerName, browseMedia.media_content_type, browseMedia.media_content_id, browseMedia.title), browseMedia)
 
@@ -0,0 +1,302 @@
+"""
+Stale-while-revalidate cache of media browser nodes for the SpotifyPlus component.
+
+A single browse cache instance is created for each Spotify user account (it is owned by
+the account's playstate coordinator), and stores the `BrowseMedia` trees that were built
+for media browser nodes, keyed by media player entity, media content type and media content
+id.  Nodes contain entity-specific values (e.g. the player name and source), so each media
+player entity of the account has its own entries.
+
+Each node type has its own time-to-live (the `cache_ttl` attribute of the library map).
+While an entry is fresh it is returned as-is.  Once it expires, it is still returned
+immediately for a further stale interval, and a background task rebuilds it so that the
+next visit sees current data.  Entries are removed as soon as a service call changes the
+data they were built from (e.g. saving a track favorite removes the track favorites node).
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import time
+from typing import Any, Awaitable, Callable
+
+from homeassistant.components.media_player import BrowseMedia
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER, SPOTIFY_BROWSE_PAGE_TOKEN
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+BrowseCacheKey = tuple[str, str, str]
+""" Browse cache key: (entity id, media content type, media content id). """
+
+
+class BrowseCacheEntry:
+    """
+    A single browse cache entry.
+    """
+
+    __slots__ = ("Value", "FreshMonotonic", "StaleMonotonic")
+
+    def __init__(self, value:BrowseMedia, freshMonotonic:float, staleMonotonic:float) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            value (BrowseMedia):
+                Cached media browser node.
+            freshMonotonic (float):
+                Monotonic clock time at which the entry becomes stale.
+            staleMonotonic (float):
+                Monotonic clock time at which the entry can no longer be returned.
+        """
+        self.Value:BrowseMedia = value
+        self.FreshMonotonic:float = freshMonotonic
+        self.StaleMonotonic:float = staleMonotonic
+
+
+class SpotifyPlusBrowseCache:
+    """
+    Stale-while-revalidate cache of media browser nodes, shared by all media player
+    entities of the same Spotify user account.
+
+    All methods must be called from the event loop.
+    """
+
+    def __init__(
+        self,
+        hass:HomeAssistant,
+        name:str,
+        maxEntries:int,
+        staleTtl:float,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            name (str):
+                Name of the cache, for trace and task naming purposes.
+            maxEntries (int):
+                Maximum number of entries to store; the least-recently-used entry is
+                evicted when the limit is exceeded.
+            staleTtl (float):
+                Time interval (in seconds) after an entry expires that it can still be
+                returned while it is rebuilt in the background.
+        """
+        self._hass:HomeAssistant = hass
+        self._name:str = name
+        self._maxEntries:int = max(1, maxEntries)
+        self._staleTtl:float = staleTtl
+        self._entries:OrderedDict[BrowseCacheKey, BrowseCacheEntry] = OrderedDict()
+        self._builds:dict[BrowseCacheKey, asyncio.Task] = {}
+        self._generation:int = 0
+        self._evictions:int = 0
+        self._hits:int = 0
+        self._hitsStale:int = 0
+        self._invalidations:int = 0
+        self._misses:int = 0
+        self._revalidations:int = 0
+        self._revalidationErrors:int = 0
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    @property
+    def Name(self) -> str:
+        """
+        Name of the cache.
+        """
+        return self._name
+
+
+    async def async_GetOrBuild(
+        self,
+        entityId:str,
+        mediaContentType:str,
+        mediaContentId:str,
+        ttl:float,
+        async_BuildFunc:Callable[[], Awaitable[BrowseMedia]],
+        ) -> BrowseMedia:
+        """
+        Returns the cached media browser node for the specified entity, content type and id,
+        building (and caching) it if it is not cached.
+
+        Args:
+            entityId (str):
+                Entity id of the media player that the node is built for.
+            mediaContentType (str):
+                Media content type of the node.
+            mediaContentId (str):
+                Media content id of the node.
+            ttl (float):
+                Time interval (in seconds) that the built node remains fresh; zero to
+                bypass the cache for this node type.
+            async_BuildFunc (Callable):
+                Coroutine function (taking no arguments) that builds the node.
+
+        A stale entry is returned immediately, and is rebuilt by a background task.
+        Concurrent requests for the same node share a single build.
+        """
+        if (ttl is None) or (ttl <= 0):
+            return await async_BuildFunc()
+
+        key:BrowseCacheKey = (str(entityId), str(mediaContentType), str(mediaContentId))
+        nowMonotonic:float = time.monotonic()
+        entry:BrowseCacheEntry = self._entries.get(key, None)
+        if (entry is not None) and (entry.StaleMonotonic <= nowMonotonic):
+            del self._entries[key]
+            entry = None
+
+        # is a fresh or stale entry cached?  if so, then return it (rebuilding a stale one).
+        if (entry is not None):
+            self._entries.move_to_end(key)
+            if (entry.FreshMonotonic > nowMonotonic):
+                self._hits += 1
+            else:
+                self._hitsStale += 1
+                if (key not in self._builds):
+                    _logsi.LogVerbose("'%s': Browse cache entry is stale; revalidating in the background: %s" % (self._name, str(key)))
+                    self._revalidations += 1
+                    self._StartBuild(key, ttl, async_BuildFunc, True)
+            return entry.Value
+
+        # otherwise, build it (or wait for a build that is already in progress).
+        self._misses += 1
+        task:asyncio.Task = self._builds.get(key, None)
+        if (task is None):
+            task = self._StartBuild(key, ttl, async_BuildFunc, False)
+        return await asyncio.shield(task)
+
+
+    def _StartBuild(
+        self,
+        key:BrowseCacheKey,
+        ttl:float,
+        async_BuildFunc:Callable[[], Awaitable[BrowseMedia]],
+        isRevalidation:bool,
+        ) -> asyncio.Task:
+        """
+        Starts a task that builds a node, and caches the result.
+
+        Args:
+            key (BrowseCacheKey):
+                Cache key of the node.
+            ttl (float):
+                Time interval (in seconds) that the built node remains fresh.
+            async_BuildFunc (Callable):
+                Coroutine function (taking no arguments) that builds the node.
+            isRevalidation (bool):
+                True if a stale entry is being rebuilt in the background; otherwise, False.
+        """
+        generation:int = self._generation
+
+        async def _async_Build() -> BrowseMedia:
+            try:
+                value:BrowseMedia = await async_BuildFunc()
+
+                # don't cache the result if the node was invalidated while it was being built,
+                # as it may have been built from data that has since changed.
+                if (generation == self._generation):
+                    self.Set(key, value, ttl)
+                return value
+
+            except Exception as ex:
+                if (isRevalidation):
+                    self._revalidationErrors += 1
+                    _logsi.LogVerbose("'%s': Browse cache entry could not be revalidated: %s - %s" % (self._name, str(key), str(ex)))
+                raise
+
+            finally:
+                if (self._builds.get(key, None) is asyncio.current_task()):
+                    self._builds.pop(key, None)
+
+        task:asyncio.Task = self._hass.async_create_background_task(_async_Build(), "%s_browse_build" % self._name)
+        self._builds[key] = task
+
+        # retrieve the build exception, in case nothing awaits the task (e.g. a background
+        # revalidation, or a build whose callers were cancelled).
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+
+    def Set(self, key:BrowseCacheKey, value:BrowseMedia, ttl:float) -> None:
+        """
+        Adds or replaces the cache entry for the specified key.
+
+        Args:
+            key (BrowseCacheKey):
+                Cache key of the node.
+            value (BrowseMedia):
+                Media browser node to cache.
+            ttl (float):
+                Time interval (in seconds) that the node remains fresh.
+        """
+        nowMonotonic:float = time.monotonic()
+        self._entries[key] = BrowseCacheEntry(value, nowMonotonic + ttl, nowMonotonic + ttl + self._staleTtl)
+        self._entries.move_to_end(key)
+        while (len(self._entries) > self._maxEntries):
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+    def Invalidate(self, mediaContentType:str, mediaContentId:str=None) -> None:
+        """
+        Removes cache entries of the specified media content type, for all media player
+        entities.
+
+        Args:
+            mediaContentType (str):
+                Media content type of the entries to remove.
+            mediaContentId (str):
+                Media content id of the entry to remove (including its continuation pages);
+                if None, then all entries of the media content type are removed.
+
+        Builds that are in progress for the removed entries will not be cached.
+        """
+        mediaContentType = str(mediaContentType)
+        pagePrefix:str = "%s%s" % (mediaContentId, SPOTIFY_BROWSE_PAGE_TOKEN)
+        keys:list[BrowseCacheKey] = [key for key in self._entries if (key[1] == mediaContentType) and ((mediaContentId is None) or (key[2] == mediaContentId) or (key[2].startswith(pagePrefix)))]
+        for key in keys:
+            del self._entries[key]
+        self._generation += 1
+        self._invalidations += len(keys)
+        if (len(keys) > 0):
+            _logsi.LogVerbose("'%s': Browse cache removed %d '%s' entries (id='%s')" % (self._name, len(keys), mediaContentType, mediaContentId))
+
+
+    def Clear(self) -> None:
+        """
+        Removes all entries from the cache, and cancels builds that are in progress.
+        Statistics are not reset.
+        """
+        self._entries.clear()
+        self._generation += 1
+        for task in list(self._builds.values()):
+            task.cancel()
+        self._builds.clear()
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of cache statistics, suitable for diagnostics output.
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._maxEntries,
+            "hits": self._hits,
+            "hits_stale": self._hitsStale,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+            "revalidations": self._revalidations,
+            "revalidation_errors": self._revalidationErrors,
+        }
@@ -0,0 +1,248 @@
+"""
+Persistent store of slow-changing Spotify catalog data for the SpotifyPlus component.
+
+A single catalog store instance is shared by all Spotify user accounts, and is saved to
+the HomeAssistant `.storage` folder (alongside the `spotifyplus_tokens.json` file).  It
+stores catalog data that rarely changes (e.g. the browse categories list, album new
+releases, and featured playlists), so that the first media browse after a HomeAssistant
+restart does not have to request it from the Spotify Web API again.
+
+Entries are keyed by Spotify user id, market, locale and data name, and expire after a
+data-specific time-to-live.  The store is loaded when it is first used, and changes are
+written back in batches (at most once per save delay interval).
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CATALOG_STORE_KEY,
+    CATALOG_STORE_SAVE_DELAY,
+    CATALOG_STORE_VERSION,
+    DATA_CATALOG_STORE,
+    LOGGER,
+)
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+
+class SpotifyPlusCatalogStore:
+    """
+    Persistent store of slow-changing Spotify catalog data, shared by all Spotify user accounts.
+
+    The `async_Load` method must be called from the event loop; all other methods can be
+    called from any thread (e.g. an executor worker thread that is building a media
+    browser node).
+    """
+
+    def __init__(self, hass:HomeAssistant) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+        """
+        self._hass:HomeAssistant = hass
+        self._store:Store = Store(hass, CATALOG_STORE_VERSION, CATALOG_STORE_KEY)
+        self._lock:threading.Lock = threading.Lock()
+        self._entries:dict[str, dict[str, Any]] = {}
+        self._loadTask:asyncio.Task = None
+        self._isLoaded:bool = False
+        self._hits:int = 0
+        self._misses:int = 0
+        self._saves:int = 0
+
+
+    @property
+    def IsLoaded(self) -> bool:
+        """
+        True if the stored entries have been loaded; otherwise, False.
+        """
+        return self._isLoaded
+
+
+    @staticmethod
+    def GetKey(userId:str, market:str|None, locale:str|None, name:str) -> str:
+        """
+        Returns the catalog store key of a data item.
+
+        Args:
+            userId (str):
+                Spotify user id of the account that requested the data.
+            market (str):
+                Market (ISO 3166-1 alpha-2 country code) of the data, or None if not known.
+            locale (str):
+                Locale of the data, or None for the Spotify default locale.
+            name (str):
+                Name of the data item (e.g. "GetBrowseCategorysList").
+        """
+        return "%s:%s:%s:%s" % (userId, market or "", locale or "", name)
+
+
+    async def async_Load(self) -> None:
+        """
+        Loads the stored entries, if they have not been loaded already.
+
+        Concurrent callers share a single load.  Entries that were set before the load
+        completed are not replaced by stored entries.
+        """
+        if (self._isLoaded):
+            return
+
+        if (self._loadTask is None):
+            self._loadTask = self._hass.async_create_task(self._async_LoadStore(), "%s_load" % CATALOG_STORE_KEY)
+        await asyncio.shield(self._loadTask)
+
+
+    async def _async_LoadStore(self) -> None:
+        """
+        Loads the stored entries from the `.storage` folder.
+        """
+        data:dict = None
+        try:
+            data = await self._store.async_load()
+        except Exception as ex:
+            # a damaged store is not fatal; the data will be requested from Spotify again.
+            _logsi.LogWarning("Spotify catalog store could not be loaded; it will be rebuilt: %s" % str(ex))
+
+        entries:dict = (data or {}).get("entries", {})
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries.setdefault(key, entry)
+            self._isLoaded = True
+        _logsi.LogVerbose("Spotify catalog store loaded %d entries" % len(entries))
+
+
+    def Get(self, key:str) -> Any:
+        """
+        Returns the value of a stored entry, or None if it is not stored or has expired.
+
+        Args:
+            key (str):
+                Catalog store key (see `GetKey`).
+        """
+        with self._lock:
+            entry:dict = self._entries.get(key, None)
+            if (entry is None) or (entry.get("expires", 0) <= time.time()):
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry.get("value", None)
+
+
+    def Set(self, key:str, value:Any, ttl:float) -> None:
+        """
+        Adds or replaces a stored entry, and schedules a (batched) write of the store.
+
+        Args:
+            key (str):
+                Catalog store key (see `GetKey`).
+            value (Any):
+                JSON-serializable value to store.
+            ttl (float):
+                Time interval (in seconds) that the entry remains valid.
+        """
+        with self._lock:
+            self._entries[key] = {"expires": time.time() + ttl, "value": value}
+        self._hass.loop.call_soon_threadsafe(self._ScheduleSave)
+
+
+    def GetOrCreate(
+        self,
+        key:str,
+        ttl:float,
+        createFunc:Callable[[], Any],
+        toStore:Callable[[Any], Any],
+        fromStore:Callable[[Any], Any],
+        ) -> Any:
+        """
+        Returns a stored value, or creates (and stores) it if it is not stored or has expired.
+
+        Args:
+            key (str):
+                Catalog store key (see `GetKey`).
+            ttl (float):
+                Time interval (in seconds) that a created entry remains valid.
+            createFunc (Callable):
+                Function (taking no arguments) that requests the value from Spotify.
+            toStore (Callable):
+                Function that converts a created value to a JSON-serializable value.
+            fromStore (Callable):
+                Function that converts a stored value back to the created value type.
+
+        This method makes blocking calls, and must not be called from the event loop.
+        """
+        value:Any = self.Get(key)
+        if (value is not None):
+            try:
+                return fromStore(value)
+            except Exception as ex:
+                _logsi.LogVerbose("Spotify catalog store entry '%s' could not be converted; it will be recreated: %s" % (key, str(ex)))
+
+        result:Any = createFunc()
+        self.Set(key, toStore(result), ttl)
+        return result
+
+
+    @callback
+    def _ScheduleSave(self) -> None:
+        """
+        Schedules a write of the store; changes made before the write are batched together.
+        """
+        self._store.async_delay_save(self._GetStoreData, CATALOG_STORE_SAVE_DELAY)
+
+
+    @callback
+    def _GetStoreData(self) -> dict[str, Any]:
+        """
+        Returns the data to write to the store; expired entries are removed, and not written.
+        """
+        nowTime:float = time.time()
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if (entry.get("expires", 0) <= nowTime)]:
+                del self._entries[key]
+            self._saves += 1
+            return {"entries": dict(self._entries)}
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of store statistics, suitable for diagnostics output.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "loaded": self._isLoaded,
+                "hits": self._hits,
+                "misses": self._misses,
+                "saves": self._saves,
+            }
+
+
+@callback
+def async_get_catalog_store(hass:HomeAssistant) -> SpotifyPlusCatalogStore:
+    """
+    Returns the catalog store that is shared by all Spotify user accounts, creating it if
+    it does not exist.  The stored entries are not loaded until `async_Load` is called.
+
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+    """
+    catalogStore:SpotifyPlusCatalogStore = hass.data.get(DATA_CATALOG_STORE, None)
+    if (catalogStore is None):
+        catalogStore = SpotifyPlusCatalogStore(hass)
+        hass.data[DATA_CATALOG_STORE] = catalogStore
+    return catalogStore
@@ -0,0 +1,410 @@
+"""
+Account-wide Spotify Web API circuit breaker for the SpotifyPlus component.
+
+A single circuit breaker instance is created for each Spotify user account (it is owned by
+the account's playstate coordinator), and is shared by playstate polling and services.
+When the Spotify Web API is unreachable or keeps returning server errors (5xx) or rate
+limit errors (429), the breaker opens after a number of consecutive failures, and requests are rejected without contacting
+Spotify for an exponentially increasing (jittered) backoff interval.  When the interval
+expires, a single half-open probe request is allowed through; if it succeeds the breaker
+closes, otherwise it opens again with a longer interval.
+"""
+from __future__ import annotations
+
+from enum import StrEnum
+import random
+import threading
+import time
+from typing import Any, Callable
+
+from spotifywebapipython import SpotifyApiError, SpotifyClient, SpotifyWebApiError
+from spotifywebapipython.saappmessages import SAAppMessages
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError, TimeoutError as Urllib3TimeoutError
+
+from .const import (
+    LOGGER,
+    SPOTIFY_BREAKER_BACKOFF_INITIAL,
+    SPOTIFY_BREAKER_BACKOFF_JITTER,
+    SPOTIFY_BREAKER_BACKOFF_MAX,
+    SPOTIFY_BREAKER_FAILURE_THRESHOLD,
+)
+from .utils import restoreInstanceAttribute
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIColors
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+# exceptions that indicate the Spotify Web API could not be reached.
+_CONNECTION_EXCEPTION_TYPES:tuple = (ConnectionError, TimeoutError, MaxRetryError, NewConnectionError, ProtocolError, Urllib3TimeoutError)
+
+# leading text of the SpotifyClient message that is raised when gateway (504) retries are exhausted.
+_RETRY_TIMEOUT_MESSAGE_PREFIX:str = SAAppMessages.MSG_SPOTIFY_WEB_API_RETRY_TIMEOUT.split("%")[0]
+
+
+class CircuitBreakerState(StrEnum):
+    """
+    Circuit breaker states.
+    """
+
+    CLOSED = "closed"
+    """ Requests are allowed. """
+
+    OPEN = "open"
+    """ Requests are rejected until the backoff interval expires. """
+
+    HALF_OPEN = "half_open"
+    """ A single probe request is allowed, to determine if the breaker can close. """
+
+
+class SpotifyPlusCircuitBreaker:
+    """
+    Circuit breaker that is shared by all SpotifyClient instances of the same Spotify
+    user account.
+    """
+
+    def __init__(self, name:str, onStateChanged:Callable[[CircuitBreakerState], None]=None) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            name (str):
+                Name of the circuit breaker, for trace purposes.
+            onStateChanged (Callable):
+                Function called (from the thread that caused the transition) when the breaker
+                state changes; the new state is passed as an argument.
+        """
+        self._name:str = name
+        self._onStateChanged:Callable[[CircuitBreakerState], None] = onStateChanged
+        self._lock:threading.Lock = threading.Lock()
+        self._state:CircuitBreakerState = CircuitBreakerState.CLOSED
+        self._consecutiveFailures:int = 0
+        self._openCount:int = 0
+        self._openedMonotonic:float = None
+        self._retryMonotonic:float = 0
+        self._lastFailureReason:str = None
+        self._transitionCount:int = 0
+        self._totalOpenSeconds:float = 0
+        self._rejectedCount:int = 0
+        self._previousMethods:dict[int, Any] = {}
+
+
+    @property
+    def IsAvailable(self) -> bool:
+        """
+        True if the breaker is closed; otherwise, False.
+        """
+        return (self._state == CircuitBreakerState.CLOSED)
+
+
+    @property
+    def LastFailureReason(self) -> str:
+        """
+        Reason of the most recent failure, or None if no failure was recorded.
+        """
+        return self._lastFailureReason
+
+
+    @property
+    def Name(self) -> str:
+        """
+        Name of the circuit breaker.
+        """
+        return self._name
+
+
+    @property
+    def SecondsUntilRetry(self) -> float:
+        """
+        Number of seconds until a half-open probe request is allowed; zero if the breaker
+        is not open.
+        """
+        if (self._state != CircuitBreakerState.OPEN):
+            return 0
+        return max(0, self._retryMonotonic - time.monotonic())
+
+
+    @property
+    def State(self) -> CircuitBreakerState:
+        """
+        Current circuit breaker state.
+        """
+        return self._state
+
+
+    @property
+    def TotalOpenSeconds(self) -> float:
+        """
+        Total number of seconds the breaker has spent open (or half-open).
+        """
+        with self._lock:
+            result:float = self._totalOpenSeconds
+            if (self._openedMonotonic is not None):
+                result = result + (time.monotonic() - self._openedMonotonic)
+            return result
+
+
+    @property
+    def TransitionCount(self) -> int:
+        """
+        Number of breaker state transitions.
+        """
+        return self._transitionCount
+
+
+    @property
+    def UnavailableReason(self) -> str | None:
+        """
+        Description of why Spotify Web API requests are being rejected, or None if the
+        breaker is closed.
+        """
+        if (self._state == CircuitBreakerState.CLOSED):
+            return None
+        return "Spotify Web API is unavailable after %d consecutive failures (last failure: %s); retrying in %d seconds" % (self._consecutiveFailures, self._lastFailureReason, self.SecondsUntilRetry)
+
+
+    def _SetState(self, state:CircuitBreakerState) -> None:
+        """
+        Sets the breaker state, and records the transition.
+
+        Args:
+            state (CircuitBreakerState):
+                New breaker state.
+
+        The lock must be held by the caller; the state changed callback is not called.
+        """
+        nowMonotonic:float = time.monotonic()
+        if (state == CircuitBreakerState.CLOSED) and (self._openedMonotonic is not None):
+            self._totalOpenSeconds = self._totalOpenSeconds + (nowMonotonic - self._openedMonotonic)
+            self._openedMonotonic = None
+        elif (state == CircuitBreakerState.OPEN) and (self._openedMonotonic is None):
+            self._openedMonotonic = nowMonotonic
+        self._state = state
+        self._transitionCount += 1
+
+
+    def _NotifyStateChanged(self, state:CircuitBreakerState) -> None:
+        """
+        Calls the state changed callback, if one was specified.
+
+        Args:
+            state (CircuitBreakerState):
+                New breaker state.
+        """
+        _logsi.WatchInt(SILevel.Debug, "HASpotifyCircuitBreakerTransitions", self._transitionCount)
+        if (self._onStateChanged is not None):
+            try:
+                self._onStateChanged(state)
+            except Exception as ex:
+                _logsi.LogException("'%s': Circuit breaker state changed callback exception: %s" % (self._name, str(ex)), ex, logToSystemLogger=False)
+
+
+    def AllowRequest(self) -> bool:
+        """
+        Determines if a request may be sent to the Spotify Web API.
+
+        Returns:
+            True if the breaker is closed, or if this request is the half-open probe;
+            otherwise, False.
+
+        If True is returned, the caller must report the request outcome by calling either
+        `RecordSuccess` or `RecordFailure`; or `ReleaseRequest` if the request was not sent
+        (e.g. it was cancelled), or its outcome does not indicate if Spotify is available.
+        """
+        with self._lock:
+
+            if (self._state == CircuitBreakerState.CLOSED):
+                return True
+
+            # has the backoff interval expired?  if so, then allow a single probe request.
+            if (self._state == CircuitBreakerState.OPEN) and (time.monotonic() >= self._retryMonotonic):
+                self._SetState(CircuitBreakerState.HALF_OPEN)
+                _logsi.LogVerbose("'%s': Circuit breaker is half-open; allowing a probe request" % (self._name), colorValue=SIColors.Gold)
+                return True
+
+            self._rejectedCount += 1
+            return False
+
+
+    @staticmethod
+    def GetFailureReason(ex:Exception) -> str | None:
+        """
+        Returns the failure reason of an exception raised by a Spotify Web API request, or None
+        if the exception does not indicate that the Spotify Web API is failing.
+
+        Args:
+            ex (Exception):
+                Exception raised by the request.
+
+        Only connection errors, timeouts, server errors (5xx), and rate limit (429) or gateway
+        (504) retry exhaustion are failures; authorization errors (e.g. 401 access token missing,
+        403 premium required, token refresh failures) are not.
+        """
+        if isinstance(ex, SpotifyWebApiError):
+            if (ex.Status is not None) and (SpotifyPlusCircuitBreaker.IsFailureStatus(ex.Status)):
+                return "%s - %s" % (ex.Status, ex.Message)
+            return None
+
+        if isinstance(ex, SpotifyApiError):
+            if (ex.Message is not None) and (ex.Message.startswith(_RETRY_TIMEOUT_MESSAGE_PREFIX)):
+                return ex.Message
+            # SpotifyClient wraps unhandled request exceptions; check the wrapped exception.
+            innerEx:BaseException = ex.__cause__ or ex.__context__
+            if isinstance(innerEx, _CONNECTION_EXCEPTION_TYPES):
+                return str(innerEx) or type(innerEx).__name__
+            return None
+
+        if isinstance(ex, _CONNECTION_EXCEPTION_TYPES):
+            return str(ex) or type(ex).__name__
+        return None
+
+
+    @staticmethod
+    def IsFailureStatus(status:int) -> bool:
+        """
+        Returns True if a Spotify Web API response status indicates that the Spotify Web API
+        is failing (server error, or rate limit exceeded); otherwise, False.
+
+        Args:
+            status (int):
+                Response status code.
+        """
+        return (status >= 500) or (status == 429)
+
+
+    def RecordFailure(self, reason:str) -> None:
+        """
+        Records a failed request (e.g. unreachable, server error).
+
+        Args:
+            reason (str):
+                Reason of the failure.
+        """
+        with self._lock:
+
+            self._consecutiveFailures += 1
+            self._lastFailureReason = reason
+            isOpened:bool = False
+
+            # open (or re-open) the breaker if the threshold was reached, or the probe failed.
+            if (self._state == CircuitBreakerState.HALF_OPEN) or \
+               ((self._state == CircuitBreakerState.CLOSED) and (self._consecutiveFailures >= SPOTIFY_BREAKER_FAILURE_THRESHOLD)):
+                self._openCount += 1
+                backoffSecs:float = min(SPOTIFY_BREAKER_BACKOFF_MAX, SPOTIFY_BREAKER_BACKOFF_INITIAL * (2 ** (self._openCount - 1)))
+                backoffSecs = backoffSecs * random.uniform(1 - SPOTIFY_BREAKER_BACKOFF_JITTER, 1 + SPOTIFY_BREAKER_BACKOFF_JITTER)
+                self._retryMonotonic = time.monotonic() + backoffSecs
+                self._SetState(CircuitBreakerState.OPEN)
+                isOpened = True
+
+        if isOpened:
+            _logsi.LogWarning("'%s': %s" % (self._name, self.UnavailableReason), colorValue=SIColors.Red)
+            self._NotifyStateChanged(CircuitBreakerState.OPEN)
+
+
+    def ReleaseRequest(self) -> None:
+        """
+        Releases a request that was allowed, without recording an outcome; if the request
+        was the half-open probe, then another probe request is allowed.
+        """
+        with self._lock:
+
+            # return the probe slot; the backoff interval has already expired.
+            if (self._state == CircuitBreakerState.HALF_OPEN):
+                self._state = CircuitBreakerState.OPEN
+                self._retryMonotonic = time.monotonic()
+
+
+    def RecordSuccess(self) -> None:
+        """
+        Records a successful request; the breaker is closed if it was not already.
+        """
+        with self._lock:
+
+            self._consecutiveFailures = 0
+            if (self._state == CircuitBreakerState.CLOSED):
+                return
+            self._openCount = 0
+            self._SetState(CircuitBreakerState.CLOSED)
+
+        _logsi.LogMessage("'%s': Spotify Web API is available; circuit breaker closed" % (self._name), colorValue=SIColors.Gold)
+        self._NotifyStateChanged(CircuitBreakerState.CLOSED)
+
+
+    def Install(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Installs the circuit breaker on a SpotifyClient instance, so that every Spotify Web
+        API request made by the client is guarded by the breaker.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance to install the circuit breaker on.
+
+        The client `MakeRequest` method is overridden on the instance (not the class), so other
+        SpotifyClient instances are unaffected.  The breaker must be installed before the
+        rate limiter, so that requests which are delayed by the rate limiter are not counted
+        as failures.
+        """
+        clientMakeRequest = spotifyClient.MakeRequest
+
+        # save the instance method (if any) of a previously installed wrapper, for uninstall.
+        self._previousMethods[id(spotifyClient)] = spotifyClient.__dict__.get("MakeRequest", None)
+
+        def MakeRequest(method, msg):
+
+            # is the breaker open?  if so, then don't bother contacting Spotify.
+            if not self.AllowRequest():
+                raise SpotifyApiError(self.UnavailableReason, None, logsi=_logsi)
+
+            try:
+                result = clientMakeRequest(method, msg)
+            except SpotifyWebApiError as ex:
+                # Spotify responded; only some statuses indicate the Spotify Web API is failing.
+                failureReason:str = self.GetFailureReason(ex)
+                if (failureReason is not None):
+                    self.RecordFailure(failureReason)
+                else:
+                    self.RecordSuccess()
+                raise
+            except BaseException as ex:
+                # other errors (e.g. token refresh failures) don't indicate if Spotify is available.
+                failureReason:str = self.GetFailureReason(ex) if isinstance(ex, Exception) else None
+                if (failureReason is not None):
+                    self.RecordFailure(failureReason)
+                else:
+                    self.ReleaseRequest()
+                raise
+
+            self.RecordSuccess()
+            return result
+
+        spotifyClient.MakeRequest = MakeRequest
+
+
+    def Uninstall(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Removes the circuit breaker from a SpotifyClient instance that it was installed on.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance to remove the circuit breaker from.
+        The methods that were installed on the instance before this one are restored, so
+        stacked wrappers must be uninstalled in the reverse order that they were installed.
+        """
+        restoreInstanceAttribute(spotifyClient, "MakeRequest", self._previousMethods.pop(id(spotifyClient), None))
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of circuit breaker statistics, suitable for diagnostics output.
+        """
+        return {
+            "state": self._state.value,
+            "consecutive_failures": self._consecutiveFailures,
+            "last_failure_reason": self._lastFailureReason,
+            "transitions": self._transitionCount,
+            "rejected_requests": self._rejectedCount,
+            "seconds_until_retry": round(self.SecondsUntilRetry, 1),
+            "total_open_seconds": round(self.TotalOpenSeconds, 1),
+        }
@@ -0,0 +1,193 @@
+"""
+Latest-wins command coalescer for the SpotifyPlus component.
+
+Media player commands that carry an absolute value (e.g. volume level, seek position) are
+often issued in rapid bursts; for example, dragging a volume slider in a dashboard issues
+a command for every intermediate value.  The coalescer collapses commands of the same type
+that are issued within a short window into a single Spotify Web API request that carries
+the final value, and allows at most one request in flight per command type.
+
+Only the caller that issues the request waits for it (and receives its outcome).  Callers
+that are absorbed into another caller's request return immediately, so that a burst of
+commands does not park a worker thread of the account executor for every command.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+from .const import (
+    SPOTIFY_COMMAND_COALESCE_MAX_DELAY,
+    SPOTIFY_COMMAND_COALESCE_WINDOW,
+)
+
+# coalesced status and request future of the last command submitted by the current thread.
+_threadState:threading.local = threading.local()
+
+
+class _CoalescedCommand:
+    """
+    A pending command request, shared by all callers that were coalesced into it.
+    """
+
+    __slots__ = ("Func", "Args", "CreatedMonotonic", "DeadlineMonotonic", "Future")
+
+    def __init__(self, nowMonotonic:float) -> None:
+        self.Func:Callable[..., Any] = None
+        self.Args:tuple = ()
+        self.CreatedMonotonic:float = nowMonotonic
+        self.DeadlineMonotonic:float = nowMonotonic
+        self.Future:Future = Future()
+
+
+class SpotifyPlusCommandCoalescer:
+    """
+    Coalesces media player commands of the same type into a single request that carries
+    the latest value.
+    """
+
+    def __init__(self, name:str) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            name (str):
+                Name of the coalescer, for trace purposes.
+        """
+        self._name:str = name
+        self._condition:threading.Condition = threading.Condition()
+        self._pending:dict[Hashable, _CoalescedCommand] = {}
+        self._inFlight:set[Hashable] = set()
+        self._requestCount:int = 0
+        self._coalescedCount:int = 0
+
+
+    @property
+    def CoalescedCount(self) -> int:
+        """
+        Number of commands that were absorbed into another command's request.
+        """
+        return self._coalescedCount
+
+
+    @property
+    def RequestCount(self) -> int:
+        """
+        Number of requests that were issued.
+        """
+        return self._requestCount
+
+
+    @staticmethod
+    def WasCoalesced() -> bool:
+        """
+        Returns True if the last command submitted by the current thread was absorbed into
+        another command's request; otherwise, False.  The status is cleared by this call.
+        """
+        result:bool = getattr(_threadState, "coalesced", False)
+        _threadState.coalesced = False
+        return result
+
+
+    @staticmethod
+    def GetLastFuture() -> Future | None:
+        """
+        Returns the request future of the last command submitted by the current thread, or
+        None if no command was submitted.
+
+        The future is shared by all commands that were coalesced into the same request, and
+        resolves (to None, or to the request exception) once the request has completed.
+        """
+        return getattr(_threadState, "future", None)
+
+
+    def Submit(self, key:Hashable, func:Callable[..., Any], *args:Any) -> bool:
+        """
+        Submits a command; the first command of a burst issues the request that carries the
+        latest value, and the others are absorbed into it.
+
+        Args:
+            key (Hashable):
+                Command type key; commands with the same key are coalesced.
+            func (Callable):
+                Function that issues the request.
+            *args:
+                Positional arguments to pass to the function.
+
+        Returns:
+            True if this call issued the request; otherwise, False if the command was
+            absorbed into another command's request.
+
+        Raises:
+            Exception:
+                The exception raised by the request function, if this call issued the request.
+
+        If a newer command of the same type is submitted before the request is issued, then
+        the newer command's function and arguments replace this command's (latest wins).
+
+        The call that issues the request blocks until the coalescing window has closed and the
+        request has completed, so at most two calls per command type are blocked at any time
+        (one with a request in flight, and one waiting for the next window).  An absorbed call
+        returns immediately; the shared request future (see `GetLastFuture`) resolves once
+        the request that carries its value has completed.  This method must not be called
+        from the event loop.
+        """
+        nowMonotonic:float = time.monotonic()
+
+        with self._condition:
+
+            # join the pending command of the same type, or start a new one.
+            command:_CoalescedCommand = self._pending.get(key, None)
+            isOwner:bool = (command is None)
+            if isOwner:
+                command = _CoalescedCommand(nowMonotonic)
+                self._pending[key] = command
+            else:
+                self._coalescedCount += 1
+
+            # latest value wins; extend the window, but not beyond the maximum delay.
+            command.Func = func
+            command.Args = args
+            command.DeadlineMonotonic = min(nowMonotonic + SPOTIFY_COMMAND_COALESCE_WINDOW, command.CreatedMonotonic + SPOTIFY_COMMAND_COALESCE_MAX_DELAY)
+            self._condition.notify_all()
+
+            if isOwner:
+
+                # wait for the window to close, and for any in-flight request of the same type.
+                while True:
+                    waitSecs:float = command.DeadlineMonotonic - time.monotonic()
+                    if (key in self._inFlight):
+                        self._condition.wait()
+                    elif (waitSecs > 0):
+                        self._condition.wait(waitSecs)
+                    else:
+                        break
+
+                # take ownership of the request.
+                del self._pending[key]
+                self._inFlight.add(key)
+                self._requestCount += 1
+
+        _threadState.coalesced = not isOwner
+        _threadState.future = command.Future
+
+        # was the command absorbed into another command's request?  if so, then don't wait for
+        # the request; the caller that issues it waits for (and receives) its outcome.
+        if not isOwner:
+            return False
+
+        # issue the request with the latest value.
+        try:
+            command.Func(*command.Args)
+        except Exception as ex:
+            command.Future.set_exception(ex)
+            raise
+        else:
+            command.Future.set_result(None)
+        finally:
+            with self._condition:
+                self._inFlight.discard(key)
+                self._condition.notify_all()
+        return True
@@ -50,14 +50,23 @@ from .const import (
     CONF_OPTION_DEVICE_LOGINID,
     CONF_OPTION_DEVICE_PASSWORD,
     CONF_OPTION_DEVICE_USERNAME,
+    CONF_OPTION_EXECUTOR_MAX_WORKERS,
+    CONF_OPTION_EXECUTOR_QUEUE_LIMIT,
+    CONF_OPTION_METRICS_ENABLED,
     CONF_OPTION_SCRIPT_TURN_OFF,
     CONF_OPTION_SCRIPT_TURN_ON,
     CONF_OPTION_SOURCE_LIST_HIDE,
     CONF_OPTION_SPOTIFY_SCAN_INTERVAL,
+    CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE,
+    CONF_OPTION_TOKEN_REFRESH_MARGIN,
     CONF_OPTION_TURN_OFF_AUTO_PAUSE,
     CONF_OPTION_TURN_ON_AUTO_RESUME,
     CONF_OPTION_TURN_ON_AUTO_SOURCE_SELECT,
+    DEFAULT_OPTION_EXECUTOR_MAX_WORKERS,
+    DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT,
     DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL,
+    DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE,
+    DEFAULT_OPTION_TOKEN_REFRESH_MARGIN,
     DOMAIN, 
     DOMAIN_SCRIPT,
     SPOTIFY_SCOPES
@@ -605,10 +614,15 @@ class SpotifyPlusOptionsFlow(OptionsFlow):
                 # update config entry options from user input values.
                 self._Options[CONF_OPTION_ALWAYS_ON] = user_input.get(CONF_OPTION_ALWAYS_ON, None)
                 self._Options[CONF_OPTION_DEVICE_DEFAULT] = user_input.get(CONF_OPTION_DEVICE_DEFAULT, None)
+                self._Options[CONF_OPTION_EXECUTOR_MAX_WORKERS] = user_input.get(CONF_OPTION_EXECUTOR_MAX_WORKERS, None)
+                self._Options[CONF_OPTION_EXECUTOR_QUEUE_LIMIT] = user_input.get(CONF_OPTION_EXECUTOR_QUEUE_LIMIT, None)
+                self._Options[CONF_OPTION_METRICS_ENABLED] = user_input.get(CONF_OPTION_METRICS_ENABLED, False)
                 self._Options[CONF_OPTION_SPOTIFY_SCAN_INTERVAL] = user_input.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL, DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL)
+                self._Options[CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE] = user_input.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE, None)
                 self._Options[CONF_OPTION_SCRIPT_TURN_OFF] = user_input.get(CONF_OPTION_SCRIPT_TURN_OFF, None)
                 self._Options[CONF_OPTION_SCRIPT_TURN_ON] = user_input.get(CONF_OPTION_SCRIPT_TURN_ON, None)
                 self._Options[CONF_OPTION_SOURCE_LIST_HIDE] = user_input.get(CONF_OPTION_SOURCE_LIST_HIDE, None)
+                self._Options[CONF_OPTION_TOKEN_REFRESH_MARGIN] = user_input.get(CONF_OPTION_TOKEN_REFRESH_MARGIN, None)
                 self._Options[CONF_OPTION_TURN_OFF_AUTO_PAUSE] = user_input.get(CONF_OPTION_TURN_OFF_AUTO_PAUSE, True)
                 self._Options[CONF_OPTION_TURN_ON_AUTO_RESUME] = user_input.get(CONF_OPTION_TURN_ON_AUTO_RESUME, True)
                 self._Options[CONF_OPTION_TURN_ON_AUTO_SOURCE_SELECT] = user_input.get(CONF_OPTION_TURN_ON_AUTO_SOURCE_SELECT, True)
@@ -619,6 +633,31 @@ class SpotifyPlusOptionsFlow(OptionsFlow):
                 if (spotifyScanInterval is not None) and ((spotifyScanInterval < 4) or (spotifyScanInterval > 60)):
                     errors["base"] = "spotify_scan_interval_range_invalid"
 
+                # spotify idle scan interval profile must be a semi-colon delimited list of ascending
+                # whole numbers in the 4 to 3600 range, or zero to disable (if specified).
+                spotifyScanIntervalIdle:str = user_input.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE, None)
+                if (spotifyScanIntervalIdle is not None) and (spotifyScanIntervalIdle.strip() != "0"):
+                    items:list[str] = [item.strip() for item in spotifyScanIntervalIdle.split(';')]
+                    if (not all(item.isdigit() and (4 <= int(item) <= 3600) for item in items)) or \
+                       ([int(item) for item in items] != sorted(int(item) for item in items)):
+                        errors["base"] = "spotify_scan_interval_idle_invalid"
+
+                # token refresh margin must be in the 150 to 1800 range (if specified); tokens
+                # within 120 seconds of expiring are refreshed by the foreground request anyway.
+                tokenRefreshMargin:int = user_input.get(CONF_OPTION_TOKEN_REFRESH_MARGIN, None)
+                if (tokenRefreshMargin is not None) and ((tokenRefreshMargin < 150) or (tokenRefreshMargin > 1800)):
+                    errors["base"] = "token_refresh_margin_range_invalid"
+
+                # executor worker threads must be in the 1 to 16 range (if specified).
+                executorMaxWorkers:int = user_input.get(CONF_OPTION_EXECUTOR_MAX_WORKERS, None)
+                if (executorMaxWorkers is not None) and ((executorMaxWorkers < 1) or (executorMaxWorkers > 16)):
+                    errors["base"] = "executor_max_workers_range_invalid"
+
+                # executor queue limit must be in the 4 to 256 range (if specified).
+                executorQueueLimit:int = user_input.get(CONF_OPTION_EXECUTOR_QUEUE_LIMIT, None)
+                if (executorQueueLimit is not None) and ((executorQueueLimit < 4) or (executorQueueLimit > 256)):
+                    errors["base"] = "executor_queue_limit_range_invalid"
+
                 # any validation errors?
                 if "base" not in errors:
                     
@@ -672,6 +711,18 @@ class SpotifyPlusOptionsFlow(OptionsFlow):
                     vol.Optional(CONF_OPTION_SPOTIFY_SCAN_INTERVAL, 
                                  description={"suggested_value": self._Options.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL)},
                                  ): cv.positive_int,
+                    vol.Optional(CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE, 
+                                 description={"suggested_value": self._Options.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE, DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE)},
+                                 ): cv.string,
+                    vol.Optional(CONF_OPTION_TOKEN_REFRESH_MARGIN, 
+                                 description={"suggested_value": self._Options.get(CONF_OPTION_TOKEN_REFRESH_MARGIN, DEFAULT_OPTION_TOKEN_REFRESH_MARGIN)},
+                                 ): cv.positive_int,
+                    vol.Optional(CONF_OPTION_EXECUTOR_MAX_WORKERS, 
+                                 description={"suggested_value": self._Options.get(CONF_OPTION_EXECUTOR_MAX_WORKERS, DEFAULT_OPTION_EXECUTOR_MAX_WORKERS)},
+                                 ): cv.positive_int,
+                    vol.Optional(CONF_OPTION_EXECUTOR_QUEUE_LIMIT, 
+                                 description={"suggested_value": self._Options.get(CONF_OPTION_EXECUTOR_QUEUE_LIMIT, DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT)},
+                                 ): cv.positive_int,
                     vol.Optional(CONF_OPTION_ALWAYS_ON, 
                                  description={"suggested_value": self._Options.get(CONF_OPTION_ALWAYS_ON)},
                                  ): cv.boolean,
@@ -687,6 +738,10 @@ class SpotifyPlusOptionsFlow(OptionsFlow):
                                  description={"suggested_value": self._Options.get(CONF_OPTION_TURN_ON_AUTO_SOURCE_SELECT)},
                                  default=True,  # default to True if not supplied
                                  ): cv.boolean,
+                    vol.Optional(CONF_OPTION_METRICS_ENABLED, 
+                                 description={"suggested_value": self._Options.get(CONF_OPTION_METRICS_ENABLED)},
+                                 default=False,  # default to False if not supplied
+                                 ): cv.boolean,
                 }
             )
             
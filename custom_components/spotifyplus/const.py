@@ -19,6 +19,15 @@ DOMAIN_MEDIA_PLAYER = "media_player"
 SPOTIFY_BROWSE_LIMIT_TOTAL = 100
 """ Max number of items to return from a SpotifyPlus integration request that supports paging. """
 
+SPOTIFY_BROWSE_PAGE_SIZE = 50
+""" Number of child items to display on a single page of a media browser node. """
+
+SPOTIFY_BROWSE_PAGE_TOKEN:str = "::page="
+"""
+Separator between a media browser node content id and the page token (offset or cursor)
+of a continuation page; e.g. "spotify:playlist:37i9dQZF1DXcBWIGoYBM5M::page=50".
+"""
+
 SPOTIFY_SEARCH_LIMIT_TOTAL = 48
 """ Max number of items to return (for each type) from a Spotify search request (5). """
 
@@ -28,6 +37,167 @@ SPOTIFY_WEB_URL_PFX = "https://open.spotify.com"
 TOKEN_EXPIRE_REASON:str = "token_expire_reason"
 """ Token expiration reason code. """
 
+DATA_PLAYSTATE_COORDINATORS:str = "%s_playstate_coordinators" % DOMAIN
+"""
+HA data key that stores the shared playstate coordinator registry (keyed by Spotify user id).
+This is kept separate from `hass.data[DOMAIN]`, which only contains `InstanceDataSpotifyPlus` entries.
+"""
+
+DATA_CATALOG_STORE:str = "%s_catalog_store" % DOMAIN
+""" HA data key that stores the persistent Spotify catalog store (shared by all accounts). """
+
+SPOTIFY_SCAN_INTERVAL_TICK:int = 1
+"""
+Smallest time interval (in seconds) that the playstate coordinator will wake up in.
+The coordinator otherwise sleeps until the next scan deadline; check the coordinator
+`_GetNextScanDelay` method for logic that controls this.
+"""
+
+SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART:int = 3
+"""
+Time interval (in seconds) to scan spotify connect player for updates
+due to a track ending / starting.
+"""
+
+SPOTIFY_SCAN_INTERVAL_COMMAND:int = 5
+"""
+Time interval (in seconds) to scan spotify connect player for updates
+due to a player command.  This gives the Spotify Connect Player time to
+update its PlayState status (5 seconds).
+"""
+
+SPOTIFY_SCAN_INTERVAL_IDLE_STEP_SCANS:int = 10
+"""
+Number of consecutive scans that a paused / idle player must report an unchanged playstate
+before the scan interval is stretched to the next step of the idle scan interval profile.
+"""
+
+SPOTIFY_SCAN_VERIFY_DELAY:float = 2.0
+"""
+Time interval (in seconds) to wait after a player command is processed before querying 
+spotify connect player for playstate, to verify the expected state of the command.  This 
+gives the Spotify Connect Player time to update its PlayState status.
+"""
+
+SPOTIFY_QUEUE_PREFETCH_LEAD:int = 5
+"""
+Time interval (in seconds) before the predicted end of the playing track at which the
+next item in the player queue is prefetched, so that it can be displayed as soon as the
+track ends.
+"""
+
+SPOTIFY_WEBAPI_REQUEST_TIMEOUT:float = 10.0
+""" Time interval (in seconds) to wait for an async Spotify Web API request to complete. """
+
+SPOTIFY_RATELIMIT_BUCKET_SIZE:int = 30
+""" Maximum number of Spotify Web API request tokens (burst size) per Spotify user account. """
+
+SPOTIFY_RATELIMIT_LANE_RESERVE_BULK:int = 10
+""" Number of request tokens that bulk (library / browse) requests leave for higher priority lanes. """
+
+SPOTIFY_RATELIMIT_LANE_RESERVE_POLL:int = 4
+""" Number of request tokens that playstate polling requests leave for player transport commands. """
+
+SPOTIFY_RATELIMIT_REFILL_RATE:float = 3.0
+""" Number of Spotify Web API request tokens added to the bucket per second. """
+
+SPOTIFY_RATELIMIT_RETRY_AFTER_DEFAULT:int = 5
+""" Time interval (in seconds) to pause lower priority lanes if a 429 response contains no Retry-After header. """
+
+SPOTIFY_RATELIMIT_WAIT_TIMEOUT:int = 30
+""" Maximum time interval (in seconds) that a Spotify Web API request waits for a request token. """
+
+SPOTIFY_BREAKER_BACKOFF_INITIAL:int = 15
+""" Time interval (in seconds) that the circuit breaker stays open the first time it opens. """
+
+SPOTIFY_BREAKER_BACKOFF_JITTER:float = 0.20
+""" Random jitter (fraction, plus or minus) applied to the circuit breaker open interval. """
+
+SPOTIFY_BREAKER_BACKOFF_MAX:int = 600
+""" Maximum time interval (in seconds) that the circuit breaker stays open (10 minutes). """
+
+SPOTIFY_BREAKER_FAILURE_THRESHOLD:int = 5
+""" Number of consecutive Spotify Web API request failures that open the circuit breaker. """
+
+SPOTIFY_COMMAND_COALESCE_MAX_DELAY:float = 1.0
+""" Maximum time interval (in seconds) that a coalesced command (volume, seek) is delayed. """
+
+SPOTIFY_COMMAND_COALESCE_WINDOW:float = 0.30
+""" Time interval (in seconds) in which commands of the same type (volume, seek) are coalesced. """
+
+SPOTIFY_DEVICE_REFRESH_MIN_INTERVAL:int = 30
+"""
+Minimum time interval (in seconds) between background refreshes of the Spotify Connect
+device list cache that are triggered by a player device name mismatch.
+"""
+
+SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL:int = 30
+""" Time interval (in seconds) to wait before retrying a failed background token refresh. """
+
+SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT:int = 30
+""" Maximum time interval (in seconds) that a worker thread waits on a token refresh. """
+
+DIAGNOSTICS_SCAN_TIMELINE_SIZE:int = 50
+""" Number of recent playstate scans that are kept for diagnostics output. """
+
+BROWSE_CACHE_MAX_ENTRIES:int = 64
+""" Maximum number of media browser nodes to keep in the browse cache. """
+
+BROWSE_CACHE_TTL_STALE:int = 3600
+"""
+Time interval (in seconds) after a browse cache entry expires that it is still returned
+(while it is rebuilt in the background) before it is discarded (1 hour).
+"""
+
+EXECUTOR_FANOUT_MAX_WORKERS:int = 8
+"""
+Maximum number of threads (shared by all accounts) that run the independent Spotify Web API
+requests of a single job concurrently; e.g. a media browser node header and its items.
+"""
+
+EXECUTOR_RESERVED_WORKERS:int = 1
+"""
+Number of account executor worker threads that BULK lane jobs (e.g. media browsing, library
+services) can not occupy, so that player commands and playstate scans start immediately.
+"""
+
+CATALOG_STORE_KEY:str = "%s_catalog" % DOMAIN
+""" HA storage key (file name in the `.storage` folder) of the persistent Spotify catalog store. """
+
+CATALOG_STORE_VERSION:int = 1
+""" HA storage version of the persistent Spotify catalog store. """
+
+CATALOG_STORE_SAVE_DELAY:int = 30
+""" Time interval (in seconds) that catalog store changes are batched for before they are written. """
+
+CATALOG_TTL_CATEGORIES:int = 86400
+""" Time interval (in seconds) that the stored browse categories list remains valid (24 hours). """
+
+CATALOG_TTL_FEATURED_PLAYLISTS:int = 21600
+""" Time interval (in seconds) that the stored featured playlists remain valid (6 hours). """
+
+CATALOG_TTL_NEW_RELEASES:int = 21600
+""" Time interval (in seconds) that the stored album new releases remain valid (6 hours). """
+
+EPISODE_TYPE_CACHE_MAX_ENTRIES:int = 64
+""" Maximum number of episode item types (podcast or audiobook) to keep in the episode type cache. """
+
+EPISODE_TYPE_CACHE_TTL:int = 86400
+""" Time interval (in seconds) that an episode item type cache entry remains valid (24 hours). """
+
+PLAYLIST_CACHE_MAX_ENTRIES:int = 32
+""" Maximum number of context playlist entries to keep in the playlist cache. """
+
+PLAYLIST_CACHE_TTL:int = 600
+""" Time interval (in seconds) that a context playlist cache entry remains valid (10 minutes). """
+
+PLAYLIST_CACHE_TTL_NEGATIVE:int = 3600
+"""
+Time interval (in seconds) that a failed context playlist lookup remains cached (1 hour).
+Spotify-owned "algorithmic" playlists can never be retrieved via the Spotify Web API, so
+there is no point in retrying them every time the context changes.
+"""
+
 LOGGER = logging.getLogger(__package__)
 
 CONF_OPTION_ALWAYS_ON = "always_on"
@@ -35,15 +205,24 @@ CONF_OPTION_DEVICE_DEFAULT = "device_default"
 CONF_OPTION_DEVICE_LOGINID = "device_loginid"
 CONF_OPTION_DEVICE_PASSWORD = "device_password"
 CONF_OPTION_DEVICE_USERNAME = "device_username"
+CONF_OPTION_EXECUTOR_MAX_WORKERS = "executor_max_workers"
+CONF_OPTION_EXECUTOR_QUEUE_LIMIT = "executor_queue_limit"
+CONF_OPTION_METRICS_ENABLED = "metrics_enabled"
 CONF_OPTION_SCRIPT_TURN_ON = "script_turn_on"
 CONF_OPTION_SCRIPT_TURN_OFF = "script_turn_off"
 CONF_OPTION_SOURCE_LIST_HIDE = "source_list_hide"
 CONF_OPTION_SPOTIFY_SCAN_INTERVAL = "spotify_scan_interval"
+CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE = "spotify_scan_interval_idle"
+CONF_OPTION_TOKEN_REFRESH_MARGIN = "token_refresh_margin"
 CONF_OPTION_TURN_OFF_AUTO_PAUSE = "turn_off_auto_pause"
 CONF_OPTION_TURN_ON_AUTO_RESUME = "turn_on_auto_resume"
 CONF_OPTION_TURN_ON_AUTO_SOURCE_SELECT = "turn_on_auto_source_select"
 
+DEFAULT_OPTION_EXECUTOR_MAX_WORKERS = 4
+DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT = 32
 DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL = 30
+DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE = "120;600"
+DEFAULT_OPTION_TOKEN_REFRESH_MARGIN = 300
 
 # security scopes required by various Spotify Web API endpoints.
 SPOTIFY_SCOPES:list = \
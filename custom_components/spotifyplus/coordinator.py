@@ -0,0 +1,1317 @@
+"""
+Shared Spotify player playstate coordinator for the SpotifyPlus component.
+
+A single coordinator instance is created for each Spotify user account, regardless of
+how many configuration entries (and media player entities) reference the account.  The
+coordinator queries the Spotify Web API for player playstate once per scan cycle, and
+fans the resulting snapshot out to every media player entity that is subscribed to it.
+This keeps the number of Spotify Web API calls per minute proportional to the number of
+accounts, rather than the number of entities.
+"""
+from __future__ import annotations
+
+import aiohttp
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from spotifywebapipython import SpotifyClient, SpotifyApiError, SpotifyAuthToken, SpotifyMediaTypes, SpotifyWebApiError
+from spotifywebapipython.models import Context, Device, PlayerLastPlayedInfo, PlayerPlayState, PlayerQueueInfo, Playlist, SpotifyConnectDevice, SpotifyConnectDevices
+from spotifywebapipython.spotifyclient import MUSIC_SOURCE_SPOTIFY_CONNECT, MUSIC_SOURCE_SPOTIFY_LOCAL_QUEUE
+
+from homeassistant.components.media_player import MediaPlayerState, MediaType
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.dt import utcnow
+
+from .const import (
+    BROWSE_CACHE_MAX_ENTRIES,
+    BROWSE_CACHE_TTL_STALE,
+    DATA_PLAYSTATE_COORDINATORS,
+    DEFAULT_OPTION_EXECUTOR_MAX_WORKERS,
+    DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT,
+    DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL,
+    DIAGNOSTICS_SCAN_TIMELINE_SIZE,
+    DOMAIN,
+    EPISODE_TYPE_CACHE_MAX_ENTRIES,
+    EPISODE_TYPE_CACHE_TTL,
+    LOGGER,
+    PLAYLIST_CACHE_MAX_ENTRIES,
+    PLAYLIST_CACHE_TTL,
+    PLAYLIST_CACHE_TTL_NEGATIVE,
+    SPOTIFY_DEVICE_REFRESH_MIN_INTERVAL,
+    SPOTIFY_QUEUE_PREFETCH_LEAD,
+    SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART,
+    SPOTIFY_SCAN_INTERVAL_TICK,
+    SPOTIFY_WEBAPI_REQUEST_TIMEOUT,
+)
+from .browsecache import SpotifyPlusBrowseCache
+from .circuitbreaker import CircuitBreakerState, SpotifyPlusCircuitBreaker
+from .executor import SpotifyPlusExecutor
+from .instrumentation import InstrumentationCategory, LatencyHistogram, SpotifyPlusInstrumentation
+from .ratelimiter import SpotifyPlusRateLimiter, SpotifyRequestLane
+from .ttlcache import TtlCache, TtlCacheEntry
+
+if TYPE_CHECKING:
+    from .media_player import SpotifyMediaPlayer
+    from .tokenrefresher import SpotifyPlusTokenRefresher
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIColors
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+
+class SpotifyPlusPlayStateCoordinator(DataUpdateCoordinator[PlayerPlayState]):
+    """
+    Coordinates Spotify player playstate updates for all media player entities
+    that share the same Spotify user account.
+    """
+
+    def __init__(
+        self,
+        hass:HomeAssistant,
+        userId:str,
+        spotifyClient:SpotifyClient,
+        tokenRefresher:SpotifyPlusTokenRefresher,
+        ) -> None:
+        """
+        Initializes a new instance of the playstate coordinator class.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            userId (str):
+                Spotify user id of the account that is being coordinated.
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance used to query the Spotify Web API.
+            tokenRefresher (SpotifyPlusTokenRefresher):
+                The token refresher of the configuration entry that owns the SpotifyClient instance.
+        """
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=None,
+            name="%s_%s" % (DOMAIN, userId),
+            update_interval=None,
+            always_update=False,
+        )
+
+        # initialize instance storage.
+        self._userId:str = userId
+        self._spotifyClients:list[SpotifyClient] = [spotifyClient]
+        self._tokenRefreshers:list[SpotifyPlusTokenRefresher] = [tokenRefresher]
+        self._entities:list[SpotifyMediaPlayer] = []
+        self._commandScanInterval:int = 0
+        self._verifyScanUtc:datetime = None
+        self._nextScanUtc:datetime = None
+        self._isInUpdateEvent:bool = False
+        self._unsubscribeWakeUp:Callable[[], None] = None
+        self._trackEndMonotonic:float = None
+        self._prefetchForUri:str = None
+        self._prefetchItem:object = None
+        self._prefetchTask:asyncio.Task = None
+        self._prefetchCount:int = 0
+        self._prefetchSwapCount:int = 0
+        self._countersLock:threading.Lock = threading.Lock()
+        self._scanCount:int = 0
+        self._scanBypassCounts:dict[str, int] = {"scan_in_progress": 0, "token_refresh": 0}
+        self._scanTimeline:deque[dict[str, Any]] = deque(maxlen=DIAGNOSTICS_SCAN_TIMELINE_SIZE)
+        self._tokenRefreshWait:LatencyHistogram = LatencyHistogram()
+        self._tokenRefresh:LatencyHistogram = LatencyHistogram()
+        self._tokenRefreshBackground:LatencyHistogram = LatencyHistogram()
+        self._instrumentation:SpotifyPlusInstrumentation = SpotifyPlusInstrumentation("%s_%s" % (DOMAIN, userId))
+        self._instrumentation.Install(spotifyClient)
+        self._circuitBreaker:SpotifyPlusCircuitBreaker = SpotifyPlusCircuitBreaker("%s_%s" % (DOMAIN, userId), self._OnCircuitBreakerStateChanged)
+        self._circuitBreaker.Install(spotifyClient)
+        self._rateLimiter:SpotifyPlusRateLimiter = SpotifyPlusRateLimiter("%s_%s" % (DOMAIN, userId))
+        self._rateLimiter.Install(spotifyClient)
+        self._executor:SpotifyPlusExecutor = SpotifyPlusExecutor(
+            "%s_%s" % (DOMAIN, userId),
+            DEFAULT_OPTION_EXECUTOR_MAX_WORKERS,
+            DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT,
+        )
+        self._deviceRefreshTask:asyncio.Task = None
+        self._deviceRefreshLastMonotonic:float = None
+        self._deviceRefreshCount:int = 0
+        self._deviceRefreshSkipped:int = 0
+        self._connectDevices:SpotifyConnectDevices = None
+        self._episodeTypeCache:TtlCache[str, str] = TtlCache(
+            "%s_episode_types" % userId,
+            EPISODE_TYPE_CACHE_MAX_ENTRIES,
+            EPISODE_TYPE_CACHE_TTL,
+            EPISODE_TYPE_CACHE_TTL,
+        )
+        self._playlist:Playlist = None
+        self._playlistCache:TtlCache[str, Playlist] = TtlCache(
+            "%s_playlists" % userId,
+            PLAYLIST_CACHE_MAX_ENTRIES,
+            PLAYLIST_CACHE_TTL,
+            PLAYLIST_CACHE_TTL_NEGATIVE,
+        )
+        self._browseCache:SpotifyPlusBrowseCache = SpotifyPlusBrowseCache(
+            hass,
+            "%s_browse" % userId,
+            BROWSE_CACHE_MAX_ENTRIES,
+            BROWSE_CACHE_TTL_STALE,
+        )
+
+
+    @property
+    def BrowseCache(self) -> SpotifyPlusBrowseCache:
+        """
+        Cache of media browser nodes that is shared by all entities of the account.
+        """
+        return self._browseCache
+
+
+    @property
+    def CircuitBreaker(self) -> SpotifyPlusCircuitBreaker:
+        """
+        Spotify Web API circuit breaker that is shared by all clients of the account.
+        """
+        return self._circuitBreaker
+
+
+    @property
+    def ConnectDevices(self) -> SpotifyConnectDevices | None:
+        """
+        Snapshot of the Spotify Connect device list cache, as of the last playstate device
+        resolution or device list refresh (taken in an executor worker thread); None if a
+        snapshot has not been taken yet.
+
+        This can be used from the event loop, as it does not acquire the Spotify Connect
+        directory lock.
+        """
+        return self._connectDevices
+
+
+    @property
+    def Executor(self) -> SpotifyPlusExecutor:
+        """
+        Bounded executor that runs blocking Spotify Web API work for all clients of the account.
+        """
+        return self._executor
+
+
+    @property
+    def Instrumentation(self) -> SpotifyPlusInstrumentation:
+        """
+        Latency and outcome instrumentation that is shared by all clients of the account.
+        """
+        return self._instrumentation
+
+
+    @property
+    def Playlist(self) -> Playlist:
+        """
+        Playlist object of the currently playing context, if the context is a playlist;
+        otherwise, None.
+        """
+        return self._playlist
+
+
+    @property
+    def PlaylistCache(self) -> TtlCache[str, Playlist]:
+        """
+        Cache of context playlist details, keyed by context uri.
+        """
+        return self._playlistCache
+
+
+    @property
+    def RateLimiter(self) -> SpotifyPlusRateLimiter:
+        """
+        Spotify Web API request rate limiter that is shared by all clients of the account.
+        """
+        return self._rateLimiter
+
+
+    @property
+    def ScanInterval(self) -> int:
+        """
+        Scan interval (in seconds) used to query Spotify for player playstate.
+
+        This is the smallest scan interval of all subscribed entities (which may be stretched
+        while an entity is paused or idle), or `DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL` if no 
+        entities are subscribed.
+        """
+        intervals:list[int] = [entity._GetScanInterval() for entity in self._entities]
+        if len(intervals) == 0:
+            return DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL
+        return max(1, min(intervals))
+
+
+    @property
+    def SpotifyClient(self) -> SpotifyClient:
+        """
+        The SpotifyClient instance used to query the Spotify Web API.
+        """
+        return self._spotifyClients[0]
+
+
+    @property
+    def TimeRemainingSeconds(self) -> float | None:
+        """
+        Predicted time (in seconds) remaining on the playing track, derived from the monotonic 
+        clock time at which Spotify last reported the play position; or None if unknown.
+
+        Note that this value assumes the track is playing; it will be negative if the predicted
+        end of the track has passed.
+        """
+        if (self._trackEndMonotonic is None):
+            return None
+        return self._trackEndMonotonic - time.monotonic()
+
+
+    @property
+    def UserId(self) -> str:
+        """
+        Spotify user id of the account that is being coordinated.
+        """
+        return self._userId
+
+
+    def _GetActiveEntities(self) -> list[SpotifyMediaPlayer]:
+        """
+        Returns a list of subscribed entities that are enabled and powered on.
+        """
+        return [entity for entity in self._entities if (entity.enabled) and (entity.state != MediaPlayerState.OFF)]
+
+
+    @callback
+    def AddEntity(self, entity:SpotifyMediaPlayer) -> Callable[[], None]:
+        """
+        Subscribes a media player entity to playstate updates.
+
+        Args:
+            entity (SpotifyMediaPlayer):
+                Media player entity that will receive playstate updates.
+
+        Returns:
+            A callable that unsubscribes the entity.
+        """
+        _logsi.LogVerbose("'%s': Coordinator is adding entity subscriber: '%s'" % (self.name, entity.name))
+        self._entities.append(entity)
+        removeListener:Callable[[], None] = self.async_add_listener(entity._HandleCoordinatorUpdate)
+
+        # force a scan at the next interval so the new subscriber receives current state.
+        self._nextScanUtc = None
+        self._ScheduleWakeUp()
+
+        @callback
+        def _RemoveEntity() -> None:
+            _logsi.LogVerbose("'%s': Coordinator is removing entity subscriber: '%s'" % (self.name, entity.name))
+            removeListener()
+            if entity in self._entities:
+                self._entities.remove(entity)
+            if len(self._entities) == 0:
+                self.CancelWakeUp()
+                self.CancelBackgroundTasks()
+
+        return _RemoveEntity
+
+
+    @callback
+    def CancelWakeUp(self) -> None:
+        """
+        Cancels the scheduled coordinator wake up, if one is scheduled.
+        """
+        if self._unsubscribeWakeUp is not None:
+            self._unsubscribeWakeUp()
+            self._unsubscribeWakeUp = None
+
+
+    @callback
+    def CancelBackgroundTasks(self) -> None:
+        """
+        Cancels any device list cache refresh or next queue item prefetch that is in progress.
+
+        This is only called when the last subscriber is removed; scheduling a wake up must 
+        not cancel background work that is still needed.
+        """
+        if (self._deviceRefreshTask is not None) and (not self._deviceRefreshTask.done()):
+            self._deviceRefreshTask.cancel()
+        self._deviceRefreshTask = None
+        if (self._prefetchTask is not None) and (not self._prefetchTask.done()):
+            self._prefetchTask.cancel()
+        self._prefetchTask = None
+
+
+    def _OnCircuitBreakerStateChanged(self, state:CircuitBreakerState) -> None:
+        """
+        Called by the circuit breaker when its state changes, so that subscribed entities
+        can update their availability.
+
+        Args:
+            state (CircuitBreakerState):
+                New circuit breaker state.
+
+        This may be called from any thread.
+        """
+        self.hass.loop.call_soon_threadsafe(self.async_update_listeners)
+
+
+    async def async_RunInExecutor(self, lane:SpotifyRequestLane, func:Callable[..., Any], *args:Any) -> Any:
+        """
+        Runs a blocking function in a worker thread of the account executor, and returns its result.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Executor priority, and the rate limiter lane that Spotify Web API requests made
+                by the function are sent in.
+            func (Callable):
+                Function to run.
+            *args:
+                Positional arguments to pass to the function.
+
+        Raises:
+            SpotifyApiError:
+                If the executor is saturated and a BULK lane job was rejected.
+
+        The time the job waited in the executor queue is recorded for diagnostics.
+        """
+        return await self._executor.async_Run(lane, func, *args)
+
+
+    def _RecordLatency(self, histogram:LatencyHistogram, elapsedSecs:float, isError:bool=False) -> None:
+        """
+        Records a duration in one of the diagnostics histograms.
+
+        Args:
+            histogram (LatencyHistogram):
+                Histogram to record the duration in.
+            elapsedSecs (float):
+                Duration (in seconds).
+            isError (bool):
+                True if the operation failed; otherwise, False.
+
+        It is safe to call this method from any thread.
+        """
+        with self._countersLock:
+            histogram.Record(elapsedSecs, isError)
+
+
+    def RecordTokenRefresh(self, refreshSecs:float, isBackground:bool, isError:bool) -> None:
+        """
+        Records the timing of an authorization token refresh for diagnostics.
+
+        Args:
+            refreshSecs (float):
+                Time (in seconds) spent refreshing the token.
+            isBackground (bool):
+                True if the refresh was a scheduled background refresh; otherwise, False if it
+                was started by a SpotifyClient request that found its token expired.
+            isError (bool):
+                True if the token refresh failed; otherwise, False.
+        """
+        if (isBackground):
+            self._RecordLatency(self._tokenRefreshBackground, refreshSecs, isError)
+            _logsi.WatchInt(SILevel.Debug, "HASpotifyTokenRefreshBackground", self._tokenRefreshBackground.Count)
+        else:
+            self._RecordLatency(self._tokenRefresh, refreshSecs, isError)
+            _logsi.WatchInt(SILevel.Debug, "HASpotifyTokenRefreshForeground", self._tokenRefresh.Count)
+
+
+    def RecordTokenRefreshWait(self, waitSecs:float, isError:bool) -> None:
+        """
+        Records the time a worker thread spent waiting on an authorization token refresh
+        for diagnostics.
+
+        Args:
+            waitSecs (float):
+                Time (in seconds) spent waiting on the token refresh.
+            isError (bool):
+                True if the token refresh failed (or the wait timed out); otherwise, False.
+
+        It is safe to call this method from any thread.
+        """
+        self._RecordLatency(self._tokenRefreshWait, waitSecs, isError)
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of coordinator performance counters, suitable for diagnostics output.
+        """
+        with self._countersLock:
+            return {
+                "subscribers": len(self._entities),
+                "subscribers_active": len(self._GetActiveEntities()),
+                "scan_interval": self.ScanInterval,
+                "next_scan_utc": None if (self._nextScanUtc is None) else self._nextScanUtc.isoformat(timespec="seconds"),
+                "time_remaining_seconds": None if (self.TimeRemainingSeconds is None) else round(self.TimeRemainingSeconds, 1),
+                "last_update_success": self.last_update_success,
+                "scan_count": self._scanCount,
+                "scan_bypass_counts": dict(self._scanBypassCounts),
+                "device_refresh_count": self._deviceRefreshCount,
+                "device_refresh_skipped": self._deviceRefreshSkipped,
+                "queue_prefetch_count": self._prefetchCount,
+                "queue_prefetch_swap_count": self._prefetchSwapCount,
+                "token_refresh_wait": self._tokenRefreshWait.ToDictionary(),
+                "token_refresh_foreground": self._tokenRefresh.ToDictionary(),
+                "token_refresh_background": self._tokenRefreshBackground.ToDictionary(),
+                "scan_timeline": list(self._scanTimeline),
+            }
+
+
+    @callback
+    def RequestDeviceRefresh(self, spotifyClient:SpotifyClient, reason:str) -> bool:
+        """
+        Requests a background refresh of the Spotify Connect device list cache.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance whose device list cache should be refreshed.
+            reason (str):
+                Reason the refresh was requested, for trace purposes.
+
+        Returns:
+            True if a refresh was started; otherwise, False if a refresh is already in 
+            progress or one completed within the last `SPOTIFY_DEVICE_REFRESH_MIN_INTERVAL` 
+            seconds.
+
+        The refresh is single-flight and rate-limited across all entities of the account, 
+        as it can trigger a zeroconf discovery of Spotify Connect devices.  Callers continue 
+        to use the existing (stale) device list cache until the refresh completes.  
+        This method must be called from the event loop.
+        """
+        # is a refresh already in progress?  if so, then don't bother.
+        if (self._deviceRefreshTask is not None) and (not self._deviceRefreshTask.done()):
+            self._deviceRefreshSkipped += 1
+            return False
+
+        # was a refresh done recently?  if so, then don't bother.
+        nowMonotonic:float = time.monotonic()
+        if (self._deviceRefreshLastMonotonic is not None) and (nowMonotonic - self._deviceRefreshLastMonotonic < SPOTIFY_DEVICE_REFRESH_MIN_INTERVAL):
+            self._deviceRefreshSkipped += 1
+            _logsi.LogVerbose("'%s': Spotify Connect device list cache refresh was requested (%s), but was refreshed %.1f seconds ago; refresh skipped" % (self.name, reason, nowMonotonic - self._deviceRefreshLastMonotonic))
+            return False
+
+        _logsi.LogVerbose("'%s': Spotify Connect device list cache refresh was requested (%s); starting background refresh" % (self.name, reason))
+        self._deviceRefreshLastMonotonic = nowMonotonic
+        self._deviceRefreshTask = self.hass.async_create_background_task(
+            self._async_RefreshDevices(spotifyClient), 
+            "%s_device_refresh" % self.name,
+        )
+        return True
+
+
+    async def _async_RefreshDevices(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Refreshes the Spotify Connect device list cache in an executor worker thread.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance whose device list cache should be refreshed.
+        """
+        try:
+
+            self._connectDevices = await self.async_RunInExecutor(SpotifyRequestLane.POLL, spotifyClient.GetSpotifyConnectDevices, True)
+            self._deviceRefreshCount += 1
+            _logsi.WatchInt(SILevel.Debug, "HASpotifyDeviceRefreshCount", self._deviceRefreshCount)
+
+        except Exception as ex:
+
+            _logsi.LogException("'%s': Spotify Connect device list cache refresh failed: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
+
+        finally:
+
+            # restart the rate-limit interval from when the refresh completed.
+            self._deviceRefreshLastMonotonic = time.monotonic()
+
+
+    def TriggerScanWindow(self, scanCount:int) -> None:
+        """
+        Forces a playstate scan window for the next `scanCount` scan intervals.
+
+        Args:
+            scanCount (int):
+                Number of consecutive `SPOTIFY_SCAN_INTERVAL_TICK` intervals to query 
+                Spotify for player playstate.
+
+        This is normally called after a player command is processed, to give the Spotify
+        Connect player time to update its playstate status.  It is safe to call this method
+        from any thread.
+        """
+        self._commandScanInterval = scanCount
+        self.hass.loop.call_soon_threadsafe(self._ScheduleWakeUp)
+
+
+    def TriggerVerificationScan(self, delay:float) -> None:
+        """
+        Forces a single playstate scan after the specified delay, unless a scan is already
+        scheduled before then.
+
+        Args:
+            delay (float):
+                Time interval (in seconds) to wait before querying Spotify for player playstate.
+
+        This is normally called after a player command is processed, to verify the expected 
+        state of the command.  It is safe to call this method from any thread.
+        """
+        self._verifyScanUtc = utcnow() + timedelta(seconds=delay)
+        self.hass.loop.call_soon_threadsafe(self._ScheduleWakeUp)
+
+
+    def _GetNextScanDelay(self) -> float:
+        """
+        Calculates the number of seconds until Spotify should be queried for player playstate.
+
+        Returns:
+            The earliest of the scan interval deadline, the predicted end of the playing 
+            track, or the command response monitoring window.
+        """
+        # are we monitoring an issued command response?  if so, then query at the next tick.
+        if (self._commandScanInterval > 0):
+            return SPOTIFY_SCAN_INTERVAL_TICK
+
+        # is the circuit breaker open?  if so, then wait until a probe request is allowed.
+        if (self._circuitBreaker.State == CircuitBreakerState.OPEN):
+            return max(SPOTIFY_SCAN_INTERVAL_TICK, self._circuitBreaker.SecondsUntilRetry)
+
+        # did the last query fail?  if so, then wait for the scan interval deadline.
+        if (not self.last_update_success):
+            return self.ScanInterval
+
+        # are we playing content?  if so, then wake up just after the track is predicted to end;
+        # if the predicted end has passed, then query at every tick until the track changes.
+        isPlaying:bool = (self.data is not None) and (self.data.IsPlaying == True)
+        if (isPlaying):
+            timeRemaining:float = self.TimeRemainingSeconds
+            if (timeRemaining is None) or (timeRemaining <= 0):
+                return SPOTIFY_SCAN_INTERVAL_TICK
+            return min(self.ScanInterval, timeRemaining + SPOTIFY_SCAN_INTERVAL_TICK)
+
+        # otherwise, wait for the scan interval deadline.
+        return self.ScanInterval
+
+
+    def _GetPrefetchDelay(self) -> float | None:
+        """
+        Calculates the number of seconds until the next queue item should be prefetched, or 
+        until a prefetched item should be swapped in at the predicted end of the playing track.
+
+        Returns:
+            The number of seconds until the next prefetch action is due, or None if there is
+            nothing to prefetch (e.g. nothing is playing, the track is repeating, or the next
+            item was already prefetched and swapped in).
+        """
+        playerState:PlayerPlayState = self.data
+        if (playerState is None) or (playerState.IsPlaying != True) or (playerState.Item is None):
+            return None
+        timeRemaining:float = self.TimeRemainingSeconds
+        if (timeRemaining is None):
+            return None
+
+        # is a prefetched item staged for the playing track?  if so, then it is due at the end of the track.
+        itemUri:str = playerState.Item.Uri
+        if (self._prefetchForUri == itemUri):
+            if (self._prefetchItem is None):
+                return None
+            return max(0, timeRemaining)
+
+        # otherwise, prefetch the next item just before the end of the track; the next item
+        # is the same item if the track is repeating, so there is nothing to prefetch.
+        if (timeRemaining <= 0) or (playerState.RepeatState == "track"):
+            return None
+        return max(0, timeRemaining - SPOTIFY_QUEUE_PREFETCH_LEAD)
+
+
+    @callback
+    def _StartPrefetch(self) -> None:
+        """
+        Starts a background task that retrieves the next item in the player queue.
+        """
+        self._prefetchForUri = self.data.Item.Uri
+        self._prefetchItem = None
+        if (self._prefetchTask is not None) and (not self._prefetchTask.done()):
+            return
+        self._prefetchTask = self.hass.async_create_background_task(
+            self._async_PrefetchNextItem(self._prefetchForUri),
+            "%s_prefetch" % self.name,
+        )
+
+
+    async def _async_PrefetchNextItem(self, itemUri:str) -> None:
+        """
+        Retrieves the player queue, and stages the next item so that it can be swapped in
+        as soon as the playing track ends.
+
+        Args:
+            itemUri (str):
+                Uri of the playing track that the next item is being prefetched for.
+        """
+        try:
+
+            queueInfo:PlayerQueueInfo = await self.async_RunInExecutor(SpotifyRequestLane.POLL, self.SpotifyClient.GetPlayerQueueInfo)
+            self._prefetchCount += 1
+            _logsi.WatchInt(SILevel.Debug, "HASpotifyQueuePrefetches", self._prefetchCount)
+
+            # did the playing track change while we were waiting?  if so, then the queue is stale.
+            if (self._prefetchForUri != itemUri):
+                return
+            if (queueInfo.CurrentlyPlaying is None) or (queueInfo.CurrentlyPlaying.Uri != itemUri) or (queueInfo.QueueCount == 0):
+                _logsi.LogVerbose("'%s': Player queue does not contain a next item for '%s'; nothing staged" % (self.name, itemUri))
+                return
+
+            # only stage items that contain everything the entities display.
+            item:object = queueInfo.Queue[0]
+            if (getattr(item, "Album", None) is None) and (getattr(item, "Show", None) is None):
+                return
+            self._prefetchItem = item
+            _logsi.LogVerbose("'%s': Next queue item staged: '%s' (%s)" % (self.name, item.Name, item.Uri))
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as ex:
+
+            # prefetch is only an optimization; the track change is picked up by the next scan.
+            _logsi.LogVerbose("'%s': Next queue item prefetch failed: %s" % (self.name, str(ex)))
+
+        finally:
+
+            self._ScheduleWakeUp()
+
+
+    @callback
+    def _ApplyPrefetchItem(self) -> None:
+        """
+        Swaps the staged next queue item in as the playing item at the predicted end of the
+        playing track, and schedules a single scan to confirm it.
+        """
+        item:object = self._prefetchItem
+        self._prefetchItem = None
+        self._prefetchSwapCount += 1
+        _logsi.WatchInt(SILevel.Debug, "HASpotifyQueuePrefetchSwaps", self._prefetchSwapCount)
+        _logsi.LogVerbose("'%s': Track is predicted to have ended; swapping in staged next queue item: '%s' (%s)" % (self.name, item.Name, item.Uri))
+
+        # build a new predicted playstate from the last snapshot, so that the snapshot (which
+        # the entities may still reference) is not changed.
+        lastState:PlayerPlayState = self.data
+        playerState:PlayerPlayState = PlayerPlayState(root={
+            'actions': {'disallows': lastState.Actions.ToDictionary()},
+            'context': lastState.Context.ToDictionary() if (lastState.Context is not None) else None,
+            'currently_playing_type': item.Type,
+            'device': lastState.Device.ToDictionary(),
+            'is_playing': lastState.IsPlaying,
+            'item': item.ToDictionary(),
+            'progress_ms': 0,
+            'repeat_state': lastState.RepeatState,
+            'shuffle_state': lastState.ShuffleState,
+            'smart_shuffle': lastState.SmartShuffle,
+            'timestamp': lastState.Timestamp,
+        })
+        playerState.DeviceMusicSource = lastState.DeviceMusicSource
+        playerState.IsDeviceState = lastState.IsDeviceState
+        if (item.Type == SpotifyMediaTypes.EPISODE.value):
+            cacheEntry:TtlCacheEntry[str] = self._episodeTypeCache.Get(item.Uri)
+            playerState.ItemType = cacheEntry.Value if (cacheEntry is not None) else SpotifyMediaTypes.PODCAST.value
+        else:
+            playerState.ItemType = SpotifyClient.GetTypeFromUri(item.Uri)
+        self._trackEndMonotonic = time.monotonic() + (item.DurationMS / 1000)
+
+        # update all subscribed entities with the predicted playstate.
+        entity:SpotifyMediaPlayer
+        for entity in self._GetActiveEntities():
+            entity._UpdateFromCoordinator(playerState, self._playlist)
+        self.data = playerState
+        self.async_update_listeners()
+
+        # confirm the swap with a single scan, once Spotify has had time to start the track;
+        # an earlier scan deadline is kept.
+        dtUtcConfirm:datetime = utcnow() + timedelta(seconds=SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART)
+        if (self._nextScanUtc is None) or (self._nextScanUtc > dtUtcConfirm):
+            self._nextScanUtc = dtUtcConfirm
+
+
+    @callback
+    def _ScheduleWakeUp(self) -> None:
+        """
+        Schedules the next coordinator wake up.
+
+        The coordinator sleeps until the earliest of the next scan deadline, or the next 
+        play time remaining estimate refresh (only while a subscribed entity is playing 
+        content within its last scan interval window).  Nothing is scheduled if there are 
+        no active subscribers.
+        """
+        self.CancelWakeUp()
+
+        # is a scan in progress?  if so, then it will schedule the next wake up when it completes.
+        if self._isInUpdateEvent:
+            return
+
+        # are there any active entities?  if not, then there is nothing to do.
+        activeEntities:list[SpotifyMediaPlayer] = self._GetActiveEntities()
+        if len(activeEntities) == 0:
+            return
+
+        # calculate the next scan deadline, if one is not already set.  if a command scan
+        # window was triggered, then it takes precedence over an existing deadline.
+        dtUtcNow:datetime = utcnow()
+        dtUtcNextTick:datetime = dtUtcNow + timedelta(seconds=SPOTIFY_SCAN_INTERVAL_TICK)
+        if (self._nextScanUtc is None):
+            self._nextScanUtc = dtUtcNextTick
+        elif (self._commandScanInterval > 0) and (self._nextScanUtc > dtUtcNextTick):
+            self._nextScanUtc = dtUtcNextTick
+
+        # was a command verification scan requested before the deadline?  if so, then it takes precedence.
+        if (self._verifyScanUtc is not None) and (self._nextScanUtc > self._verifyScanUtc):
+            self._nextScanUtc = self._verifyScanUtc
+
+        # do any subscribers need play time remaining estimate refreshes before then?
+        dtUtcWakeUp:datetime = self._nextScanUtc
+        if any(entity._IsInLastScanIntervalWindow() for entity in activeEntities):
+            dtUtcWakeUp = min(dtUtcWakeUp, dtUtcNextTick)
+
+        # is a next queue item prefetch (or swap) due before then?
+        prefetchDelay:float = self._GetPrefetchDelay()
+        if (prefetchDelay is not None):
+            dtUtcWakeUp = min(dtUtcWakeUp, dtUtcNow + timedelta(seconds=prefetchDelay))
+
+        self._unsubscribeWakeUp = async_track_point_in_utc_time(self.hass, self._HandleWakeUp, dtUtcWakeUp)
+
+
+    @callback
+    def _HandleWakeUp(self, dtUtcNow:datetime) -> None:
+        """
+        Handles a scheduled coordinator wake up.
+
+        Args:
+            dtUtcNow (datetime):
+                Current UTC date and time.
+        """
+        self._unsubscribeWakeUp = None
+
+        # is a next queue item prefetch (or swap) due?  if so, then process it first; a swap
+        # moves the scan deadline, so that the swapped in item is confirmed by a single scan.
+        prefetchDelay:float = self._GetPrefetchDelay()
+        if (prefetchDelay is not None) and (prefetchDelay <= 0):
+            if (self._prefetchItem is not None):
+                self._ApplyPrefetchItem()
+            else:
+                self._StartPrefetch()
+
+        # have we reached the scan deadline?  if so, then query Spotify for player state.
+        if (self._nextScanUtc is None) or (dtUtcNow >= self._nextScanUtc):
+            self._isInUpdateEvent = True
+            self.hass.async_create_background_task(self._async_ScanPlayState(), "%s_scan" % self.name)
+            return
+
+        # otherwise, let subscribed entities refresh their play time remaining estimate.
+        for entity in self._GetActiveEntities():
+            if entity._IsInLastScanIntervalWindow():
+                entity._OnScanIntervalTick()
+        self._ScheduleWakeUp()
+
+
+    async def _async_ScanPlayState(self, trigger:str="scheduled") -> None:
+        """
+        Queries Spotify for player playstate, and schedules the next wake up.
+
+        Args:
+            trigger (str):
+                Reason for the scan, for diagnostics purposes.
+        """
+        try:
+
+            # is the authentication token being refreshed?  if so, then try again at the next
+            # tick, as updates are happening that we don't want to interfere with.
+            if self._tokenRefreshers[0].IsRefreshing:
+                _logsi.LogVerbose("'%s': Update - Integration is refreshing authentication token; bypassing update" % self.name, colorValue=SIColors.Gold)
+                self._scanBypassCounts["token_refresh"] += 1
+                self._nextScanUtc = utcnow() + timedelta(seconds=SPOTIFY_SCAN_INTERVAL_TICK)
+                return
+
+            # are we monitoring a command response? if so, then decrement the interval count.
+            if self._commandScanInterval > 0:
+                self._commandScanInterval = self._commandScanInterval - 1
+                trigger = "command"
+
+            # is a command verification scan due?  if so, then this scan satisfies it.
+            if (self._verifyScanUtc is not None) and (utcnow() >= self._verifyScanUtc):
+                self._verifyScanUtc = None
+                trigger = "verify"
+
+            # query player state; this will notify listeners if the playstate changed.
+            dtUtcStart:datetime = utcnow()
+            startTime:float = time.perf_counter()
+            await self.async_refresh()
+            elapsedSecs:float = time.perf_counter() - startTime
+            if self._instrumentation.Enabled:
+                self._instrumentation.Record(InstrumentationCategory.ENTRY_POINT, "update", elapsedSecs, not self.last_update_success)
+
+            # calculate the next scan deadline.
+            nextScanDelay:float = self._GetNextScanDelay()
+            self._nextScanUtc = utcnow() + timedelta(seconds=nextScanDelay)
+
+            # record the scan in the diagnostics timeline.
+            with self._countersLock:
+                self._scanCount += 1
+                self._scanTimeline.append({
+                    "utc": dtUtcStart.isoformat(timespec="seconds"),
+                    "trigger": trigger,
+                    "duration_ms": round(elapsedSecs * 1000, 1),
+                    "success": self.last_update_success,
+                    "next_scan_seconds": round(nextScanDelay, 1),
+                })
+            _logsi.LogVerbose("'%s': Next playstate scan in %.1f seconds - commandScanInterval=%d, timeRemainingSeconds=%s" % (self.name, nextScanDelay, self._commandScanInterval, self.TimeRemainingSeconds))
+
+        finally:
+
+            # indicate we are no longer updating status, and schedule the next wake up.
+            self._isInUpdateEvent = False
+            self._ScheduleWakeUp()
+
+
+    async def async_ScanNow(self) -> None:
+        """
+        Queries Spotify for player playstate immediately, rather than waiting for the 
+        next scan deadline.
+        """
+        # is a scan in progress?  if so, then there is no need to start another one.
+        if self._isInUpdateEvent:
+            self._scanBypassCounts["scan_in_progress"] += 1
+            return
+
+        self.CancelWakeUp()
+        self._isInUpdateEvent = True
+        await self._async_ScanPlayState("now")
+
+
+    async def _async_update_data(self) -> PlayerPlayState:
+        """
+        Queries Spotify for player playstate, and returns the playstate snapshot to all
+        subscribed entities.
+        """
+        # trace.
+        _logsi.WatchDateTime(SILevel.Debug, "HASpotifyUpdateLastDT", datetime.now())
+
+        # are there any active entities?  if not, then there is nothing to do.
+        activeEntities:list[SpotifyMediaPlayer] = self._GetActiveEntities()
+        if len(activeEntities) == 0:
+            return self.data
+
+        try:
+
+            # get now playing status via the async http session; if that is not possible (the
+            # authorization token was rejected), then fall back to the SpotifyClient (in an 
+            # executor worker thread), which refreshes the token.
+            accountPlayerState:PlayerPlayState = await self._async_GetPlayerPlaybackState()
+            if (accountPlayerState is None):
+                _logsi.LogVerbose("'%s': Coordinator is getting Spotify Connect device player state via SpotifyClient" % (self.name))
+                accountPlayerState = await self.async_RunInExecutor(SpotifyRequestLane.POLL, self.SpotifyClient.GetPlayerPlaybackState, None, SpotifyMediaTypes.EPISODE.value)
+
+            # resolve the playstate for each source (device name) that is selected by a subscribed
+            # entity, as entities of the same account can select different sources (e.g. Sonos
+            # devices).  does the playstate device need to be resolved from the Spotify Connect
+            # device list (restricted device, or nothing playing on a Sonos source)?  if so, then
+            # do it in an executor worker thread, as the device list is lock-protected.
+            sourcePlayerStates:dict[str, PlayerPlayState] = {}
+            entity:SpotifyMediaPlayer
+            for entity in activeEntities:
+                sourceName:str = entity.source
+                if (sourceName in sourcePlayerStates):
+                    continue
+                sourcePlayerState:PlayerPlayState = accountPlayerState
+                if (self._IsDeviceResolutionRequired(accountPlayerState, sourceName)):
+                    sourcePlayerState = await self.async_RunInExecutor(SpotifyRequestLane.POLL, self._ResolvePlayStateDevice, self.SpotifyClient, accountPlayerState, sourceName)
+                sourcePlayerStates[sourceName] = sourcePlayerState
+
+            # the playstate of the first entity's source is the coordinator playstate.
+            playerState:PlayerPlayState = sourcePlayerStates[activeEntities[0].source]
+            playerStateMonotonic:float = time.monotonic()
+            _logsi.WatchDateTime(SILevel.Debug, "HASpotifyPlaystateLastUpdate", datetime.now())
+
+            # update the context playlist reference; this only requires a worker thread if
+            # the context changed to a different playlist that is not cached.
+            context:Context = playerState.Context
+            if (context is None):
+                self._playlist = None
+            elif (self._playlist is None or self._playlist.Uri != context.Uri):
+                self._playlist = None
+                if (context.Type == MediaType.PLAYLIST):
+                    cacheEntry:TtlCacheEntry[Playlist] = self._playlistCache.Get(context.Uri)
+                    if (cacheEntry is not None):
+                        _logsi.LogVerbose("'%s': Basic playlist details for context uri '%s' found in cache (negative=%s)" % (self.name, context.Uri, cacheEntry.IsNegative))
+                        self._playlist = cacheEntry.Value
+                    else:
+                        self._playlist = await self.async_RunInExecutor(SpotifyRequestLane.POLL, self._GetPlaylist, context)
+                    _logsi.WatchInt(SILevel.Debug, "HASpotifyPlaylistCacheHits", self._playlistCache.Hits)
+                    _logsi.WatchInt(SILevel.Debug, "HASpotifyPlaylistCacheMisses", self._playlistCache.Misses)
+
+            # did the playing item change?  if so, then discard any staged next queue item.
+            itemUri:str = None if (playerState.Item is None) else playerState.Item.Uri
+            if (self._prefetchForUri is not None) and (self._prefetchForUri != itemUri):
+                self._prefetchForUri = None
+                self._prefetchItem = None
+
+            # anchor the predicted end of the playing track to the monotonic clock.
+            self._trackEndMonotonic = None
+            if (playerState.Item is not None) and (playerState.ProgressMS is not None):
+                self._trackEndMonotonic = playerStateMonotonic + ((playerState.Item.DurationMS - playerState.ProgressMS) / 1000)
+
+            # update all subscribed entities with the playstate snapshot of their source; the
+            # context playlist only applies to a source playstate that is playing the context.
+            for entity in activeEntities:
+                entityPlayerState:PlayerPlayState = sourcePlayerStates[entity.source]
+                entityPlaylist:Playlist = self._playlist
+                if (entityPlayerState is not playerState):
+                    if (entityPlayerState.Context is None) or (self._playlist is None) or (self._playlist.Uri != entityPlayerState.Context.Uri):
+                        entityPlaylist = None
+                entity._UpdateFromCoordinator(entityPlayerState, entityPlaylist)
+
+            return playerState
+
+        except SpotifyWebApiError as ex:
+
+            _logsi.LogException(None, ex)
+            raise UpdateFailed(ex.Message) from ex
+
+        except SpotifyApiError as ex:
+
+            _logsi.LogException(None, ex)
+            raise UpdateFailed(ex.Message) from ex
+
+
+    async def _async_GetPlayerPlaybackState(self) -> PlayerPlayState | None:
+        """
+        Get information about the user's current playback state via the HA shared async
+        http session, so that no worker thread is occupied while waiting on the network.
+
+        Returns:
+            A `PlayerPlayState` object if the playstate could be resolved from the Spotify
+            Web API response; otherwise, None if the caller should fall back to the 
+            SpotifyClient `GetDevicePlaybackState` method.
+
+        Raises:
+            UpdateFailed:
+                If the Spotify Web API could not be reached, or returned an error status.
+
+        The SpotifyClient fallback is only required if the authorization token needs to be
+        refreshed.  Nothing playing (204 response) returns an empty playstate, and episode item
+        types are resolved here; device resolution (restricted devices, Sonos sources) is done 
+        by the caller with `_ResolvePlayStateDevice` when `_IsDeviceResolutionRequired`.
+        """
+        client:SpotifyClient = self.SpotifyClient
+
+        # is the authorization token expired?  if so, then let the SpotifyClient refresh it.
+        authToken:SpotifyAuthToken = client.AuthToken
+        if (authToken is None) or (authToken.IsExpired):
+            return None
+
+        # build spotify web api request parameters.
+        urlParms:dict = {'additional_types': SpotifyMediaTypes.EPISODE.value}
+        if (client.UserProfile is not None) and (client.UserProfile.Country is not None):
+            urlParms['market'] = client.UserProfile.Country
+
+        # is the circuit breaker open?  if so, then skip this scan.  this is checked before
+        # a request token is taken, so that tokens are not used up while the breaker is open.
+        if not self._circuitBreaker.AllowRequest():
+            raise UpdateFailed(self._circuitBreaker.UnavailableReason)
+
+        # execute spotify web api request; the breaker is released if no outcome was recorded
+        # (e.g. the request was not sent, or the scan was cancelled).
+        isOutcomeRecorded:bool = False
+        try:
+
+            # wait for a poll lane request token; if the poll lane is paused (e.g. due to a
+            # Retry-After interval), then skip this scan.
+            if not await self._rateLimiter.async_Acquire(SpotifyRequestLane.POLL, SPOTIFY_SCAN_INTERVAL_TICK):
+                raise UpdateFailed("Spotify Web API request rate limit exceeded; playstate scan skipped")
+
+            session:aiohttp.ClientSession = async_get_clientsession(self.hass)
+            with self._instrumentation.Measure(InstrumentationCategory.ENDPOINT, "GetPlayerPlaybackState"):
+                async with asyncio.timeout(SPOTIFY_WEBAPI_REQUEST_TIMEOUT):
+                    async with session.get(
+                        "%s/me/player" % client.SpotifyWebApiUrlBase,
+                        headers={authToken.HeaderKey: authToken.HeaderValue},
+                        params=urlParms,
+                    ) as response:
+
+                        # only some statuses indicate the Spotify Web API is failing.
+                        if (SpotifyPlusCircuitBreaker.IsFailureStatus(response.status)):
+                            self._circuitBreaker.RecordFailure("%d - %s" % (response.status, response.reason))
+                        else:
+                            self._circuitBreaker.RecordSuccess()
+                        isOutcomeRecorded = True
+
+                        # was the token rejected?  if so, then use the fallback.
+                        if (response.status == 401):
+                            return None
+                        if (response.status == 429):
+                            self._rateLimiter.ReportThrottled(response.headers.get("Retry-After", None))
+                        if (response.status not in [200, 204]):
+                            raise UpdateFailed("Spotify Web API GetPlayerPlaybackState returned status %d (%s)" % (response.status, response.reason))
+
+                        # nothing is playing if no content was returned.
+                        responseData:dict = None
+                        if (response.status == 200):
+                            responseData = await response.json()
+
+        except (aiohttp.ClientError, TimeoutError) as ex:
+
+            if (not isOutcomeRecorded):
+                self._circuitBreaker.RecordFailure(str(ex) or type(ex).__name__)
+                isOutcomeRecorded = True
+            raise UpdateFailed("Spotify Web API GetPlayerPlaybackState request failed: %s" % str(ex)) from ex
+
+        finally:
+
+            if (not isOutcomeRecorded):
+                self._circuitBreaker.ReleaseRequest()
+
+        # process results; nothing is playing if no content was returned.
+        result:PlayerPlayState = PlayerPlayState(root=responseData) if (responseData is not None) else PlayerPlayState()
+        if (not result.IsEmpty) and (result.Item is not None):
+            result.ItemType = SpotifyClient.GetTypeFromUri(result.Item.Uri)
+
+            # is this an episode?  if so, then determine the item type (podcast or audiobook).
+            if (result.CurrentlyPlayingType == SpotifyMediaTypes.EPISODE.value):
+                result.ItemType = await self._async_GetEpisodeItemType(result.Item.Uri)
+
+        # update SpotifyClient cached playstate and last played info, as the SpotifyClient
+        # `GetPlayerPlaybackState` method would have.
+        client.ConfigurationCache['GetPlayerPlaybackState'] = result
+        if (result.IsPlaying) and (result.Item is not None):
+            client._PlayerLastPlayedInfo = PlayerLastPlayedInfo(result)
+
+        # update Spotify Connect Directory with active device details; this is done in a worker
+        # thread since the directory device list is lock-protected.
+        self._executor.Submit(SpotifyRequestLane.POLL, client.SpotifyConnectDirectory.UpdateActiveDevice, result)
+
+        return result
+
+
+    async def _async_GetEpisodeItemType(self, itemUri:str) -> str:
+        """
+        Returns the item type (podcast or audiobook) of a playing episode.
+
+        Args:
+            itemUri (str):
+                Uri of the playing episode.
+
+        The item type is cached, as it requires a Spotify Web API request (in an executor
+        worker thread) to determine if the episode is an audiobook chapter.
+        """
+        cacheEntry:TtlCacheEntry[str] = self._episodeTypeCache.Get(itemUri)
+        if (cacheEntry is not None):
+            return cacheEntry.Value
+
+        isChapter:bool = await self.async_RunInExecutor(SpotifyRequestLane.POLL, self.SpotifyClient.IsChapterEpisode, SpotifyClient.GetIdFromUri(itemUri))
+        itemType:str = SpotifyMediaTypes.AUDIOBOOK.value if isChapter else SpotifyMediaTypes.PODCAST.value
+        self._episodeTypeCache.Set(itemUri, itemType)
+        return itemType
+
+
+    def _IsDeviceResolutionRequired(self, playerState:PlayerPlayState, sourceName:str|None) -> bool:
+        """
+        Returns True if the playstate device must be resolved from the Spotify Connect device
+        list by `_ResolvePlayStateDevice`; otherwise, False.
+
+        Args:
+            playerState (PlayerPlayState):
+                Playstate returned by the Spotify Web API.
+            sourceName (str):
+                Source (device name) selected by a subscribed media player entity.
+        """
+        # is nothing playing?  if so, then a Sonos source may have a device-specific playstate.
+        if (playerState.IsEmpty):
+            if (sourceName is None):
+                return False
+            if (self._connectDevices is None):
+                return True
+            scDevice:SpotifyConnectDevice = self._connectDevices.GetDeviceByName(sourceName)
+            return (scDevice is not None) and (scDevice.IsSonos)
+
+        # is the device id not present (e.g. a restricted device)?  if so, then it must be
+        # resolved from the device list.
+        device:Device = playerState.Device
+        if (device is not None) and (device.Id is None or device.Id == ''):
+            return True
+
+        # is a device list snapshot not available yet?  if so, then take one.
+        return (self._connectDevices is None)
+
+
+    def _ResolvePlayStateDevice(self, client:SpotifyClient, playerState:PlayerPlayState, sourceName:str|None) -> PlayerPlayState:
+        """
+        Resolves the playstate device from the Spotify Connect device list cache, as the
+        SpotifyClient `GetDevicePlaybackState` method would have, and takes a snapshot of the
+        device list for use in the event loop.
+
+        Args:
+            client (SpotifyClient):
+                The SpotifyClient instance that owns the device list cache.
+            playerState (PlayerPlayState):
+                Playstate returned by the Spotify Web API.
+            sourceName (str):
+                Source (device name) selected by a subscribed media player entity.
+
+        Returns:
+            The resolved playstate; for a Sonos source that is playing Spotify content while
+            the Spotify Web API reports nothing playing, this is the Sonos device playstate.
+
+        This method is called in an executor worker thread, as the device list is lock-protected,
+        and Sonos devices are queried over the local network.  No Spotify Web API requests are made.
+        """
+        scDevices:SpotifyConnectDevices = client.GetSpotifyConnectDevices(refresh=False)
+        self._connectDevices = scDevices
+        scDevice:SpotifyConnectDevice
+
+        # is nothing playing on a Sonos source?  if so, then get the Sonos device playstate.
+        if (playerState.IsEmpty):
+            scDevice = scDevices.GetDeviceByName(sourceName)
+            if (scDevice is not None) and (scDevice.IsSonos):
+                playerStateSonos:PlayerPlayState = client.GetPlayerPlaybackStateSonos(scDevice)
+                if (playerStateSonos.DeviceMusicSource in [MUSIC_SOURCE_SPOTIFY_CONNECT, MUSIC_SOURCE_SPOTIFY_LOCAL_QUEUE]):
+                    _logsi.LogVerbose("'%s': Sonos device %s playstate will be returned (music source=\"%s\")" % (self.name, scDevice.Title, playerStateSonos.DeviceMusicSource))
+                    playerState = playerStateSonos
+                    if (playerState.IsPlaying) and (playerState.Item is not None):
+                        client._PlayerLastPlayedInfo = PlayerLastPlayedInfo(playerState)
+            return playerState
+
+        # if device id is not present (e.g. a restricted device), then get the device id
+        # from the device list (if present).
+        device:Device = playerState.Device
+        if (device is not None) and (device.Id is None or device.Id == ''):
+            scDevice = scDevices.GetDeviceByName(device.Name)
+            if (scDevice is not None):
+                device.Id = scDevice.DeviceInfo.DeviceId
+                if (scDevice.IsSonos):
+                    sonosPlayer = client.SpotifyConnectDirectory.GetSonosPlayer(scDevice)
+                    if (sonosPlayer):
+                        playerState.DeviceMusicSource = sonosPlayer.music_source
+        return playerState
+
+
+    def _GetPlaylist(self, context:Context) -> Playlist:
+        """
+        Retrieves basic playlist details for a playlist context, and stores the result
+        in the playlist cache.
+
+        Args:
+            context (Context):
+                Currently playing context; the context type must be a playlist.
+
+        Returns:
+            A `Playlist` object; if the playlist could not be retrieved, a "dummy" playlist 
+            is returned (and cached as a negative entry).
+
+        This method is called in an executor worker thread, as it issues a blocking request.
+        """
+        # as of 2024/11/27, Spotify deprecated API support for various Spotify-owned playlists!
+        # due to that, the following `GetPlaylist` call will fail if the currently playing context
+        # is a Spotify-owned "algorithmic" playlist (e.g. various "Made For You" content, etc).
+        try:
+
+            _logsi.LogVerbose("'%s': Retrieving basic playlist details for context uri '%s'" % (self.name, context.Uri))
+            spotifyId:str = SpotifyClient.GetIdFromUri(context.Uri)
+            playlist:Playlist = self.SpotifyClient.GetPlaylist(spotifyId, excludeItems=True)
+            self._playlistCache.Set(context.Uri, playlist)
+            return playlist
+
+        except Exception as ex:
+
+            _logsi.LogWarning("'%s': Unable to get basic playlist data for context '%s'. Continuing without playlist data. GetPlaylist response: %s" % (self.name, context.Uri, str(ex)), logToSystemLogger=False)
+
+            # if we could not get the current playlist info, then build a "dummy" playlist so that
+            # information is still conveyed in the extended attributes.
+            playlist:Playlist = Playlist()
+            playlist.Uri = context.Uri
+            playlist.Type = SpotifyClient.GetTypeFromUri(context.Uri)
+            playlist.Id = SpotifyClient.GetIdFromUri(context.Uri)
+            playlist.Name = "Unknown"
+            playlist.Description = str(ex)
+
+            # cache the failure so that the lookup is not retried every time the context changes;
+            # transient errors (e.g. request timeouts, throttling) are not cached.
+            if (isinstance(ex, SpotifyWebApiError)) and (ex.Status in [400, 403, 404]):
+                self._playlistCache.Set(context.Uri, playlist, isNegative=True)
+            return playlist
+
+
+@callback
+def async_acquire_playstate_coordinator(
+    hass:HomeAssistant,
+    spotifyClient:SpotifyClient,
+    tokenRefresher:SpotifyPlusTokenRefresher,
+    ) -> SpotifyPlusPlayStateCoordinator:
+    """
+    Returns the shared playstate coordinator for the Spotify user account of the
+    specified client, creating it if it does not exist.
+
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        spotifyClient (SpotifyClient):
+            The SpotifyClient instance of the configuration entry.
+        tokenRefresher (SpotifyPlusTokenRefresher):
+            The token refresher of the configuration entry.
+
+    Returns:
+        The shared `SpotifyPlusPlayStateCoordinator` instance.
+
+    Every call to this method must be paired with a call to `async_release_playstate_coordinator`.
+    """
+    userId:str = spotifyClient.UserProfile.Id
+    coordinators:dict[str, SpotifyPlusPlayStateCoordinator] = hass.data.setdefault(DATA_PLAYSTATE_COORDINATORS, {})
+    coordinator:SpotifyPlusPlayStateCoordinator = coordinators.get(userId, None)
+
+    if coordinator is None:
+        _logsi.LogVerbose("Creating playstate coordinator for Spotify user id '%s'" % (userId))
+        coordinator = SpotifyPlusPlayStateCoordinator(hass, userId, spotifyClient, tokenRefresher)
+        coordinators[userId] = coordinator
+    else:
+        _logsi.LogVerbose("Sharing existing playstate coordinator for Spotify user id '%s'" % (userId))
+        coordinator._spotifyClients.append(spotifyClient)
+        coordinator._tokenRefreshers.append(tokenRefresher)
+        coordinator.Instrumentation.Install(spotifyClient)
+        coordinator.CircuitBreaker.Install(spotifyClient)
+        coordinator.RateLimiter.Install(spotifyClient)
+
+    return coordinator
+
+
+@callback
+def async_release_playstate_coordinator(
+    hass:HomeAssistant,
+    coordinator:SpotifyPlusPlayStateCoordinator,
+    spotifyClient:SpotifyClient,
+    ) -> None:
+    """
+    Releases a reference to a shared playstate coordinator that was returned by
+    `async_acquire_playstate_coordinator`; the coordinator is removed when its last
+    reference is released.
+
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        coordinator (SpotifyPlusPlayStateCoordinator):
+            The coordinator to release.
+        spotifyClient (SpotifyClient):
+            The SpotifyClient instance of the configuration entry that is being unloaded.
+    """
+    if spotifyClient in coordinator._spotifyClients:
+        idx:int = coordinator._spotifyClients.index(spotifyClient)
+        coordinator._spotifyClients.pop(idx)
+        coordinator._tokenRefreshers.pop(idx)
+        coordinator.RateLimiter.Uninstall(spotifyClient)
+        coordinator.CircuitBreaker.Uninstall(spotifyClient)
+        coordinator.Instrumentation.Uninstall(spotifyClient)
+
+    if len(coordinator._spotifyClients) == 0:
+        _logsi.LogVerbose("Removing playstate coordinator for Spotify user id '%s'" % (coordinator.UserId))
+        coordinator.CancelWakeUp()
+        coordinator.CancelBackgroundTasks()
+        coordinator.BrowseCache.Clear()
+        coordinator.Executor.Shutdown()
+        coordinators:dict = hass.data.get(DATA_PLAYSTATE_COORDINATORS, {})
+        coordinators.pop(coordinator.UserId, None)
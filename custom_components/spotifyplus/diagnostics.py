@@ -0,0 +1,173 @@
+"""Provide diagnostics for a SpotifyPlus configuration entry."""
+from typing import Any
+
+from spotifywebapipython.models import SpotifyConnectDevice, SpotifyConnectDevices
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .catalogstore import async_get_catalog_store
+from .const import DOMAIN
+from .instancedata_spotifyplus import InstanceDataSpotifyPlus
+from .utils import passwordMaskDictionary
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+import logging
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = logging.getLogger(__name__)
+
+
+async def async_get_config_entry_diagnostics(hass:HomeAssistant, entry:ConfigEntry) -> dict[str, Any]:
+    """
+    Return diagnostics for a configuration entry.
+
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        entry (ConfigEntry):
+            HomeAssistant configuration entry to return diagnostics for.
+
+    All values are taken from in-memory counters, so no Spotify Web API requests are made.
+    """
+    try:
+
+        # trace.
+        _logsi.EnterMethod(SILevel.Debug)
+
+        # create dictionary for diagnostics information.
+        diagInfo:dict[str, Any] = {}
+        diagInfo["options"] = passwordMaskDictionary(dict(entry.options))
+
+        # get integration instance data from HA datastore; if not loaded, then we are done.
+        data:InstanceDataSpotifyPlus = hass.data.get(DOMAIN, {}).get(entry.entry_id, None)
+        if (data is None) or (data.playstateCoordinator is None):
+            return diagInfo
+
+        # add playstate coordinator performance counters (poll timeline, bypass counts,
+        # foreground / background token refresh timing).
+        coordinator = data.playstateCoordinator
+        diagInfo["coordinator"] = coordinator.ToDictionary()
+
+        # add background token refresh schedule.
+        if (data.tokenRefresher is not None) and (data.tokenRefresher.NextRefreshUtc is not None):
+            diagInfo["token_next_refresh_utc"] = data.tokenRefresher.NextRefreshUtc.isoformat(timespec="seconds")
+
+        # add shared Spotify Web API request management statistics.
+        diagInfo["rate_limiter"] = coordinator.RateLimiter.ToDictionary()
+        diagInfo["circuit_breaker"] = coordinator.CircuitBreaker.ToDictionary()
+        diagInfo["instrumentation"] = coordinator.Instrumentation.ToDictionary()
+        diagInfo["executor"] = coordinator.Executor.ToDictionary()
+
+        # add cache sizes and hit rates.
+        diagInfo["caches"] = {
+            "browse_cache": _GetCacheDictionary(coordinator.BrowseCache.ToDictionary()),
+            "catalog_store": _GetCacheDictionary(async_get_catalog_store(hass).ToDictionary()),
+            "playlist_cache": _GetCacheDictionary(coordinator.PlaylistCache.ToDictionary()),
+        }
+
+        # add Spotify Connect directory state.
+        if (data.spotifyClient is not None) and (data.spotifyClient.SpotifyConnectDirectory is not None):
+            diagInfo["spotify_connect_directory"] = _GetSpotifyConnectDirectoryDictionary(data.spotifyClient.SpotifyConnectDirectory.GetDevices())
+
+        # trace.
+        _logsi.LogDictionary(SILevel.Verbose, "'%s': Diagnostics results" % entry.title, diagInfo)
+
+        # return diagnostics data.
+        return diagInfo
+
+    except Exception as ex:
+
+        # trace.
+        _logsi.LogException("'%s': async_get_config_entry_diagnostics exception: %s" % (entry.title, str(ex)), ex, logToSystemLogger=False)
+        raise
+
+    finally:
+
+        # trace.
+        _logsi.LeaveMethod(SILevel.Debug)
+
+
+async def async_get_device_diagnostics(hass:HomeAssistant, entry:ConfigEntry, device:DeviceEntry) -> dict[str, Any]:
+    """
+    Return diagnostics for a device.
+
+    Args:
+        hass (HomeAssistant):
+            HomeAssistant instance.
+        entry (ConfigEntry):
+            HomeAssistant configuration entry that the device belongs to.
+        device (DeviceEntry):
+            HomeAssistant device registry entry to return diagnostics for.
+    """
+    try:
+
+        # trace.
+        _logsi.EnterMethod(SILevel.Debug)
+
+        # create dictionary for diagnostics information.
+        diagInfo:dict[str, Any] = await async_get_config_entry_diagnostics(hass, entry)
+
+        # add media player entity performance counters and playstate.
+        data:InstanceDataSpotifyPlus = hass.data.get(DOMAIN, {}).get(entry.entry_id, None)
+        if (data is not None) and (data.media_player is not None):
+            diagInfo["media_player"] = data.media_player.GetDiagnostics()
+
+        # return diagnostics data.
+        return diagInfo
+
+    except Exception as ex:
+
+        # trace.
+        _logsi.LogException("'%s': async_get_device_diagnostics exception: %s" % (entry.title, str(ex)), ex, logToSystemLogger=False)
+        raise
+
+    finally:
+
+        # trace.
+        _logsi.LeaveMethod(SILevel.Debug)
+
+
+def _GetCacheDictionary(stats:dict[str, Any]) -> dict[str, Any]:
+    """
+    Adds the hit rate to a dictionary of cache statistics.
+
+    Args:
+        stats (dict):
+            Cache statistics, as returned by a cache `ToDictionary` method.
+    """
+    hits:int = stats.get("hits", 0) + stats.get("hits_negative", 0) + stats.get("hits_stale", 0)
+    lookups:int = hits + stats.get("misses", 0)
+    stats["hit_rate"] = round(hits / lookups, 3) if (lookups > 0) else None
+    return stats
+
+
+def _GetSpotifyConnectDirectoryDictionary(scDevices:SpotifyConnectDevices) -> dict[str, Any]:
+    """
+    Returns a summary of the Spotify Connect directory device list.
+
+    Args:
+        scDevices (SpotifyConnectDevices):
+            Spotify Connect directory device list.
+
+    Zeroconf device information is not included, as it may contain user account details.
+    """
+    devices:list[dict[str, Any]] = []
+    scDevice:SpotifyConnectDevice
+    for scDevice in scDevices:
+        devices.append({
+            "id": scDevice.Id,
+            "name": scDevice.Name,
+            "is_active": scDevice.IsActiveDevice,
+            "is_in_device_list": scDevice.IsInDeviceList,
+            "is_restricted": scDevice.IsRestricted,
+            "discovery": scDevice.DiscoveryResult.Description if (scDevice.DiscoveryResult is not None) else None,
+        })
+    return {
+        "age_last_refreshed": round(scDevices.AgeLastRefreshed, 1) if (scDevices.AgeLastRefreshed is not None) else None,
+        "device_count": scDevices.ItemsCount,
+        "devices": devices,
+    }
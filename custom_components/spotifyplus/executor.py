@@ -0,0 +1,401 @@
+"""
+Account-wide bounded executor for the SpotifyPlus component.
+
+A single executor instance is created for each Spotify user account (it is owned by the
+account's playstate coordinator).  Blocking SpotifyClient work (playstate polling, media
+browsing and searching, and service calls) is run on a small pool of dedicated worker
+threads rather than the HomeAssistant default executor, so that a busy account cannot
+starve other integrations (or other accounts) of executor threads, and vice versa.
+
+Queued jobs are started in request lane priority order (TRANSPORT, then POLL, then BULK),
+and in submission order within a lane.  BULK lane jobs can not occupy the worker threads
+that are reserved for TRANSPORT and POLL lane jobs (see `EXECUTOR_RESERVED_WORKERS`), so
+that player commands are started immediately while slow BULK work (e.g. media browsing) is
+running.  When the number of queued jobs reaches the queue limit, new BULK lane jobs are
+rejected (shed) rather than queued; TRANSPORT and POLL lane jobs are always accepted, as
+they are few in number and latency sensitive.
+
+A job that needs several independent Spotify Web API requests (e.g. a media browser node
+header and its items) can issue them in parallel with `RunConcurrently`.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from typing import Any, Callable
+
+from spotifywebapipython import SpotifyApiError
+
+from .const import EXECUTOR_FANOUT_MAX_WORKERS, EXECUTOR_RESERVED_WORKERS, LOGGER
+from .instrumentation import LatencyHistogram
+from .ratelimiter import SpotifyPlusRateLimiter, SpotifyRequestLane
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+_fanOutPool:ThreadPoolExecutor = ThreadPoolExecutor(max_workers=EXECUTOR_FANOUT_MAX_WORKERS, thread_name_prefix="spotifyplus_fanout")
+"""
+Thread pool that runs the additional calls of `RunConcurrently`.  It is separate from the
+account executors, so that a job never waits on a worker thread of its own (bounded) pool.
+"""
+
+
+def RunConcurrently(*funcs:Callable[[], Any]) -> list[Any]:
+    """
+    Calls independent blocking functions concurrently, and waits for all of them to finish.
+
+    Args:
+        *funcs (Callable):
+            Functions (taking no arguments) to call; use `functools.partial` to bind arguments.
+
+    Returns:
+        A list of the function results, in the same order as the functions.
+
+    Raises:
+        Exception:
+            The exception raised by the first failing function (in argument order), once
+            all of the functions have finished.
+
+    The first function is called on the current thread, and the others on fan-out threads.
+    Spotify Web API requests made by the fan-out threads are sent in the request lane that
+    is assigned to the current thread.
+    """
+    if (len(funcs) == 0):
+        return []
+
+    lane:SpotifyRequestLane = SpotifyPlusRateLimiter.GetCurrentLane()
+    futures:list[Future] = [_fanOutPool.submit(SpotifyPlusRateLimiter.RunInLane, lane, func) for func in funcs[1:]]
+
+    # call the first function on this thread while the others run.
+    firstResult:Any = None
+    firstException:BaseException = None
+    try:
+        firstResult = funcs[0]()
+    except BaseException as ex:
+        firstException = ex
+
+    # wait for all of the functions to finish before returning (or raising), so that no
+    # request is left running once the caller has moved on.
+    results:list[Any] = [firstResult]
+    for future in futures:
+        try:
+            results.append(future.result())
+        except BaseException as ex:
+            results.append(None)
+            if (firstException is None):
+                firstException = ex
+    if (firstException is not None):
+        raise firstException
+    return results
+
+
+class _ExecutorJob:
+    """
+    A job that is queued for execution by an executor worker thread.
+    """
+
+    __slots__ = ("Lane", "Func", "Args", "Future", "SubmittedMonotonic")
+
+    def __init__(self, lane:SpotifyRequestLane, func:Callable[..., Any], args:tuple, future:Future) -> None:
+        self.Lane:SpotifyRequestLane = lane
+        self.Func:Callable[..., Any] = func
+        self.Args:tuple = args
+        self.Future:Future = future
+        self.SubmittedMonotonic:float = time.monotonic()
+
+
+class SpotifyPlusExecutor:
+    """
+    Bounded priority thread pool, shared by all configuration entries of the same Spotify
+    user account.
+    """
+
+    def __init__(self, name:str, maxWorkers:int, queueLimit:int) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            name (str):
+                Name of the executor, for trace and worker thread naming purposes.
+            maxWorkers (int):
+                Maximum number of worker threads.
+            queueLimit (int):
+                Number of queued (not yet started) jobs at which BULK lane jobs are rejected.
+
+        Worker threads are started on demand, up to the maximum number of worker threads.
+        """
+        self._name:str = name
+        self._maxWorkers:int = max(1, maxWorkers)
+        self._queueLimit:int = max(1, queueLimit)
+        self._lock:threading.Lock = threading.Lock()
+        self._condition:threading.Condition = threading.Condition(self._lock)
+        self._queues:dict[SpotifyRequestLane, deque[_ExecutorJob]] = {lane: deque() for lane in SpotifyRequestLane}
+        self._isShutdown:bool = False
+        self._threadCount:int = 0
+        self._threadIndex:int = 0
+        self._idleCount:int = 0
+        self._submitted:dict[SpotifyRequestLane, int] = {lane: 0 for lane in SpotifyRequestLane}
+        self._rejected:dict[SpotifyRequestLane, int] = {lane: 0 for lane in SpotifyRequestLane}
+        self._runningCount:int = 0
+        self._runningBulkCount:int = 0
+        self._queueWait:dict[SpotifyRequestLane, LatencyHistogram] = {lane: LatencyHistogram() for lane in SpotifyRequestLane}
+
+
+    @property
+    def BulkLimit(self) -> int:
+        """
+        Maximum number of BULK lane jobs that can run at the same time; the remaining worker
+        threads are reserved for TRANSPORT and POLL lane jobs.
+        """
+        return max(1, self._maxWorkers - EXECUTOR_RESERVED_WORKERS)
+
+
+    @property
+    def MaxWorkers(self) -> int:
+        """
+        Maximum number of worker threads.
+        """
+        return self._maxWorkers
+
+
+    @property
+    def Name(self) -> str:
+        """
+        Name of the executor.
+        """
+        return self._name
+
+
+    @property
+    def QueueDepth(self) -> int:
+        """
+        Number of jobs (all lanes) that are queued and have not been started yet.
+        """
+        with self._lock:
+            return self._GetQueueDepth()
+
+
+    @property
+    def QueueLimit(self) -> int:
+        """
+        Number of queued jobs at which BULK lane jobs are rejected.
+        """
+        return self._queueLimit
+
+
+    def Configure(self, maxWorkers:int, queueLimit:int) -> None:
+        """
+        Changes the executor size and queue limit.
+
+        Args:
+            maxWorkers (int):
+                Maximum number of worker threads.
+            queueLimit (int):
+                Number of queued (not yet started) jobs at which BULK lane jobs are rejected.
+
+        If the size is reduced, surplus worker threads exit after they finish their current job.
+        """
+        with self._condition:
+            if (self._maxWorkers != maxWorkers) or (self._queueLimit != queueLimit):
+                _logsi.LogVerbose("'%s': Executor size set to %d worker threads, with a queue limit of %d jobs" % (self._name, maxWorkers, queueLimit))
+            self._maxWorkers = max(1, maxWorkers)
+            self._queueLimit = max(1, queueLimit)
+
+            # wake idle worker threads so that surplus threads can exit, and queued BULK lane
+            # jobs can start if the BULK limit was raised.
+            self._condition.notify_all()
+
+
+    def Submit(self, lane:SpotifyRequestLane, func:Callable[..., Any], *args:Any) -> Future:
+        """
+        Queues a blocking function for execution by a worker thread.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Job priority, and the rate limiter lane that Spotify Web API requests made
+                by the function are sent in.
+            func (Callable):
+                Function to run.
+            *args:
+                Positional arguments to pass to the function.
+
+        Returns:
+            A `concurrent.futures.Future` that resolves to the function result.
+
+        Raises:
+            SpotifyApiError:
+                If the executor is saturated and the job was shed, or the executor was shut down.
+        """
+        future:Future = Future()
+        with self._condition:
+
+            if (self._isShutdown):
+                raise SpotifyApiError("Executor '%s' has been shut down; %s lane job was not run" % (self._name, lane.name), None, logsi=_logsi)
+
+            # shed low priority work if the queue is full.
+            queueDepth:int = self._GetQueueDepth()
+            if (lane == SpotifyRequestLane.BULK) and (queueDepth >= self._queueLimit):
+                self._rejected[lane] += 1
+                _logsi.WatchInt(SILevel.Debug, "HASpotifyExecutorRejected", self._rejected[lane])
+                raise SpotifyApiError("Spotify request executor for '%s' is busy (%d jobs queued); %s lane job was not run - please try again later" % (self._name, queueDepth, lane.name), None, logsi=_logsi)
+
+            self._queues[lane].append(_ExecutorJob(lane, func, args, future))
+            self._submitted[lane] += 1
+
+            # start another worker thread if none are idle, and the pool is not at capacity.
+            # note that idle worker threads may be waiting for the BULK limit, so a thread is
+            # also started if there are more queued jobs than idle worker threads.
+            if (self._idleCount <= queueDepth) and (self._threadCount < self._maxWorkers):
+                self._threadCount += 1
+                self._threadIndex += 1
+                thread:threading.Thread = threading.Thread(target=self._Worker, name="%s_%d" % (self._name, self._threadIndex), daemon=True)
+                thread.start()
+
+            self._condition.notify_all()
+        return future
+
+
+    async def async_Run(self, lane:SpotifyRequestLane, func:Callable[..., Any], *args:Any) -> Any:
+        """
+        Runs a blocking function in a worker thread, and returns its result.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Job priority, and the rate limiter lane that Spotify Web API requests made
+                by the function are sent in.
+            func (Callable):
+                Function to run.
+            *args:
+                Positional arguments to pass to the function.
+
+        Raises:
+            SpotifyApiError:
+                If the executor is saturated and the job was shed, or the executor was shut down.
+
+        If the awaiting task is cancelled before the job starts, then the job is not run.
+        """
+        return await asyncio.wrap_future(self.Submit(lane, func, *args))
+
+
+    def Shutdown(self) -> None:
+        """
+        Stops accepting jobs, cancels queued jobs, and stops the worker threads once their
+        current job is finished.  This method does not wait for running jobs to finish.
+        """
+        with self._condition:
+            if (self._isShutdown):
+                return
+            self._isShutdown = True
+
+            # take the jobs that have not been started yet.
+            jobs:list[_ExecutorJob] = []
+            for jobQueue in self._queues.values():
+                jobs.extend(jobQueue)
+                jobQueue.clear()
+
+            # wake the worker threads so that they can exit.
+            self._condition.notify_all()
+
+        # cancel the jobs that have not been started yet.
+        for job in jobs:
+            job.Future.cancel()
+
+
+    def _GetNextJob(self) -> _ExecutorJob | None:
+        """
+        Removes and returns the highest priority job that can be started, or None if there is
+        no job that can be started.  The executor lock must be held by the caller.
+
+        A BULK lane job can not be started while the BULK limit is reached.
+        """
+        lane:SpotifyRequestLane
+        for lane in SpotifyRequestLane:
+            jobQueue:deque[_ExecutorJob] = self._queues[lane]
+            if (len(jobQueue) == 0):
+                continue
+            if (lane == SpotifyRequestLane.BULK) and (self._runningBulkCount >= self.BulkLimit):
+                continue
+            return jobQueue.popleft()
+        return None
+
+
+    def _GetQueueDepth(self) -> int:
+        """
+        Returns the number of jobs (all lanes) that are queued and have not been started yet.
+        The executor lock must be held by the caller.
+        """
+        return sum(len(jobQueue) for jobQueue in self._queues.values())
+
+
+    def _Worker(self) -> None:
+        """
+        Worker thread main loop.
+        """
+        while True:
+
+            with self._condition:
+
+                # wait for a job that can be started.
+                job:_ExecutorJob = None
+                while (job is None):
+
+                    # exit if shutting down, or if the pool was made smaller.
+                    if (self._isShutdown) or (self._threadCount > self._maxWorkers):
+                        self._threadCount -= 1
+                        return
+
+                    job = self._GetNextJob()
+                    if (job is None):
+                        self._idleCount += 1
+                        self._condition.wait()
+                        self._idleCount -= 1
+
+                self._queueWait[job.Lane].Record(time.monotonic() - job.SubmittedMonotonic, False)
+
+                # was the job cancelled while it was queued?  if so, then don't run it.
+                if (not job.Future.set_running_or_notify_cancel()):
+                    continue
+
+                self._runningCount += 1
+                if (job.Lane == SpotifyRequestLane.BULK):
+                    self._runningBulkCount += 1
+
+            try:
+                job.Future.set_result(SpotifyPlusRateLimiter.RunInLane(job.Lane, job.Func, *job.Args))
+            except BaseException as ex:
+                job.Future.set_exception(ex)
+            finally:
+                with self._condition:
+                    self._runningCount -= 1
+                    if (job.Lane == SpotifyRequestLane.BULK):
+                        self._runningBulkCount -= 1
+
+                    # a queued BULK lane job may be waiting for the BULK limit.
+                    self._condition.notify_all()
+            job = None
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of executor statistics, suitable for diagnostics output.
+        """
+        with self._lock:
+            return {
+                "max_workers": self._maxWorkers,
+                "bulk_limit": self.BulkLimit,
+                "queue_limit": self._queueLimit,
+                "threads": self._threadCount,
+                "running": self._runningCount,
+                "running_bulk": self._runningBulkCount,
+                "queue_depth": {lane.name.lower(): len(jobQueue) for lane, jobQueue in self._queues.items()},
+                "submitted": {lane.name.lower(): count for lane, count in self._submitted.items()},
+                "rejected": {lane.name.lower(): count for lane, count in self._rejected.items()},
+                "queue_wait": {lane.name.lower(): histogram.ToDictionary() for lane, histogram in self._queueWait.items()},
+            }
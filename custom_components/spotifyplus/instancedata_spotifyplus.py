@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from types import MappingProxyType
 from typing import Any
-import threading
 
 from spotifywebapipython import SpotifyClient
 from spotifywebapipython.models import SpotifyConnectDevices
@@ -17,15 +16,27 @@ from .const import (
     CONF_OPTION_DEVICE_LOGINID,
     CONF_OPTION_DEVICE_PASSWORD,
     CONF_OPTION_DEVICE_USERNAME,
+    CONF_OPTION_EXECUTOR_MAX_WORKERS,
+    CONF_OPTION_EXECUTOR_QUEUE_LIMIT,
+    CONF_OPTION_METRICS_ENABLED,
     CONF_OPTION_SCRIPT_TURN_OFF,
     CONF_OPTION_SCRIPT_TURN_ON,
     CONF_OPTION_SOURCE_LIST_HIDE,
     CONF_OPTION_SPOTIFY_SCAN_INTERVAL,
+    CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE,
+    CONF_OPTION_TOKEN_REFRESH_MARGIN,
     CONF_OPTION_TURN_OFF_AUTO_PAUSE,
     CONF_OPTION_TURN_ON_AUTO_RESUME,
     CONF_OPTION_TURN_ON_AUTO_SOURCE_SELECT,
+    DEFAULT_OPTION_EXECUTOR_MAX_WORKERS,
+    DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT,
     DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL,
+    DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE,
+    DEFAULT_OPTION_TOKEN_REFRESH_MARGIN,
 )
+from .coordinator import SpotifyPlusPlayStateCoordinator
+from .tokenrefresher import SpotifyPlusTokenRefresher
+from .ttlcache import TtlCache
 
 @dataclass
 class InstanceDataSpotifyPlus:
@@ -47,6 +58,18 @@ class InstanceDataSpotifyPlus:
     Configuration entry options.
     """
 
+    playlistCache: TtlCache
+    """
+    Cache of context playlist details (keyed by context uri) that is shared by all 
+    configuration entries of the same Spotify user account.
+    """
+
+    playstateCoordinator: SpotifyPlusPlayStateCoordinator
+    """
+    The playstate coordinator that is shared by all configuration entries of the
+    same Spotify user account.
+    """
+
     session: OAuth2Session
     """
     The OAuth2 session used to communicate with the Spotify Web API.
@@ -57,9 +80,10 @@ class InstanceDataSpotifyPlus:
     The SpotifyClient instance used to interface with the Spotify Web API.
     """
 
-    tokenUpdater_lock: threading.Lock
+    tokenRefresher: SpotifyPlusTokenRefresher
     """
-    Thread Lock object used to lock token refresh updates.
+    Performs OAuth2 session token refreshes (one at a time), and refreshes the token in
+    the background before it expires.
     """
 
     runtime_data: dict
@@ -108,6 +132,30 @@ class InstanceDataSpotifyPlus:
         """
         return self.options.get(CONF_OPTION_DEVICE_USERNAME, None)
 
+    @property
+    def OptionExecutorMaxWorkers(self) -> int:
+        """
+        Number of worker threads that run Spotify Web API requests for the Spotify user account.
+        Defaults to 4 if not set.
+        """
+        return self.options.get(CONF_OPTION_EXECUTOR_MAX_WORKERS, None) or DEFAULT_OPTION_EXECUTOR_MAX_WORKERS
+
+    @property
+    def OptionExecutorQueueLimit(self) -> int:
+        """
+        Number of queued Spotify Web API jobs at which low priority jobs are rejected.
+        Defaults to 32 if not set.
+        """
+        return self.options.get(CONF_OPTION_EXECUTOR_QUEUE_LIMIT, None) or DEFAULT_OPTION_EXECUTOR_QUEUE_LIMIT
+
+    @property
+    def OptionMetricsEnabled(self) -> bool:
+        """
+        Record Spotify Web API and entry point latency metrics (True) or not (False) for
+        diagnostics output (disabled by default).
+        """
+        return self.options.get(CONF_OPTION_METRICS_ENABLED, False)
+
     @property
     def OptionSpotifyScanInterval(self) -> int:
         """
@@ -116,6 +164,29 @@ class InstanceDataSpotifyPlus:
         """
         return self.options.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL, DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL)
 
+    @property
+    def OptionSpotifyScanIntervalIdle(self) -> list[int]:
+        """
+        The list of progressively longer scan intervals (in seconds) to use when querying 
+        Spotify Player for current playstate while the player is paused or idle.
+        Defaults to 120 and 600 (seconds) if not set; an empty list disables the backoff.
+        """
+        result:list[int] = []
+
+        # get option value.
+        value:str = self.options.get(CONF_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE, None)
+        if value is None:
+            value = DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL_IDLE
+
+        # build a list from the semi-colon delimited string; a zero value disables the backoff.
+        for item in str(value).split(';'):
+            item = item.strip()
+            if item.isdigit() and (int(item) > 0):
+                result.append(int(item))
+
+        # return result.
+        return result
+
     @property
     def OptionScriptTurnOff(self) -> str | None:
         """
@@ -149,6 +220,15 @@ class InstanceDataSpotifyPlus:
         # return result.
         return result
 
+    @property
+    def OptionTokenRefreshMargin(self) -> int:
+        """
+        Time interval (in seconds) before the authorization token expires that it is
+        refreshed in the background.
+        Defaults to 300 (seconds) if not set.
+        """
+        return self.options.get(CONF_OPTION_TOKEN_REFRESH_MARGIN, None) or DEFAULT_OPTION_TOKEN_REFRESH_MARGIN
+
     @property
     def OptionTurnOffAutoPause(self) -> bool:
         """
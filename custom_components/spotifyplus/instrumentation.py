@@ -0,0 +1,309 @@
+"""
+Per-call latency and outcome instrumentation for the SpotifyPlus component.
+
+A single instrumentation instance is created for each Spotify user account (it is owned by
+the account's playstate coordinator).  It records the number of calls, the number of failed
+calls, and a latency histogram for every Spotify Web API endpoint (keyed by SpotifyClient
+method name) and for every integration entry point (playstate updates, media browsing and
+searching, media player commands and service calls).
+
+Instrumentation is disabled by default; while disabled, a measurement costs a single flag
+check, so it can be left wired into every call path.
+"""
+from __future__ import annotations
+
+from contextlib import nullcontext
+from enum import StrEnum
+import threading
+import time
+from typing import Any
+
+from spotifywebapipython import SpotifyClient
+
+from .utils import restoreInstanceAttribute
+
+# latency histogram bucket upper bounds (in milliseconds); the last bucket is unbounded.
+LATENCY_BUCKETS_MS:tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# measurement returned while instrumentation is disabled.
+_NO_MEASUREMENT:nullcontext = nullcontext()
+
+
+class InstrumentationCategory(StrEnum):
+    """
+    Instrumentation measurement categories.
+    """
+
+    ENDPOINT = "endpoint"
+    """ Outbound Spotify Web API request, keyed by SpotifyClient method name. """
+
+    ENTRY_POINT = "entry_point"
+    """ Integration entry point (update, browse, search, command, service). """
+
+
+class LatencyHistogram:
+    """
+    Call count, error count, and latency distribution of a single measurement key.
+    """
+
+    __slots__ = ("Count", "ErrorCount", "TotalSeconds", "MaxSeconds", "_buckets")
+
+    def __init__(self) -> None:
+        self.Count:int = 0
+        self.ErrorCount:int = 0
+        self.TotalSeconds:float = 0
+        self.MaxSeconds:float = 0
+        self._buckets:list[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+
+    def Record(self, elapsedSecs:float, isError:bool) -> None:
+        """
+        Records a single call.
+
+        Args:
+            elapsedSecs (float):
+                Call duration (in seconds).
+            isError (bool):
+                True if the call failed; otherwise, False.
+        """
+        self.Count += 1
+        if isError:
+            self.ErrorCount += 1
+        self.TotalSeconds += elapsedSecs
+        if (elapsedSecs > self.MaxSeconds):
+            self.MaxSeconds = elapsedSecs
+
+        elapsedMS:float = elapsedSecs * 1000
+        idx:int = 0
+        for bound in LATENCY_BUCKETS_MS:
+            if (elapsedMS <= bound):
+                break
+            idx += 1
+        self._buckets[idx] += 1
+
+
+    def Percentile(self, percent:float) -> float:
+        """
+        Returns the estimated latency (in milliseconds) at the specified percentile.
+
+        Args:
+            percent (float):
+                Percentile to estimate (e.g. 95).
+
+        The estimate is linearly interpolated within the histogram bucket that contains the
+        percentile, and is capped at the maximum recorded latency.
+        """
+        if (self.Count == 0):
+            return 0
+        rank:float = self.Count * percent / 100
+        cumulative:int = 0
+        lowerMS:float = 0
+        maxMS:float = self.MaxSeconds * 1000
+        for idx, bucketCount in enumerate(self._buckets):
+            upperMS:float = LATENCY_BUCKETS_MS[idx] if (idx < len(LATENCY_BUCKETS_MS)) else maxMS
+            if (bucketCount > 0) and (cumulative + bucketCount >= rank):
+                result:float = lowerMS + (upperMS - lowerMS) * ((rank - cumulative) / bucketCount)
+                return min(result, maxMS)
+            cumulative += bucketCount
+            lowerMS = upperMS
+        return maxMS
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of statistics, suitable for diagnostics output.
+        """
+        return {
+            "count": self.Count,
+            "errors": self.ErrorCount,
+            "avg_ms": round(self.TotalSeconds * 1000 / self.Count, 1) if (self.Count > 0) else 0,
+            "p50_ms": round(self.Percentile(50), 1),
+            "p95_ms": round(self.Percentile(95), 1),
+            "p99_ms": round(self.Percentile(99), 1),
+            "max_ms": round(self.MaxSeconds * 1000, 1),
+        }
+
+
+class _Measurement:
+    """
+    Context manager that measures a single call while instrumentation is enabled.
+    """
+
+    __slots__ = ("_instrumentation", "_category", "_key", "_startTime")
+
+    def __init__(self, instrumentation:SpotifyPlusInstrumentation, category:InstrumentationCategory, key:str) -> None:
+        self._instrumentation:SpotifyPlusInstrumentation = instrumentation
+        self._category:InstrumentationCategory = category
+        self._key:str = key
+        self._startTime:float = 0
+
+
+    def __enter__(self) -> _Measurement:
+        self._startTime = time.perf_counter()
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback) -> bool:
+        self._instrumentation.Record(self._category, self._key, time.perf_counter() - self._startTime, excType is not None)
+        return False
+
+
+class SpotifyPlusInstrumentation:
+    """
+    Latency and outcome instrumentation that is shared by all SpotifyClient instances of
+    the same Spotify user account.
+    """
+
+    def __init__(self, name:str) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            name (str):
+                Name of the instrumentation instance, for trace purposes.
+        """
+        self._name:str = name
+        self._enabled:bool = False
+        self._lock:threading.Lock = threading.Lock()
+        self._histograms:dict[InstrumentationCategory, dict[str, LatencyHistogram]] = {category: {} for category in InstrumentationCategory}
+        self._startedMonotonic:float = time.monotonic()
+        self._previousMethods:dict[int, Any] = {}
+
+
+    @property
+    def Enabled(self) -> bool:
+        """
+        True if measurements are recorded; otherwise, False.
+        """
+        return self._enabled
+
+    @Enabled.setter
+    def Enabled(self, value:bool):
+        """
+        Sets the Enabled property value.
+        """
+        if (value == True) and (not self._enabled):
+            self._startedMonotonic = time.monotonic()
+        self._enabled = (value == True)
+
+
+    @property
+    def Name(self) -> str:
+        """
+        Name of the instrumentation instance.
+        """
+        return self._name
+
+
+    def Measure(self, category:InstrumentationCategory, key:str) -> _Measurement | nullcontext:
+        """
+        Returns a context manager that measures the duration and outcome of the code it wraps.
+
+        Args:
+            category (InstrumentationCategory):
+                Measurement category.
+            key (str):
+                Measurement key (e.g. endpoint or entry point name).
+
+        A call is recorded as an error if the wrapped code raises an exception.
+        """
+        if not self._enabled:
+            return _NO_MEASUREMENT
+        return _Measurement(self, category, key)
+
+
+    def Record(self, category:InstrumentationCategory, key:str, elapsedSecs:float, isError:bool) -> None:
+        """
+        Records a single call.
+
+        Args:
+            category (InstrumentationCategory):
+                Measurement category.
+            key (str):
+                Measurement key (e.g. endpoint or entry point name).
+            elapsedSecs (float):
+                Call duration (in seconds).
+            isError (bool):
+                True if the call failed; otherwise, False.
+        """
+        with self._lock:
+            histograms:dict[str, LatencyHistogram] = self._histograms[category]
+            histogram:LatencyHistogram = histograms.get(key, None)
+            if (histogram is None):
+                histogram = LatencyHistogram()
+                histograms[key] = histogram
+            histogram.Record(elapsedSecs, isError)
+
+
+    def Reset(self) -> None:
+        """
+        Discards all recorded measurements.
+        """
+        with self._lock:
+            for histograms in self._histograms.values():
+                histograms.clear()
+            self._startedMonotonic = time.monotonic()
+
+
+    def Install(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Installs the instrumentation on a SpotifyClient instance, so that every Spotify Web
+        API request made by the client is measured.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance to install the instrumentation on.
+
+        The client `MakeRequest` method is overridden on the instance (not the class), so other
+        SpotifyClient instances are unaffected.  The instrumentation must be installed before
+        the circuit breaker and rate limiter, so that only the time spent waiting on Spotify
+        is measured.
+        """
+        clientMakeRequest = spotifyClient.MakeRequest
+
+        # save the instance method (if any) of a previously installed wrapper, for uninstall.
+        self._previousMethods[id(spotifyClient)] = spotifyClient.__dict__.get("MakeRequest", None)
+
+        def MakeRequest(method, msg):
+
+            if not self._enabled:
+                return clientMakeRequest(method, msg)
+
+            startTime:float = time.perf_counter()
+            isError:bool = True
+            try:
+                result = clientMakeRequest(method, msg)
+                isError = False
+                return result
+            finally:
+                self.Record(InstrumentationCategory.ENDPOINT, msg.MethodName or method, time.perf_counter() - startTime, isError)
+
+        spotifyClient.MakeRequest = MakeRequest
+
+
+    def Uninstall(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Removes the instrumentation from a SpotifyClient instance that it was installed on.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance to remove the instrumentation from.
+
+        The methods that were installed on the instance before this one are restored, so
+        stacked wrappers must be uninstalled in the reverse order that they were installed.
+        """
+        restoreInstanceAttribute(spotifyClient, "MakeRequest", self._previousMethods.pop(id(spotifyClient), None))
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of recorded measurements, suitable for diagnostics output.
+        """
+        with self._lock:
+            result:dict[str, Any] = {
+                "enabled": self._enabled,
+                "measured_seconds": round(time.monotonic() - self._startedMonotonic),
+            }
+            for category, histograms in self._histograms.items():
+                result[category.value] = {key: histograms[key].ToDictionary() for key in sorted(histograms)}
+            return result
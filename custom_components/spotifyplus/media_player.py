@@ -12,11 +12,13 @@ from __future__ import annotations
 
 import datetime as dt
 from datetime import timedelta, datetime
+from functools import partial
+import time
 from pprint import pformat
 from typing import Any, Callable, Concatenate, ParamSpec, TypeVar, Tuple
 from yarl import URL
 
-from spotifywebapipython import SpotifyClient, SpotifyDiscovery, SpotifyApiError, SpotifyMediaTypes, SpotifyWebApiError
+from spotifywebapipython import SpotifyDiscovery, SpotifyApiError, SpotifyMediaTypes, SpotifyWebApiError
 from spotifywebapipython.zeroconfapi import *
 from spotifywebapipython.models import (
     Album,
@@ -31,7 +33,6 @@ from spotifywebapipython.models import (
     Category,
     CategoryPage,
     Chapter,
-    Context, 
     Device as PlayerDevice, 
     Episode, 
     EpisodePageSaved,
@@ -74,7 +75,7 @@ from homeassistant.components.media_player import (
     SearchMediaQuery,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, IntegrationError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType
@@ -95,6 +96,10 @@ from .search_media import (
     search_media_node,
 )
 from .instancedata_spotifyplus import InstanceDataSpotifyPlus
+from .catalogstore import SpotifyPlusCatalogStore, async_get_catalog_store
+from .coalescer import SpotifyPlusCommandCoalescer
+from .instrumentation import InstrumentationCategory
+from .ratelimiter import SpotifyPlusRateLimiter, SpotifyRequestLane
 from .const import (
     ATTR_SPOTIFYPLUS_ARTIST_URI,
     ATTR_SPOTIFYPLUS_CONTEXT_URI,
@@ -125,6 +130,10 @@ from .const import (
     DOMAIN, 
     DOMAIN_SCRIPT,
     LOGGER,
+    SPOTIFY_SCAN_INTERVAL_COMMAND,
+    SPOTIFY_SCAN_INTERVAL_IDLE_STEP_SCANS,
+    SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART,
+    SPOTIFY_SCAN_VERIFY_DELAY,
     TOKEN_EXPIRE_REASON,
 )
 from .utils import (
@@ -156,33 +165,16 @@ ATTRVALUE_NO_DEVICE = "no_device"
 ATTRVALUE_UNKNOWN = "unknown"
 ATTRVALUE_NOT_SET = "notset"
 
+# playstate change detection progress bucket size (in seconds); progress values that
+# deviate from the expected play position by less than this are not considered a change.
+PLAYSTATE_PROGRESS_BUCKET_SECONDS:int = 2
+
 # annotate the `spotify_exception_handler` callable.
 _SpotifyMediaPlayerT = TypeVar("_SpotifyMediaPlayerT", bound="SpotifyMediaPlayer")
 _R = TypeVar("_R")
 _P = ParamSpec("_P")
 
 
-SCAN_INTERVAL = timedelta(seconds=1)
-""" 
-Time interval (in seconds) for HA to scan for status updates. 
-Note that the Spotify Web API does not get called every time HA update method is called
-though; check update method for logic that controls this.
-"""
-
-SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART:int = 3
-""" 
-Time interval (in seconds) to scan spotify connect player for updates
-due to a track ending / starting.
-"""
-
-SPOTIFY_SCAN_INTERVAL_COMMAND:int = 5
-""" 
-Time interval (in seconds) to scan spotify connect player for updates
-due to a player command.  This gives the Spotify Connect Player time to
-update its PlayState status (5 seconds).
-"""
-
-
 REPEAT_MODE_MAPPING_TO_HA = {
     "context": RepeatMode.ALL,
     "off": RepeatMode.OFF,
@@ -228,7 +220,9 @@ async def async_setup_entry(hass:HomeAssistant, entry:ConfigEntry, async_add_ent
 
         # add all entities to Home Assistant.
         _logsi.LogVerbose("'%s': MediaPlayer async_setup_entry is adding SpotifyMediaPlayer instance entities to Home Assistant" % entry.title)
-        async_add_entities([media_player], True)
+        # note that we do not request an update before add, as the playstate coordinator
+        # will query player state once the entity subscribes to it.
+        async_add_entities([media_player], False)
 
         # store the reference to the media player object.
         _logsi.LogVerbose("'%s': MediaPlayer async_setup_entry is storing the SpotifyMediaPlayer reference to hass.data[DOMAIN]" % entry.title)
@@ -265,10 +259,13 @@ def spotify_exception_handler(
 
             # indicate we are in a command event.
             self._isInCommandEvent = True
+            SpotifyPlusCommandCoalescer.WasCoalesced()
             _logsi.WatchDateTime(SILevel.Debug, "HASpotifyCommandEventLastDT", datetime.now())
 
-            # call the function.
-            result = func(self, *args, **kwargs)
+            # call the function; requests are sent in the transport lane of the rate limiter.
+            with SpotifyPlusRateLimiter.Lane(SpotifyRequestLane.TRANSPORT), \
+                 self.data.playstateCoordinator.Instrumentation.Measure(InstrumentationCategory.ENTRY_POINT, func.__name__):
+                result = func(self, *args, **kwargs)
             
             # do not update HA state in this handler!  doing so causes UI buttons
             # pressed to "toggle" between states.  the "self.schedule_update_ha_state(force_refresh=False)" 
@@ -293,8 +290,10 @@ def spotify_exception_handler(
             self._isInCommandEvent = False
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            # this is not necessary if the command was coalesced into another command's request.
+            if not SpotifyPlusCommandCoalescer.WasCoalesced():
+                _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+                self._TriggerVerificationScan()
 
     return wrapper
 
@@ -327,15 +326,24 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # initialize instance storage.
             self._id = data.spotifyClient.UserProfile.Id
             self._spotifyScanInterval = DEFAULT_OPTION_SPOTIFY_SCAN_INTERVAL
+            self._spotifyScanIntervalIdle:list[int] = []
+            self._scanBackoffStep:int = 0
+            self._scanBackoffScans:int = 0
             self._playlist:Playlist = None
-            self._lastMediaPlayedPosition:int = 0
             self.data = data
-            self._currentScanInterval:int = 0
-            self._commandScanInterval:int = 0
-            self._lastKnownTimeRemainingSeconds:int = 0
-            self._playTimeRemainingEst:int = 0
+            self._mediaPositionMonotonic:float = None
             self._isInCommandEvent:bool = False
-            self._isInUpdateEvent:bool = False
+            self._optimisticState:dict[str, Any] = None
+            self._optimisticVerifyMonotonic:float = None
+            self._unsubscribeCoordinator:Callable[[], None] = None
+            self._commandCoalescer:SpotifyPlusCommandCoalescer = SpotifyPlusCommandCoalescer("%s_commands" % self._id)
+            self._playStateFingerprint:tuple = None
+            self._stateWritesPerformed:int = 0
+            self._stateWritesSkipped:int = 0
+            self._updatesBypassedCommandEvent:int = 0
+            self._stateAttributesVersion:int = 0
+            self._stateAttributesCache:dict = None
+            self._stateAttributesCacheVersion:int = -1
             self._source_at_poweroff:str = None
             self._source_at_poweron:str = None
             self._volume_level_saved:float = None
@@ -422,13 +430,14 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
                                               | MediaPlayerEntityFeature.TURN_OFF \
                                               | MediaPlayerEntityFeature.TURN_ON
 
-            # we will (by default) set polling to true, as the SpotifyClient does not support websockets
-            # for player update notifications.
-            _logsi.LogVerbose("'%s': MediaPlayer device polling is being enabled, as the device does not support websockets" % self.name)
-            self._attr_should_poll = True
+            # we will set polling to false, as player state updates are pushed to us by the
+            # playstate coordinator that is shared by all entities of the same Spotify user account.
+            _logsi.LogVerbose("'%s': MediaPlayer device polling is being disabled, as updates are provided by the playstate coordinator" % self.name)
+            self._attr_should_poll = False
 
-            # set scan interval based on configuration options.
+            # set scan intervals based on configuration options.
             self._spotifyScanInterval = data.OptionSpotifyScanInterval
+            self._spotifyScanIntervalIdle = data.OptionSpotifyScanIntervalIdle
         
             # disable turn on / off features based on configuration options.
             if data.OptionAlwaysOn:
@@ -463,6 +472,39 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """ Return entity specific state attributes. """
+        # rebuild the cached attributes if anything they depend on has changed since they 
+        # were last built; otherwise, use the cached attributes.
+        if (self._stateAttributesCache is None) or (self._stateAttributesCacheVersion != self._stateAttributesVersion):
+            self._stateAttributesCache = self._BuildStateAttributes()
+            self._stateAttributesCacheVersion = self._stateAttributesVersion
+
+        # overlay the time-dependent attributes on a copy of the cached attributes.
+        attributes = dict(self._stateAttributesCache)
+
+        # add estimated play time remaining (if media position and duration are present).
+        playTimeRemainingEst:int = self._GetPlayTimeRemainingEst()
+        if (playTimeRemainingEst is not None):
+            # only update the state value with real-time info if in the last scan interval;
+            # otherwise, we will use the difference of the duration minus the last known position.
+            if (playTimeRemainingEst <= self._spotifyScanInterval):
+                if (self._attr_state == MediaPlayerState.PLAYING):
+                    _logsi.LogVerbose("'%s': Estimated play time remaining is %s seconds; in last interval window" % (self.name, playTimeRemainingEst))
+                attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] = playTimeRemainingEst
+            else:
+                attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] = int(self._attr_media_duration - self._attr_media_position)
+
+        # return to caller.
+        return attributes
+
+
+    def _BuildStateAttributes(self) -> dict:
+        """ 
+        Builds the entity specific state attributes that only change when the playstate,
+        playlist, or device changes (e.g. everything but the time-dependent attributes).
+
+        The result is cached by the `extra_state_attributes` property until the
+        `_InvalidateStateAttributes` method is called.
+        """
         # build list of our extra state attributes to return to HA UI.
         attributes = {}
         attributes[ATTR_SPOTIFYPLUS_DEVICE_ID] = ATTRVALUE_NO_DEVICE
@@ -540,17 +582,6 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             attributes[ATTR_SPOTIFYPLUS_PLAYLIST_URI] = self._playlist.Uri
             attributes['media_playlist_content_id'] = self._playlist.Uri
 
-        # add estimated play time remaining (if media position and duration are present).
-        if (self._attr_media_position is not None) and (self._attr_media_duration is not None):
-            # only update the state value with real-time info if in the last scan interval;
-            # otherwise, we will use the difference of the duration minus the last known position.
-            if (self._playTimeRemainingEst <= self._spotifyScanInterval):
-                if (self._attr_state == MediaPlayerState.PLAYING):
-                    _logsi.LogVerbose("'%s': Estimated play time remaining is %s seconds; in last interval window" % (self.name, self._playTimeRemainingEst))
-                attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] = self._playTimeRemainingEst
-            else:
-                attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] = int(self._attr_media_duration - self._attr_media_position)
-
         # add userprofile information.
         if self.data.spotifyClient is not None:
             profile:UserProfile = self.data.spotifyClient.UserProfile
@@ -567,6 +598,26 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         return attributes
 
 
+    def _InvalidateStateAttributes(self) -> None:
+        """
+        Indicates that the cached entity specific state attributes need to be rebuilt the 
+        next time they are requested.
+
+        This should be called whenever the playstate, playlist, or device values that the 
+        state attributes are built from are changed.
+        """
+        self._stateAttributesVersion = self._stateAttributesVersion + 1
+
+
+    @property
+    def available(self) -> bool:
+        """ 
+        Return True if the Spotify Web API is available for the account; otherwise, False
+        if the account circuit breaker is open due to repeated Spotify Web API failures.
+        """
+        return self.data.playstateCoordinator.CircuitBreaker.IsAvailable
+
+
     @property
     def state(self) -> MediaPlayerState:
         """ Return the playback state. """
@@ -742,6 +793,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         
         # update ha state.
         self._attr_state = MediaPlayerState.PLAYING
+        self._SetOptimisticState(state=MediaPlayerState.PLAYING)
         self.schedule_update_ha_state(force_refresh=False)
 
         # call Spotify Web API to process the request.
@@ -756,6 +808,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         
         # update ha state.
         self._attr_state = MediaPlayerState.PAUSED
+        self._SetOptimisticState(state=MediaPlayerState.PAUSED)
         self.schedule_update_ha_state(force_refresh=False)
         
         # call Spotify Web API to process the request.
@@ -789,13 +842,12 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         _logsi.LogVerbose(STAppMessages.MSG_MEDIAPLAYER_SERVICE_WITH_PARMS, self.name, "media_seek", "position='%s'" % (position))
 
         # update ha state.
-        self._attr_media_position = int(position)
-        self._attr_media_position_updated_at = utcnow().replace(microsecond=0)
+        self._SetMediaPosition(int(position * 1000))
         self.schedule_update_ha_state(force_refresh=False)
         
-        # call Spotify Web API to process the request.
+        # call Spotify Web API to process the request; rapid seeks are coalesced into the last position.
         _logsi.LogVerbose("'%s': Issuing command to Spotify Player: SEEK (position=%s)" % (self.name, position))
-        self.data.spotifyClient.PlayerMediaSeek(int(position * 1000), deviceId=self._attr_source)
+        self._commandCoalescer.Submit(("seek", self._attr_source), self.data.spotifyClient.PlayerMediaSeek, int(position * 1000), self._attr_source)
         
 
     @spotify_exception_handler
@@ -964,6 +1016,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
         # update ha state.
         self._attr_shuffle = shuffle
+        self._SetOptimisticState(shuffle=shuffle)
         self.schedule_update_ha_state(force_refresh=False)
         
         # set shuffle mode.
@@ -979,6 +1032,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         if repeat not in REPEAT_MODE_MAPPING_TO_SPOTIFY:
             raise ServiceValidationError(f"Unsupported repeat mode: {repeat}")
         self._attr_repeat = repeat
+        self._SetOptimisticState(repeat=repeat)
         self.schedule_update_ha_state(force_refresh=False)
 
         # set repeat mode.
@@ -996,10 +1050,11 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
         # update ha state.
         self._attr_volume_level = volume
+        self._SetOptimisticState(volume_level=float(int(volume * 100) / 100))
         self.schedule_update_ha_state(force_refresh=False)
 
-        # call Spotify Web API to process the request.
-        self.data.spotifyClient.PlayerSetVolume(int(volume * 100), deviceId=self._attr_source)
+        # call Spotify Web API to process the request; rapid volume changes are coalesced into the last level.
+        self._commandCoalescer.Submit(("volume", self._attr_source), self.data.spotifyClient.PlayerSetVolume, int(volume * 100), self._attr_source)
 
 
     @spotify_exception_handler
@@ -1075,6 +1130,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
             # get current Spotify Connect device player state.
             self._playerState = self.data.spotifyClient.GetDevicePlaybackState(deviceId=self._attr_source)
+            self._InvalidateStateAttributes()
 
             # are we automatically selecting a source at turn on?
             if (self.data.OptionTurnOnAutoSelectSource):
@@ -1158,12 +1214,328 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             _logsi.LeaveMethod(SILevel.Debug)
 
 
-    def update(self) -> None:
-        """ Update state and attributes. """
+    async def async_update(self) -> None:
+        """
+        Update state and attributes.
 
-        # trace.
-        _logsi.WatchDateTime(SILevel.Debug, "HASpotifyUpdateLastDT", datetime.now())
-        
+        This is only called when an entity update is explicitly requested (e.g. via the 
+        `homeassistant.update_entity` service), as the entity does not poll.  It requests 
+        an immediate playstate scan from the playstate coordinator.
+        """
+        await self.data.playstateCoordinator.async_ScanNow()
+
+
+    def _TriggerScanWindow(self, scanCount:int) -> None:
+        """
+        Forces a playstate scan window for the next `scanCount` scan intervals.
+
+        Args:
+            scanCount (int):
+                Number of consecutive scan intervals to query Spotify for player playstate.
+
+        This is called after a player command is processed.  The last written playstate 
+        fingerprint is also cleared, since the command may have updated HA state directly; 
+        this ensures the next coordinator update is written.
+        """
+        self._playStateFingerprint = None
+        self._ResetScanBackoff()
+        self.data.playstateCoordinator.TriggerScanWindow(scanCount)
+
+
+    def _TriggerVerificationScan(self) -> None:
+        """
+        Forces a single playstate scan after `SPOTIFY_SCAN_VERIFY_DELAY` seconds, to verify
+        the expected state of a processed player command.
+
+        The last written playstate fingerprint is also cleared, since the command may have 
+        updated HA state directly; this ensures the verification update is written.
+        """
+        self._playStateFingerprint = None
+        self._ResetScanBackoff()
+        self._optimisticVerifyMonotonic = time.monotonic() + SPOTIFY_SCAN_VERIFY_DELAY
+        self.data.playstateCoordinator.TriggerVerificationScan(SPOTIFY_SCAN_VERIFY_DELAY)
+
+
+    def _SetOptimisticState(self, **expected:Any) -> None:
+        """
+        Records the expected state of a player command that was optimistically applied to
+        the entity attributes.
+
+        Args:
+            **expected (Any):
+                Expected values, keyed by entity attribute name without the `_attr_` prefix
+                (e.g. `state=MediaPlayerState.PAUSED`, `shuffle=True`).
+
+        Until the command verification scan occurs, coordinator updates that contradict the 
+        expected values are masked, so that the UI does not flicker back to the previous state 
+        while Spotify catches up.  The verification scan then confirms the expected values, or 
+        rolls them back to the values reported by Spotify.
+        """
+        optimisticState:dict[str, Any] = dict(self._optimisticState or {})
+        optimisticState.update(expected)
+        self._optimisticState = optimisticState
+        self._optimisticVerifyMonotonic = time.monotonic() + SPOTIFY_SCAN_VERIFY_DELAY
+
+
+    def _ReconcileOptimisticState(self) -> None:
+        """
+        Reconciles optimistically applied player command state with a coordinator update.
+        """
+        optimisticState:dict[str, Any] = self._optimisticState
+        if (optimisticState is None):
+            return
+
+        # did Spotify report the expected values?  if so, then the command is confirmed.
+        mismatches:dict[str, Any] = {}
+        for name, value in optimisticState.items():
+            if (getattr(self, "_attr_%s" % name) != value):
+                mismatches[name] = getattr(self, "_attr_%s" % name)
+        if (len(mismatches) == 0):
+            _logsi.LogVerbose("'%s': Optimistic state was confirmed by Spotify Web API player state: %s" % (self.name, optimisticState))
+            self._optimisticState = None
+            return
+
+        # is the verification scan still pending?  if so, then keep the expected values, as
+        # Spotify may not have caught up with the command yet.
+        if (self._optimisticVerifyMonotonic is not None) and (time.monotonic() < self._optimisticVerifyMonotonic):
+            _logsi.LogVerbose("'%s': Optimistic state is pending verification; masking Spotify Web API player state: %s" % (self.name, mismatches))
+            for name, value in optimisticState.items():
+                setattr(self, "_attr_%s" % name, value)
+            return
+
+        # otherwise, roll back to the values reported by Spotify.
+        _logsi.LogVerbose("'%s': Optimistic state was not confirmed by Spotify Web API player state; rolling back to: %s" % (self.name, mismatches))
+        self._optimisticState = None
+
+
+    @callback
+    def _HandleCoordinatorUpdate(self) -> None:
+        """
+        Handles updated playstate data from the playstate coordinator.
+
+        The entity attributes were already updated by the `_UpdateFromCoordinator` method,
+        so we just need to update HA state.  The state write is bypassed if nothing the
+        entity exposes has changed since the last write.
+        """
+        # did anything the entity exposes change?  if not, then don't bother updating HA state.
+        fingerprint:tuple = self._GetPlayStateFingerprint()
+        if (fingerprint == self._playStateFingerprint):
+            self._stateWritesSkipped = self._stateWritesSkipped + 1
+            _logsi.WatchInt(SILevel.Debug, "HASpotifyStateWritesSkipped", self._stateWritesSkipped)
+            if (self.data.playstateCoordinator.last_update_success):
+                self._AdvanceScanBackoff()
+            return
+
+        # update ha state.
+        self._ResetScanBackoff()
+        self._WriteHAState(fingerprint)
+
+
+    def GetDiagnostics(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of entity performance counters and playstate, suitable for 
+        diagnostics output.
+        """
+        return {
+            "state": self._attr_state,
+            "source": self._attr_source,
+            "media_content_id": self._attr_media_content_id,
+            "play_time_remaining_est": self._GetPlayTimeRemainingEst(),
+            "scan_interval": self._spotifyScanInterval,
+            "scan_interval_idle": self._spotifyScanIntervalIdle,
+            "scan_interval_effective": self._GetScanInterval(),
+            "scan_backoff_step": self._scanBackoffStep,
+            "state_writes_performed": self._stateWritesPerformed,
+            "state_writes_skipped": self._stateWritesSkipped,
+            "updates_bypassed_command_event": self._updatesBypassedCommandEvent,
+            "optimistic_state": self._optimisticState,
+            "commands_requested": self._commandCoalescer.RequestCount,
+            "commands_coalesced": self._commandCoalescer.CoalescedCount,
+        }
+
+
+    def _GetScanInterval(self) -> int:
+        """
+        Returns the scan interval (in seconds) used to query Spotify for player playstate.
+
+        This is the configured scan interval while playing; while paused or idle, it is 
+        stretched progressively by the idle scan interval profile.
+        """
+        if (self._scanBackoffStep == 0) or (self._attr_state == MediaPlayerState.PLAYING):
+            return self._spotifyScanInterval
+        return max(self._spotifyScanInterval, self._spotifyScanIntervalIdle[self._scanBackoffStep - 1])
+
+
+    def _AdvanceScanBackoff(self) -> None:
+        """
+        Records a scan that reported an unchanged playstate, and stretches the scan interval
+        to the next idle scan interval profile step if the player has been paused or idle for 
+        `SPOTIFY_SCAN_INTERVAL_IDLE_STEP_SCANS` consecutive scans.
+        """
+        if (self._attr_state == MediaPlayerState.PLAYING):
+            self._scanBackoffScans = 0
+            return
+        if (self._scanBackoffStep >= len(self._spotifyScanIntervalIdle)):
+            return
+
+        self._scanBackoffScans = self._scanBackoffScans + 1
+        if (self._scanBackoffScans >= SPOTIFY_SCAN_INTERVAL_IDLE_STEP_SCANS):
+            self._scanBackoffStep = self._scanBackoffStep + 1
+            self._scanBackoffScans = 0
+            _logsi.LogVerbose("'%s': Player playstate is unchanged while %s; scan interval stretched to %d seconds" % (self.name, self._attr_state, self._GetScanInterval()))
+
+
+    def _ResetScanBackoff(self) -> None:
+        """
+        Snaps the scan interval back to the configured scan interval.
+        """
+        if (self._scanBackoffStep > 0):
+            _logsi.LogVerbose("'%s': Scan interval restored to %d seconds" % (self.name, self._spotifyScanInterval))
+        self._scanBackoffStep = 0
+        self._scanBackoffScans = 0
+
+
+    @callback
+    def _WriteHAState(self, fingerprint:tuple=None) -> None:
+        """
+        Writes HA state, and records the playstate fingerprint that was written.
+
+        Args:
+            fingerprint (tuple):
+                Playstate fingerprint of the state being written, or None to calculate it.
+        """
+        if (fingerprint is None):
+            fingerprint = self._GetPlayStateFingerprint()
+        self._playStateFingerprint = fingerprint
+        self._stateWritesPerformed = self._stateWritesPerformed + 1
+        _logsi.WatchInt(SILevel.Debug, "HASpotifyStateWritesPerformed", self._stateWritesPerformed)
+        self.async_write_ha_state()
+
+
+    def _GetPlayStateFingerprint(self) -> tuple:
+        """
+        Returns a fingerprint of the playstate values that the entity exposes, which is
+        used to detect if a state write is required.
+
+        The play position is represented by a progress bucket; while playing, this is the
+        (bucketed) track start time implied by the position, which remains the same as long 
+        as the player keeps playing at the expected position.
+        """
+        progressBucket:int = None
+        if (self._attr_media_position is not None):
+            if (self._attr_state == MediaPlayerState.PLAYING) and (self._mediaPositionMonotonic is not None):
+                progressBucket = round((self._mediaPositionMonotonic - self._attr_media_position) / PLAYSTATE_PROGRESS_BUCKET_SECONDS)
+            else:
+                progressBucket = round(self._attr_media_position / PLAYSTATE_PROGRESS_BUCKET_SECONDS)
+
+        deviceId:str = None
+        deviceName:str = None
+        contextUri:str = None
+        playerState:PlayerPlayState = self._playerState
+        if (playerState is not None):
+            if (playerState.Device is not None):
+                deviceId = playerState.Device.Id
+                deviceName = playerState.Device.Name
+            if (playerState.Context is not None):
+                contextUri = playerState.Context.Uri
+
+        return (
+            self.available,
+            self._attr_state,
+            self._attr_source,
+            self._attr_media_content_id,
+            progressBucket,
+            self._attr_volume_level,
+            self._attr_is_volume_muted,
+            self._attr_shuffle,
+            self._attr_repeat,
+            self._attr_supported_features,
+            deviceId,
+            deviceName,
+            contextUri,
+            None if (self._playlist is None) else self._playlist.Uri,
+        )
+
+
+    def _IsInLastScanIntervalWindow(self) -> bool:
+        """
+        Returns True if content is playing, and the track is within its last scan interval
+        window; otherwise, False.
+
+        The estimated play time remaining attribute is refreshed every scan interval tick
+        while in this window.
+        """
+        if (self._attr_state != MediaPlayerState.PLAYING):
+            return False
+        playTimeRemainingEst:int = self._GetPlayTimeRemainingEst()
+        if (playTimeRemainingEst is None):
+            return False
+        return (playTimeRemainingEst <= self._spotifyScanInterval)
+
+
+    def _GetPlayTimeRemainingEst(self) -> int | None:
+        """
+        Returns the estimated play time remaining (in seconds) on the playing track, or
+        None if the media position or duration are not known.
+
+        The estimate is derived on demand from the monotonic clock time at which the media
+        position was reported, so it does not drift if updates are late or skipped.
+        """
+        if (self._attr_media_position is None) or (self._attr_media_duration is None):
+            return None
+        elapsed:float = 0
+        if (self._attr_state == MediaPlayerState.PLAYING) and (self._mediaPositionMonotonic is not None):
+            elapsed = time.monotonic() - self._mediaPositionMonotonic
+        return int(self._attr_media_duration - self._attr_media_position - elapsed)
+
+
+    def _SetMediaPosition(self, positionMS:int) -> None:
+        """
+        Sets the media position attributes, and anchors the position to the monotonic clock.
+
+        Args:
+            positionMS (int):
+                Media position (in milliseconds) as reported by Spotify.
+
+        The HA position is a whole number of seconds, so the position updated at values are 
+        adjusted by the fractional second portion; this keeps the UI position interpolation 
+        aligned with the actual play position.
+        """
+        fractionSecs:float = (positionMS % 1000) / 1000
+        self._attr_media_position = int(positionMS / 1000)
+        self._attr_media_position_updated_at = utcnow() - timedelta(seconds=fractionSecs)
+        self._mediaPositionMonotonic = time.monotonic() - fractionSecs
+
+
+    @callback
+    def _OnScanIntervalTick(self) -> None:
+        """
+        Called by the playstate coordinator for every scan interval tick that did not 
+        query Spotify for player state, while the track is within its last scan interval window.
+        """
+        # update ha state; this is always required while in the last scan interval window, as
+        # the estimated play time remaining attribute is refreshed every tick.
+        self._WriteHAState()
+
+
+    def _UpdateFromCoordinator(
+        self, 
+        playerPlayState:PlayerPlayState, 
+        playlist:Playlist,
+        ) -> None:
+        """
+        Updates state and attributes from a playstate coordinator snapshot.
+
+        Args:
+            playerPlayState (PlayerPlayState):
+                Spotify player playstate snapshot retrieved by the coordinator.
+            playlist (Playlist):
+                Playlist object of the currently playing context, or None if the context 
+                is not a playlist.
+
+        This method is called by the playstate coordinator in the event loop, so it must not 
+        perform any blocking i/o.
+        """
         # is the media player enabled?  if not, then there is nothing to do.
         if not self.enabled:
             return
@@ -1176,19 +1548,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
         # happening that we don't want overridden just yet.  
         if self._isInCommandEvent:
             _logsi.LogVerbose("'%s': Update - Integration is in a command event; bypassing update" % self.name)
-            return
-
-        # is the media player still processing a previous update event?  if so, then exit
-        # as we want to avoid generating log file entries for updates that are taking longer
-        # than expected (which are usually due to temporary conditions anyway).
-        if self._isInUpdateEvent:
-            _logsi.LogVerbose("'%s': Update - Integration is still processing a previous update event; bypassing current update" % self.name, colorValue=SIColors.Red)
-            return
-
-        # is the authentication token being refreshed?  if so, then exit as updates are
-        # happening that we don't want to interfere with.
-        if self.data.tokenUpdater_lock.locked():
-            _logsi.LogVerbose("'%s': Update - Integration is refreshing authentication token; bypassing update" % self.name, colorValue=SIColors.Gold)
+            self._updatesBypassedCommandEvent = self._updatesBypassedCommandEvent + 1
             return
 
         try:
@@ -1196,60 +1556,6 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # trace.
             _logsi.EnterMethod(SILevel.Debug)
 
-            _logsi.LogVerbose("'%s': Scan interval %d check - commandScanInterval=%d, currentScanInterval=%d, playTimeRemainingEst=%d, state=%s" % (self.name, self._spotifyScanInterval, self._commandScanInterval, self._currentScanInterval, self._playTimeRemainingEst, str(self._attr_state)))
-            
-            # have we reached a scan interval?
-            if (self._currentScanInterval == self._spotifyScanInterval) \
-            or (not ((self._currentScanInterval % self._spotifyScanInterval) == 0)):
-
-                # if last known time remaining value is less than current scan interval then
-                # use the lesser last known time remaining value as the current scan interval.
-                # this can happen when a user seeks to a new position, and the track time
-                # remaining is less than the current scan interval.  we will also check the
-                # last known time remaining value for greater than zero, as it is zero at startup.
-                if (self._lastKnownTimeRemainingSeconds > 0) \
-                and (self._lastKnownTimeRemainingSeconds < self._currentScanInterval) \
-                and (self._attr_state == MediaPlayerState.PLAYING):
-                    self._currentScanInterval = self._lastKnownTimeRemainingSeconds
-                    _logsi.LogVerbose("'%s': Resetting current scan interval to last known time remaining value - currentScanInterval=%d, lastKnownTimeRemainingSeconds=%d, playTimeRemainingEst=%d, state=%s" % (self.name, self._currentScanInterval, self._lastKnownTimeRemainingSeconds, self._playTimeRemainingEst, str(self._attr_state)))
-
-                # do we need to query Spotify for player state?
-                if (self._currentScanInterval == 0):
-                    # yes - we reached a scan interval (e.g. 30 seconds).
-                    _logsi.LogVerbose("'%s': updating playerstate - current scan interval is zero" % (self.name))
-                    pass
-                elif (self._commandScanInterval != 0):
-                    # yes - we are monitoring an issued command response (e.g. 5 seconds).
-                    _logsi.LogVerbose("'%s': updating playerstate - monitoring an issued command response" % (self.name))
-                    pass
-                elif ((self._lastKnownTimeRemainingSeconds <= SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART) and (self._attr_state == MediaPlayerState.PLAYING)):
-                    # yes - allow the update
-                    _logsi.LogVerbose("'%s': updating playerstate - monitoring for end of track (remaining track time is nearing zero)" % (self.name))
-                    pass
-                else:
-                    # no - keep waiting to update.
-
-                    # decrement the current scan interval count.
-                    self._currentScanInterval = self._currentScanInterval - 1
-
-                    # are we playing content?
-                    if (self._attr_state == MediaPlayerState.PLAYING):
-
-                        # add scan interval time value to last media played position since it's not a real-time value.
-                        self._lastMediaPlayedPosition = (self._lastMediaPlayedPosition + SCAN_INTERVAL.seconds)
-                        
-                        # does the media position have a last update date? if so, then calculate play time remaining.
-                        if (isinstance(self._attr_media_position_updated_at, datetime)):
-                            # calculate play time remaining by subtracting current UTC time from 
-                            # the last UTC time when the media_position was provided by Spotify player state.
-                            dtUtc:datetime = utcnow().replace(microsecond=0)
-                            timeDifference:timedelta = (dtUtc - self._attr_media_position_updated_at)
-                            self._playTimeRemainingEst = int(self._attr_media_duration - self._attr_media_position - int(timeDifference.total_seconds()))
-                            #_logsi.LogVerbose("'%s': Estimated time remaining (timeDifference) - media Duration=%d, Position=%s, Remaining=%d, TimeDiffSecs=%d, state=%s" % (self.name, int(self._attr_media_duration), int(self._attr_media_position), self._playTimeRemainingEst, timeDifference.total_seconds(), str(self._attr_state)))
-
-                    # bypass HA state update.
-                    return
-
             # # TEST TODO - force token expire!!!
             # leave the following comments in here, in case you need to test token expire logic.  
             # this will force the token to expire in 30 seconds, instead of the 1 hour Spotify default.
@@ -1262,75 +1568,22 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # self.data.spotifyClient.AuthToken._ExpiresAt = int((dtUtcNow - unix_epoch).total_seconds())  # seconds from epoch, current date
             # self.data.spotifyClient.AuthToken._ExpiresAt = self.data.spotifyClient.AuthToken._ExpiresAt + self.data.spotifyClient.AuthToken._ExpiresIn             # add ExpiresIn seconds
 
-            # indicate we are updating status.
-            self._isInUpdateEvent = True
-
-            # are we monitoring a command response? if so, then decrement the interval count.
-            if self._commandScanInterval > 0:
-                self._commandScanInterval = self._commandScanInterval - 1
-
-            # get now playing status.
-            _logsi.LogVerbose("'%s': update method - getting Spotify Connect device player state" % self.name)
-            self._playerState = self.data.spotifyClient.GetDevicePlaybackState(deviceId=self._attr_source)
+            # update now playing status, and reconcile any optimistic player command state.
+            self._playerState = playerPlayState
             self._UpdateHAFromPlayerPlayState(self._playerState)
-            _logsi.WatchDateTime(SILevel.Debug, "HASpotifyPlaystateLastUpdate", datetime.now())
-            
-            # update the scan interval for next time.
-            self._currentScanInterval = self._spotifyScanInterval
+            self._ReconcileOptimisticState()
+
+            # update the stored playlist reference.
+            if (self._playlist is not playlist):
+                self._playlist = playlist
+                self._InvalidateStateAttributes()
 
-            # did the now playing context change?
-            context:Context = self._playerState.Context
-            if (context is not None) and (self._playlist is None or self._playlist.Uri != context.Uri):
-                
-                # yes - if it's a playlist, then we need to update the stored playlist reference.
-                self._playlist = None
-                if context.Type == MediaType.PLAYLIST:
-                
-                    # as of 2024/11/27, Spotify deprecated API support for various Spotify-owned playlists!
-                    # due to that, the following `GetPlaylist` call will fail if the currently playing context
-                    # is a Spotify-owned "algorithmic" playlist (e.g. various "Made For You" content, etc).
-                    try:
-                        
-                        _logsi.LogVerbose("'%s': Retrieving basic playlist details for context uri '%s'" % (self.name, context.Uri))
-                        spotifyId:str = SpotifyClient.GetIdFromUri(context.Uri)
-                        self._playlist = self.data.spotifyClient.GetPlaylist(spotifyId, excludeItems=True)
-                        
-                    except Exception as ex:
-                        
-                        #_logsi.LogException("Unable to get playlist data for context '%s'. Continuing without playlist data" % context.Uri, ex, logToSystemLogger=False)
-                        _logsi.LogWarning("'%s': Unable to get basic playlist data for context '%s'. Continuing without playlist data. GetPlaylist response: %s" % (self.name, context.Uri, str(ex)), logToSystemLogger=False)
-
-                        # if we could not get the current playlist info, then build a "dummy" playlist so that
-                        # information is still conveyed in the extended attributes.
-                        self._playlist = Playlist()
-                        self._playlist.Uri = context.Uri
-                        self._playlist.Type = self.data.spotifyClient.GetTypeFromUri(context.Uri)
-                        self._playlist.Id = self.data.spotifyClient.GetIdFromUri(context.Uri)
-                        self._playlist.Name = "Unknown"
-                        self._playlist.Description = str(ex)
-                        
-                else:
-                    
-                    self._playlist = None
-                    
-            elif (context is None):
-                
-                self._playlist = None
-                    
-        except SpotifyWebApiError as ex:
-            
-            _logsi.LogException(None, ex)
-            raise ServiceValidationError(ex.Message) from ex
-        
         except Exception as ex:
 
-            _logsi.LogException(None, ex)
-            raise IntegrationError(str(ex)) from ex
+            # log the exception, but don't pass it on since other subscribers still need to be updated.
+            _logsi.LogException("'%s': Update from playstate coordinator exception: %s" % (self.name, str(ex)), ex, logToSystemLogger=False)
 
         finally:
-        
-            # indicate we are no longer updating status.
-            self._isInUpdateEvent = False
 
             # trace.
             _logsi.LeaveMethod(SILevel.Debug)
@@ -1363,6 +1616,9 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # trace.
             _logsi.EnterMethod(SILevel.Debug)
             _logsi.LogObject(SILevel.Verbose, "'%s': Updating HA state from Spotify PlayerPlayState object" % self.name, playerPlayState, excludeNonPublic=True)
+
+            # indicate the cached state attributes need to be rebuilt.
+            self._InvalidateStateAttributes()
         
             # initialize media attributes.
             self._attr_media_album_name = None
@@ -1373,6 +1629,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self._attr_media_image_url = None
             self._attr_media_position = None
             self._attr_media_position_updated_at = None
+            self._mediaPositionMonotonic = None
             self._attr_media_title = None
             self._attr_media_track = None
             self._attr_repeat = None
@@ -1478,23 +1735,22 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
                     
                     # check to see if currently active device is in the Spotify Connect device list cache.
                     # if it's not in the cache, then we need to refresh the Spotify Connect device list cache.
-                    scDevices:SpotifyConnectDevices = self.data.spotifyClient.GetSpotifyConnectDevices(refresh=False)
-                    if not scDevices.ContainsDeviceName(playerPlayState.Device.Name):
-                        _logsi.LogVerbose("'%s': Spotify PlayerPlayState device name \"%s\" was not found in the Spotify Connect device list cache; refreshing cache" % (self.name, self._attr_source))
-                        self.data.spotifyClient.GetSpotifyConnectDevices(refresh=True)
+                    # the refresh is a shared background task (single-flight, rate-limited) for the account,
+                    # and the stale device list cache is used until the refresh completes.
+                    # the device list snapshot is taken by the coordinator in an executor worker
+                    # thread, as this method runs in the event loop.
+                    scDevices:SpotifyConnectDevices = self.data.playstateCoordinator.ConnectDevices
+                    if (scDevices is not None) and (not scDevices.ContainsDeviceName(playerPlayState.Device.Name)):
+                        _logsi.LogVerbose("'%s': Spotify PlayerPlayState device name \"%s\" was not found in the Spotify Connect device list cache; requesting cache refresh" % (self.name, self._attr_source))
+                        self.data.playstateCoordinator.RequestDeviceRefresh(self.data.spotifyClient, "device name \"%s\" not found" % playerPlayState.Device.Name)
 
             # update seek-related attributes.
-            # also save currently playing track position in case we need to restore it later.
             if playerPlayState.ProgressMS is not None:
-                self._attr_media_position = int(playerPlayState.ProgressMS / 1000)
-                self._attr_media_position_updated_at = utcnow().replace(microsecond=0)
-                self._lastMediaPlayedPosition = self._attr_media_position
+                self._SetMediaPosition(playerPlayState.ProgressMS)
         
-            # calculate the time (in seconds) remaining on the playing track.
+            # trace the time (in seconds) remaining on the playing track.
             if (self._attr_media_position is not None) and (self._attr_media_duration is not None):
-                self._lastKnownTimeRemainingSeconds = int(self._attr_media_duration - self._attr_media_position)
-                self._playTimeRemainingEst = int(self._attr_media_duration - self._attr_media_position)
-                _logsi.LogVerbose("'%s': Estimated time remaining (playstateUpdate) - media Duration=%d, Position=%s, Remaining=%d" % (self.name, int(self._attr_media_duration), int(self._attr_media_position), self._playTimeRemainingEst))
+                _logsi.LogVerbose("'%s': Estimated time remaining (playstateUpdate) - media Duration=%d, Position=%s, Remaining=%d" % (self.name, int(self._attr_media_duration), int(self._attr_media_position), self._GetPlayTimeRemainingEst()))
 
             # update repeat related attributes.
             if playerPlayState.RepeatState is not None:
@@ -6049,8 +6305,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6157,8 +6413,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6330,8 +6586,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6394,8 +6650,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6468,15 +6724,21 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # validations.
             delay = validateDelay(delay, 0.50, 10)
 
-            # set seek position.
-            self.data.spotifyClient.PlayerMediaSeek(positionMS, deviceId, delay, relativePositionMS)
+            # set seek position; absolute seeks are coalesced into the last position, but relative
+            # seeks are cumulative and are always issued.
+            isRequestIssued:bool = True
+            if not relativePositionMS:
+                isRequestIssued = self._commandCoalescer.Submit(("seek", deviceId), self.data.spotifyClient.PlayerMediaSeek, positionMS, deviceId, delay, relativePositionMS)
+            else:
+                self.data.spotifyClient.PlayerMediaSeek(positionMS, deviceId, delay, relativePositionMS)
             
             # update ha state.
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            if isRequestIssued:
+                _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+                self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6536,8 +6798,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6597,8 +6859,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6664,8 +6926,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
             
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6730,8 +6992,8 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
             
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
             
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6786,15 +7048,16 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # validations.
             delay = validateDelay(delay, 0.50, 10)
                 
-            # set volume level.
-            self.data.spotifyClient.PlayerSetVolume(volumeLevel, deviceId, delay)
+            # set volume level; rapid volume changes are coalesced into the last level.
+            isRequestIssued:bool = self._commandCoalescer.Submit(("volume", deviceId), self.data.spotifyClient.PlayerSetVolume, volumeLevel, deviceId, delay)
 
             # update ha state.
             self.schedule_update_ha_state(force_refresh=False)
             
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            if isRequestIssued:
+                _logsi.LogVerbose("'%s': Processed a media player command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+                self._TriggerVerificationScan()
             
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -6900,6 +7163,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
             # get current Spotify Connect player state (from cache - updated by PlayerTransferPlayback).
             self._playerState = self.data.spotifyClient.GetPlayerPlaybackState(refresh=False)
+            self._InvalidateStateAttributes()
 
             # trace.
             if (_logsi.IsOn(SILevel.Debug)):
@@ -6915,12 +7179,13 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
             # update the selected source and device instance.
             self._spotifyConnectDevice = scDevice
+            self._InvalidateStateAttributes()
             self._attr_source = scDevice.Name
             _logsi.LogVerbose("'%s': Selected source was changed to: \"%s\"" % (self.name, scDevice.Title))
                 
             # media player command was processed, so force a scan window at the next interval.
-            _logsi.LogVerbose("'%s': Processed a transfer playback command - forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            _logsi.LogVerbose("'%s': Processed a transfer playback command - forcing a playerState verification scan in %.1f seconds" % (self.name, SPOTIFY_SCAN_VERIFY_DELAY))
+            self._TriggerVerificationScan()
 
         except SpotifyApiError as ex:
 
@@ -8787,7 +9052,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
             # force a scan window at the next interval.
             _logsi.LogVerbose("'%s': Forcing a playerState scan window for the next %d updates" % (self.name, SPOTIFY_SCAN_INTERVAL_COMMAND))
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_COMMAND
+            self._TriggerScanWindow(SPOTIFY_SCAN_INTERVAL_COMMAND)
                 
         # the following exceptions have already been logged, so we just need to
         # pass them back to HA for display in the log (or service UI).
@@ -9184,7 +9449,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             self.schedule_update_ha_state(force_refresh=False)
 
             # device was disconnected, so force a scan window at the next interval.
-            self._commandScanInterval = SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART
+            self._TriggerScanWindow(SPOTIFY_SCAN_INTERVAL_TRACK_ENDSTART)
 
             # return the (partial) user profile that retrieved the result, as well as the result itself.
             return {
@@ -9479,6 +9744,7 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
 
             # update ha state.
             self._attr_volume_step = stepValue
+            self._InvalidateStateAttributes()
             self.schedule_update_ha_state(force_refresh=False)
 
         # the following exceptions have already been logged, so we just need to
@@ -9514,8 +9780,9 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # call base class method.
             await super().async_added_to_hass()
 
-            # nothing to do here.
-            # left this here in case we add a DataUpdateCoordinator later.
+            # subscribe to player state updates from the shared playstate coordinator.
+            _logsi.LogVerbose("'%s': subscribing to playstate coordinator updates" % self.name)
+            self._unsubscribeCoordinator = self.data.playstateCoordinator.AddEntity(self)
 
         finally:
                 
@@ -9535,7 +9802,10 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             _logsi.EnterMethod(SILevel.Debug)
             _logsi.LogVerbose("'%s': removing instance from hass" % self.name)
        
-            # nothing to do here.
+            # unsubscribe from playstate coordinator updates.
+            if (self._unsubscribeCoordinator is not None):
+                self._unsubscribeCoordinator()
+                self._unsubscribeCoordinator = None
 
         finally:
 
@@ -9600,16 +9870,35 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
                 # handle spotifysplus media library selection.
                 # note that this is NOT async, as SpotifyClient is not async!
                 _logsi.LogVerbose("'%s': MediaPlayer is browsing media node content id '%s'" % (self.name, media_content_id))
-                return await self.hass.async_add_executor_job(
-                    browse_media_node,
-                    self.hass,
-                    self.data.spotifyClient,
-                    self.name,
-                    self.source,
-                    SPOTIFY_LIBRARY_MAP,
-                    media_content_type,
-                    media_content_id,
-                )
+                # nodes are served from the account browse cache (if cached), and rebuilt in the
+                # background once they are stale.
+                nodeAttrs:dict = SPOTIFY_LIBRARY_MAP.get(media_content_type, None) or {}
+
+                # slow-changing catalog data (e.g. categories) is kept in the persistent catalog
+                # store; it is loaded by the first media browse after startup.
+                catalogStore:SpotifyPlusCatalogStore = async_get_catalog_store(self.hass)
+                await catalogStore.async_Load()
+
+                with self.data.playstateCoordinator.Instrumentation.Measure(InstrumentationCategory.ENTRY_POINT, "browse_media_node"):
+                    return await self.data.playstateCoordinator.BrowseCache.async_GetOrBuild(
+                        self.entity_id,
+                        media_content_type,
+                        media_content_id,
+                        nodeAttrs.get("cache_ttl", 0),
+                        partial(
+                            self.data.playstateCoordinator.async_RunInExecutor,
+                            SpotifyRequestLane.BULK,
+                            browse_media_node,
+                            self.hass,
+                            self.data.spotifyClient,
+                            self.name,
+                            self.source,
+                            SPOTIFY_LIBRARY_MAP,
+                            media_content_type,
+                            media_content_id,
+                            catalogStore,
+                        ),
+                    )
 
         except Exception as ex:
             
@@ -9653,13 +9942,15 @@ class SpotifyMediaPlayer(MediaPlayerEntity):
             # handle spotifysplus media library selection.
             # note that this is NOT async, as SpotifyClient is not async!
             _logsi.LogVerbose("'%s': MediaPlayer is searching media node content id '%s'" % (self.name, query.media_content_id))
-            return await self.hass.async_add_executor_job(
-                search_media_node,
-                self.hass,
-                self.data.spotifyClient,
-                self.name,
-                query,
-            )
+            with self.data.playstateCoordinator.Instrumentation.Measure(InstrumentationCategory.ENTRY_POINT, "search_media_node"):
+                return await self.data.playstateCoordinator.async_RunInExecutor(
+                    SpotifyRequestLane.BULK,
+                    search_media_node,
+                    self.hass,
+                    self.data.spotifyClient,
+                    self.name,
+                    query,
+                )
 
         except Exception as ex:
             
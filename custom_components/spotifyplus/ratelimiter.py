@@ -0,0 +1,393 @@
+"""
+Account-wide Spotify Web API request rate limiter for the SpotifyPlus component.
+
+A single rate limiter instance is created for each Spotify user account (it is owned by
+the account's playstate coordinator), and is installed on every SpotifyClient instance of
+the account.  Requests are metered by a token bucket, and are assigned to a priority lane
+so that player transport commands stay responsive when the bucket is busy:
+
+- TRANSPORT: player commands (play, pause, skip, volume, seek, etc).
+- POLL: player playstate polling, and related lookups.
+- BULK: library / browse reads, and everything else (the default lane).
+
+When the Spotify Web API responds with a 429 (Too Many Requests) status, the lower lanes
+(POLL and BULK) are paused for the `Retry-After` interval; the TRANSPORT lane is not paused.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from enum import IntEnum
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from spotifywebapipython import SpotifyApiError, SpotifyClient
+
+from .const import (
+    LOGGER,
+    SPOTIFY_RATELIMIT_BUCKET_SIZE,
+    SPOTIFY_RATELIMIT_LANE_RESERVE_BULK,
+    SPOTIFY_RATELIMIT_LANE_RESERVE_POLL,
+    SPOTIFY_RATELIMIT_REFILL_RATE,
+    SPOTIFY_RATELIMIT_RETRY_AFTER_DEFAULT,
+    SPOTIFY_RATELIMIT_WAIT_TIMEOUT,
+)
+from .utils import restoreInstanceAttribute
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SILevel, SISession, SIColors
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+# request lane of the current thread; this is a module-level thread-local, as requests are
+# issued from executor worker threads that have no reference to the calling entity.
+_threadLane:threading.local = threading.local()
+
+
+class SpotifyRequestLane(IntEnum):
+    """
+    Spotify Web API request priority lanes; lower values have higher priority.
+    """
+
+    TRANSPORT = 0
+    """ Player transport commands (play, pause, skip, volume, seek, etc). """
+
+    POLL = 1
+    """ Player playstate polling. """
+
+    BULK = 2
+    """ Library / browse reads (default lane). """
+
+
+class SpotifyPlusRateLimiter:
+    """
+    Token bucket rate limiter with priority lanes, shared by all SpotifyClient instances
+    of the same Spotify user account.
+    """
+
+    def __init__(self, name:str) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            name (str):
+                Name of the rate limiter, for trace purposes.
+        """
+        self._name:str = name
+        self._condition:threading.Condition = threading.Condition()
+        self._tokens:float = float(SPOTIFY_RATELIMIT_BUCKET_SIZE)
+        self._tokensLastMonotonic:float = time.monotonic()
+        self._pausedUntilMonotonic:float = 0
+        self._waiting:dict[SpotifyRequestLane, int] = {lane: 0 for lane in SpotifyRequestLane}
+        self._requestCount:dict[SpotifyRequestLane, int] = {lane: 0 for lane in SpotifyRequestLane}
+        self._throttledCount:int = 0
+        self._previousMethods:dict[int, tuple[Any, Any]] = {}
+
+
+    @property
+    def Name(self) -> str:
+        """
+        Name of the rate limiter.
+        """
+        return self._name
+
+
+    @property
+    def PausedSecondsRemaining(self) -> float:
+        """
+        Number of seconds remaining until the lower lanes resume after a 429 response;
+        zero if the lower lanes are not paused.
+        """
+        return max(0, self._pausedUntilMonotonic - time.monotonic())
+
+
+    @property
+    def QueueDepth(self) -> int:
+        """
+        Number of requests (all lanes) that are currently waiting for a token.
+        """
+        return sum(self._waiting.values())
+
+
+    @property
+    def ThrottledCount(self) -> int:
+        """
+        Number of 429 (Too Many Requests) responses received from the Spotify Web API.
+        """
+        return self._throttledCount
+
+
+    @property
+    def Tokens(self) -> float:
+        """
+        Number of tokens currently available in the bucket.
+        """
+        with self._condition:
+            self._Refill(time.monotonic())
+            return self._tokens
+
+
+    @staticmethod
+    def GetCurrentLane() -> SpotifyRequestLane:
+        """
+        Returns the request lane that is assigned to the current thread; defaults to
+        `SpotifyRequestLane.BULK` if a lane was not assigned.
+        """
+        return getattr(_threadLane, "lane", SpotifyRequestLane.BULK)
+
+
+    @staticmethod
+    @contextmanager
+    def Lane(lane:SpotifyRequestLane) -> Iterator[None]:
+        """
+        Context manager that assigns a request lane to Spotify Web API requests issued
+        by the current thread while the context is active.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Request lane to assign.
+        """
+        previousLane:SpotifyRequestLane = getattr(_threadLane, "lane", None)
+        _threadLane.lane = lane
+        try:
+            yield
+        finally:
+            if previousLane is None:
+                del _threadLane.lane
+            else:
+                _threadLane.lane = previousLane
+
+
+    @staticmethod
+    def RunInLane(lane:SpotifyRequestLane, func:Callable[..., Any], *args:Any) -> Any:
+        """
+        Calls a function with the specified request lane assigned to the current thread.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Request lane to assign.
+            func (Callable):
+                Function to call.
+            *args:
+                Positional arguments to pass to the function.
+
+        Returns:
+            The function result.
+
+        This is normally used to assign a lane to a function that is run in an executor
+        worker thread (e.g. `hass.async_add_executor_job(RunInLane, lane, func, arg)`).
+        """
+        with SpotifyPlusRateLimiter.Lane(lane):
+            return func(*args)
+
+
+    def _Refill(self, nowMonotonic:float) -> None:
+        """
+        Adds tokens to the bucket for the time elapsed since the last refill.
+
+        Args:
+            nowMonotonic (float):
+                Current monotonic clock time.
+
+        The condition lock must be held by the caller.
+        """
+        elapsed:float = nowMonotonic - self._tokensLastMonotonic
+        if (elapsed > 0):
+            self._tokens = min(float(SPOTIFY_RATELIMIT_BUCKET_SIZE), self._tokens + (elapsed * SPOTIFY_RATELIMIT_REFILL_RATE))
+            self._tokensLastMonotonic = nowMonotonic
+
+
+    def _TryAcquire(self, lane:SpotifyRequestLane, nowMonotonic:float) -> float:
+        """
+        Takes a token for the specified lane if one is available.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Request lane.
+            nowMonotonic (float):
+                Current monotonic clock time.
+
+        Returns:
+            Zero if a token was taken; otherwise, the number of seconds to wait before
+            trying again.
+
+        The condition lock must be held by the caller.
+        """
+        self._Refill(nowMonotonic)
+
+        # lower lanes are paused while a Retry-After interval is in effect.
+        if (lane != SpotifyRequestLane.TRANSPORT) and (self._pausedUntilMonotonic > nowMonotonic):
+            return self._pausedUntilMonotonic - nowMonotonic
+
+        # lower lanes leave a reserve of tokens for the higher lanes, and yield to any
+        # higher lane requests that are waiting.
+        reserve:int = 0
+        if (lane == SpotifyRequestLane.POLL):
+            reserve = SPOTIFY_RATELIMIT_LANE_RESERVE_POLL
+        elif (lane == SpotifyRequestLane.BULK):
+            reserve = SPOTIFY_RATELIMIT_LANE_RESERVE_BULK
+        higherWaiting:int = sum(count for waitLane, count in self._waiting.items() if waitLane < lane)
+
+        if (higherWaiting == 0) and (self._tokens - reserve >= 1):
+            self._tokens -= 1
+            self._requestCount[lane] += 1
+            return 0
+
+        return max(0.05, (reserve + 1 - self._tokens) / SPOTIFY_RATELIMIT_REFILL_RATE)
+
+
+    def Acquire(self, lane:SpotifyRequestLane=None) -> None:
+        """
+        Takes a token for the specified lane, blocking the calling thread until one is available.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Request lane; defaults to the lane assigned to the current thread.
+
+        Raises:
+            SpotifyApiError:
+                If a token could not be taken within `SPOTIFY_RATELIMIT_WAIT_TIMEOUT` seconds.
+
+        This method must not be called from the event loop.
+        """
+        if lane is None:
+            lane = SpotifyPlusRateLimiter.GetCurrentLane()
+
+        deadlineMonotonic:float = time.monotonic() + SPOTIFY_RATELIMIT_WAIT_TIMEOUT
+        with self._condition:
+            self._waiting[lane] += 1
+            try:
+                while True:
+                    nowMonotonic:float = time.monotonic()
+                    waitSecs:float = self._TryAcquire(lane, nowMonotonic)
+                    if (waitSecs == 0):
+                        return
+                    if (nowMonotonic + waitSecs > deadlineMonotonic):
+                        raise SpotifyApiError("Spotify Web API request rate limit exceeded for '%s'; %s lane request was not sent (waited %d seconds)" % (self._name, lane.name, SPOTIFY_RATELIMIT_WAIT_TIMEOUT), None, logsi=_logsi)
+                    self._condition.wait(waitSecs)
+            finally:
+                self._waiting[lane] -= 1
+                self._condition.notify_all()
+
+
+    async def async_Acquire(self, lane:SpotifyRequestLane, timeout:float) -> bool:
+        """
+        Takes a token for the specified lane, waiting (without blocking the event loop)
+        until one is available.
+
+        Args:
+            lane (SpotifyRequestLane):
+                Request lane.
+            timeout (float):
+                Maximum number of seconds to wait for a token.
+
+        Returns:
+            True if a token was taken; otherwise, False if a token could not be taken
+            within the timeout interval.
+        """
+        deadlineMonotonic:float = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                nowMonotonic:float = time.monotonic()
+                waitSecs:float = self._TryAcquire(lane, nowMonotonic)
+            if (waitSecs == 0):
+                return True
+            if (nowMonotonic + waitSecs > deadlineMonotonic):
+                return False
+            await asyncio.sleep(waitSecs)
+
+
+    def ReportThrottled(self, retryAfter:str | int | None) -> None:
+        """
+        Records a 429 (Too Many Requests) response, and pauses the lower lanes for the
+        `Retry-After` interval.
+
+        Args:
+            retryAfter (str | int | None):
+                Value of the `Retry-After` response header (in seconds), or None if the
+                header was not present.
+
+        It is safe to call this method from any thread.
+        """
+        retryAfterSecs:float = SPOTIFY_RATELIMIT_RETRY_AFTER_DEFAULT
+        try:
+            if retryAfter is not None:
+                retryAfterSecs = max(1, float(retryAfter))
+        except ValueError:
+            pass
+
+        with self._condition:
+            self._throttledCount += 1
+            self._pausedUntilMonotonic = max(self._pausedUntilMonotonic, time.monotonic() + retryAfterSecs)
+            self._condition.notify_all()
+
+        _logsi.LogWarning("'%s': Spotify Web API rate limit was exceeded (429); pausing poll and bulk requests for %d seconds" % (self._name, retryAfterSecs), colorValue=SIColors.Red)
+        _logsi.WatchInt(SILevel.Debug, "HASpotifyRateLimit429Count", self._throttledCount)
+
+
+    def Install(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Installs the rate limiter on a SpotifyClient instance, so that every Spotify Web API
+        request made by the client is metered.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance to install the rate limiter on.
+
+        The client `MakeRequest` and `_CheckResponseForErrors` methods are overridden on the
+        instance (not the class), so other SpotifyClient instances are unaffected.
+        """
+        clientMakeRequest = spotifyClient.MakeRequest
+        clientCheckResponseForErrors = spotifyClient._CheckResponseForErrors
+
+        # save the instance methods (if any) of previously installed wrappers, for uninstall.
+        self._previousMethods[id(spotifyClient)] = (spotifyClient.__dict__.get("MakeRequest", None), spotifyClient.__dict__.get("_CheckResponseForErrors", None))
+
+        def MakeRequest(method, msg):
+            self.Acquire()
+            return clientMakeRequest(method, msg)
+
+        def _CheckResponseForErrors(msg, response):
+            if (response is not None) and (response.status == 429):
+                retryAfter:str = None
+                if response.headers:
+                    retryAfter = response.headers.get("Retry-After", None)
+                self.ReportThrottled(retryAfter)
+            return clientCheckResponseForErrors(msg, response)
+
+        spotifyClient.MakeRequest = MakeRequest
+        spotifyClient._CheckResponseForErrors = _CheckResponseForErrors
+
+
+    def Uninstall(self, spotifyClient:SpotifyClient) -> None:
+        """
+        Removes the rate limiter from a SpotifyClient instance that it was installed on.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance to remove the rate limiter from.
+        The methods that were installed on the instance before this one are restored, so
+        stacked wrappers must be uninstalled in the reverse order that they were installed.
+        """
+        previousMakeRequest, previousCheckResponseForErrors = self._previousMethods.pop(id(spotifyClient), (None, None))
+        restoreInstanceAttribute(spotifyClient, "MakeRequest", previousMakeRequest)
+        restoreInstanceAttribute(spotifyClient, "_CheckResponseForErrors", previousCheckResponseForErrors)
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of rate limiter statistics, suitable for diagnostics output.
+        """
+        with self._condition:
+            self._Refill(time.monotonic())
+            return {
+                "tokens": round(self._tokens, 1),
+                "bucket_size": SPOTIFY_RATELIMIT_BUCKET_SIZE,
+                "queue_depth": {lane.name.lower(): count for lane, count in self._waiting.items()},
+                "requests": {lane.name.lower(): count for lane, count in self._requestCount.items()},
+                "throttled_count": self._throttledCount,
+                "paused_seconds_remaining": round(self.PausedSecondsRemaining, 1),
+            }
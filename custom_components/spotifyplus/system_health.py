@@ -55,6 +55,38 @@ async def system_health_info(hass):
         else:
             clientConfig = "(None Defined)"
         healthInfo["clients_configured"] = clientConfig
+
+        # add context playlist cache statistics (one cache per Spotify user account).
+        cacheStats:str = ""
+        cacheNames:list[str] = []
+        for data in hass.data[DOMAIN].values():
+            if (data.playlistCache is not None) and (data.playlistCache.Name not in cacheNames):
+                cacheNames.append(data.playlistCache.Name)
+                cacheStats = cacheStats + "%d hits (%d negative), %d misses, %d entries; " % (data.playlistCache.Hits, data.playlistCache.HitsNegative, data.playlistCache.Misses, len(data.playlistCache))
+        healthInfo["playlist_cache"] = cacheStats[:len(cacheStats)-2] if len(cacheStats) > 0 else "(None Defined)"
+
+        # add rate limiter statistics (one rate limiter per Spotify user account).
+        limiterStats:str = ""
+        limiterNames:list[str] = []
+        for data in hass.data[DOMAIN].values():
+            if (data.playstateCoordinator is not None) and (data.playstateCoordinator.RateLimiter.Name not in limiterNames):
+                rateLimiter = data.playstateCoordinator.RateLimiter
+                limiterNames.append(rateLimiter.Name)
+                limiterStats = limiterStats + "%.1f tokens, %d queued, %d throttled (429); " % (rateLimiter.Tokens, rateLimiter.QueueDepth, rateLimiter.ThrottledCount)
+        healthInfo["rate_limiter"] = limiterStats[:len(limiterStats)-2] if len(limiterStats) > 0 else "(None Defined)"
+
+        # add circuit breaker statistics (one circuit breaker per Spotify user account).
+        breakerStats:str = ""
+        breakerNames:list[str] = []
+        for data in hass.data[DOMAIN].values():
+            if (data.playstateCoordinator is not None) and (data.playstateCoordinator.CircuitBreaker.Name not in breakerNames):
+                circuitBreaker = data.playstateCoordinator.CircuitBreaker
+                breakerNames.append(circuitBreaker.Name)
+                breakerStats = breakerStats + "%s, %d transitions, %d seconds open" % (circuitBreaker.State.value, circuitBreaker.TransitionCount, circuitBreaker.TotalOpenSeconds)
+                if (not circuitBreaker.IsAvailable):
+                    breakerStats = breakerStats + " (%s)" % circuitBreaker.UnavailableReason
+                breakerStats = breakerStats + "; "
+        healthInfo["circuit_breaker"] = breakerStats[:len(breakerStats)-2] if len(breakerStats) > 0 else "(None Defined)"
         
         # check if Spotify Web API endpoint is reachable.
         healthInfo["api_endpoint_reachable"] = system_health.async_check_can_reach_url(hass, "https://api.spotify.com")
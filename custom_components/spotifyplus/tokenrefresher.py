@@ -0,0 +1,379 @@
+"""
+OAuth2 token refresh for the SpotifyPlus component.
+
+A single token refresher instance is created for each configuration entry, and it performs
+every refresh of the entry's OAuth2 session token in the event loop:
+
+- the token is refreshed in the background a configurable margin before it expires, and the
+  refreshed token is swapped into the SpotifyClient instance, so that foreground requests
+  (almost) never find an expired token.
+- when a SpotifyClient request does find an expired token, the SpotifyClient calls the
+  component token updater on a worker thread; the worker thread does not refresh the token
+  itself, but waits (with a timeout) on the refresh that is in flight.
+
+Only one refresh is in flight at a time ("single-flight"): every caller that needs a fresh
+token while a refresh is in progress shares its result (or its exception), so a slow or
+hung refresh can never pin more than the callers that are waiting on it, and each of those
+is released when its wait times out.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from datetime import datetime, timedelta
+import threading
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from spotifywebapipython import SpotifyClient, SpotifyAuthToken
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util.dt import utc_from_timestamp, utcnow
+
+from .const import (
+    LOGGER,
+    SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL,
+    SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT,
+    SPOTIFY_WEBAPI_REQUEST_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SpotifyPlusPlayStateCoordinator
+
+# get smartinspect logger reference; create a new session for this module name.
+from smartinspectpython.siauto import SIAuto, SISession, SIColors
+_logsi:SISession = SIAuto.Si.GetSession(__name__)
+if (_logsi == None):
+    _logsi = SIAuto.Si.AddSession(__name__, True)
+_logsi.SystemLogger = LOGGER
+
+
+class SpotifyPlusTokenRefresher:
+    """
+    Refreshes the OAuth2 session token of a configuration entry, one refresh at a time,
+    and in the background before it expires.
+    """
+
+    def __init__(
+        self,
+        hass:HomeAssistant,
+        entry:ConfigEntry,
+        refreshFunc:Callable[[], Awaitable[dict]],
+        marginSecs:int,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            hass (HomeAssistant):
+                HomeAssistant instance.
+            entry (ConfigEntry):
+                HomeAssistant configuration entry whose token is refreshed.
+            refreshFunc (Callable):
+                Coroutine function that refreshes the session token, persists it to the
+                configuration entry, and returns the refreshed token dictionary.
+            marginSecs (int):
+                Time interval (in seconds) before the token expires that it is refreshed
+                in the background.
+        """
+        self._hass:HomeAssistant = hass
+        self._entry:ConfigEntry = entry
+        self._refreshFunc:Callable[[], Awaitable[dict]] = refreshFunc
+        self._marginSecs:int = marginSecs
+        self._spotifyClient:SpotifyClient = None
+        self._coordinator:SpotifyPlusPlayStateCoordinator = None
+        self._unsubscribeTimer:Callable[[], None] = None
+        self._backgroundTask:asyncio.Task = None
+        self._refreshTask:asyncio.Task = None
+        self._nextRefreshUtc:datetime = None
+
+
+    @property
+    def IsRefreshing(self) -> bool:
+        """
+        True if a token refresh is in flight; otherwise, False.
+        """
+        return (self._refreshTask is not None) and (not self._refreshTask.done())
+
+
+    @property
+    def NextRefreshUtc(self) -> datetime | None:
+        """
+        Date and time (UTC) of the next scheduled background token refresh, or None if
+        no refresh is scheduled.
+        """
+        return self._nextRefreshUtc
+
+
+    @callback
+    def Start(self, spotifyClient:SpotifyClient, coordinator:SpotifyPlusPlayStateCoordinator) -> None:
+        """
+        Starts refreshing the token of the specified SpotifyClient instance in the background.
+
+        Args:
+            spotifyClient (SpotifyClient):
+                The SpotifyClient instance whose authorization token is kept fresh.
+            coordinator (SpotifyPlusPlayStateCoordinator):
+                The playstate coordinator that records token refresh timing for diagnostics.
+        """
+        self._spotifyClient = spotifyClient
+        self._coordinator = coordinator
+        self._Schedule()
+
+
+    @callback
+    def Stop(self) -> None:
+        """
+        Stops refreshing the token in the background.
+
+        A refresh that is in flight is allowed to complete, as worker threads may be waiting
+        on it; they are released by their wait timeout if it does not.
+        """
+        if (self._unsubscribeTimer is not None):
+            self._unsubscribeTimer()
+            self._unsubscribeTimer = None
+        if (self._backgroundTask is not None) and (not self._backgroundTask.done()):
+            self._backgroundTask.cancel()
+        self._backgroundTask = None
+        self._nextRefreshUtc = None
+        self._spotifyClient = None
+        self._coordinator = None
+
+
+    async def async_RefreshToken(self, isBackground:bool=False) -> dict:
+        """
+        Returns a fresh token, starting a token refresh if one is not already in flight.
+
+        Args:
+            isBackground (bool):
+                True if the refresh is a scheduled background refresh; otherwise, False if
+                a caller found the token expired.
+
+        Returns:
+            A dictionary that contains the refreshed token.
+
+        Raises:
+            Exception:
+                The exception raised by the token refresh, if it failed; every caller that
+                shared the refresh receives the same exception.
+
+        This method must be called from the event loop.
+        """
+        if not self.IsRefreshing:
+
+            # was the token already refreshed (e.g. by a refresh that completed while this caller
+            # was waiting to be scheduled)?  if so, then there is nothing to refresh.
+            if (not isBackground):
+                token:dict = self._entry.data.get("token", None)
+                if (token is not None) and (not SpotifyAuthToken("TokenRefreshAuthType", "TokenRefreshProfileId", root=token).IsExpired):
+                    _logsi.LogVerbose("'%s': OAuth2 session token was already refreshed; refresh not necessary" % self._entry.title, colorValue=SIColors.Gold)
+                    self._SwapToken(token)
+                    return token
+
+            self._refreshTask = self._hass.async_create_background_task(
+                self._async_RefreshTokenFlight(isBackground),
+                "%s_token_refresh" % self._entry.entry_id,
+            )
+        else:
+            _logsi.LogVerbose("'%s': Token refresh is in flight; waiting on its result" % self._entry.title, colorValue=SIColors.Gold)
+
+        # a caller that is cancelled (or times out) must not cancel the refresh for the others.
+        return await asyncio.shield(self._refreshTask)
+
+
+    async def async_WaitIdle(self) -> None:
+        """
+        Waits for a token refresh that is in flight to complete; refresh exceptions are
+        ignored, as they are reported to the callers that requested the refresh.
+        """
+        if self.IsRefreshing:
+            await asyncio.wait([self._refreshTask])
+
+
+    def RefreshTokenWait(self, timeoutSecs:float=SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT) -> dict:
+        """
+        Returns a fresh token; called from worker threads (e.g. the SpotifyClient token updater)
+        that found the token expired.
+
+        Args:
+            timeoutSecs (float):
+                Maximum time (in seconds) to wait for the refresh to complete.
+
+        Returns:
+            A dictionary that contains the refreshed token.
+
+        Raises:
+            TimeoutError:
+                If the refresh did not complete within the timeout.
+            Exception:
+                The exception raised by the token refresh, if it failed.
+
+        The refresh runs in the event loop; this thread only waits on it, so no lock is
+        held while waiting, and threads waiting on the same refresh do not queue behind
+        each other.
+        """
+        if (self._hass.loop_thread_id == threading.get_ident()):
+            raise RuntimeError("RefreshTokenWait cannot be called from the event loop; use async_RefreshToken instead")
+
+        startMonotonic:float = time.monotonic()
+        isError:bool = True
+        future:concurrent.futures.Future = asyncio.run_coroutine_threadsafe(self.async_RefreshToken(), self._hass.loop)
+        try:
+
+            token:dict = future.result(timeoutSecs)
+            isError = False
+            return token
+
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError("Authorization token refresh did not complete within %d seconds" % timeoutSecs) from None
+
+        finally:
+
+            # record token refresh wait timing for diagnostics.
+            coordinator:SpotifyPlusPlayStateCoordinator = self._coordinator
+            if (coordinator is not None):
+                coordinator.RecordTokenRefreshWait(time.monotonic() - startMonotonic, isError)
+
+
+    async def _async_RefreshTokenFlight(self, isBackground:bool) -> dict:
+        """
+        Performs a single token refresh, and swaps the refreshed token into the SpotifyClient
+        instance.
+
+        Args:
+            isBackground (bool):
+                True if the refresh is a scheduled background refresh; otherwise, False.
+
+        Returns:
+            A dictionary that contains the refreshed token.
+        """
+        startMonotonic:float = time.monotonic()
+        isError:bool = True
+        try:
+
+            async with asyncio.timeout(SPOTIFY_WEBAPI_REQUEST_TIMEOUT):
+                token:dict = await self._refreshFunc()
+            self._SwapToken(token)
+            isError = False
+            return token
+
+        finally:
+
+            # record token refresh timing for diagnostics.
+            coordinator:SpotifyPlusPlayStateCoordinator = self._coordinator
+            if (coordinator is not None):
+                coordinator.RecordTokenRefresh(time.monotonic() - startMonotonic, isBackground, isError)
+
+
+    def _SwapToken(self, token:dict) -> None:
+        """
+        Replaces the SpotifyClient authorization token with a refreshed token.
+
+        Args:
+            token (dict):
+                The refreshed token dictionary.
+
+        The SpotifyClient reads its token via a single attribute reference, so assigning a
+        fully-built token object is atomic as far as worker threads are concerned; a request
+        that is in progress uses either the old (still valid) token or the new one.
+        """
+        client:SpotifyClient = self._spotifyClient
+        if (client is None) or (client.AuthToken is None):
+            return
+        authToken:SpotifyAuthToken = SpotifyAuthToken(client.AuthToken.AuthorizationType, client.AuthToken.ProfileId, root=token)
+        if (client._AuthClient is not None) and (client._AuthClient.Session is not None):
+            client._AuthClient.Session.token = token
+        client._AuthToken = authToken
+
+
+    @callback
+    def _Schedule(self, delaySecs:float=None) -> None:
+        """
+        Schedules the next background token refresh.
+
+        Args:
+            delaySecs (float):
+                Time interval (in seconds) to wait before the refresh; if None, then the
+                refresh is scheduled a margin before the current token expires.
+        """
+        if (self._unsubscribeTimer is not None):
+            self._unsubscribeTimer()
+            self._unsubscribeTimer = None
+        self._nextRefreshUtc = None
+        if (self._spotifyClient is None):
+            return
+
+        dtUtcNow:datetime = utcnow()
+        if (delaySecs is None):
+            authToken:SpotifyAuthToken = self._spotifyClient.AuthToken
+            if (authToken is None) or (authToken.ExpiresAt is None):
+                return
+            dtUtcRefresh:datetime = utc_from_timestamp(authToken.ExpiresAt - self._marginSecs)
+        else:
+            dtUtcRefresh:datetime = dtUtcNow + timedelta(seconds=delaySecs)
+
+        # a refresh that is already due is started one tick from now.
+        dtUtcRefresh = max(dtUtcRefresh, dtUtcNow + timedelta(seconds=1))
+        self._nextRefreshUtc = dtUtcRefresh
+        _logsi.LogVerbose("'%s': Background token refresh is scheduled for %s UTC" % (self._entry.title, dtUtcRefresh.isoformat(timespec="seconds")), colorValue=SIColors.Gold)
+        self._unsubscribeTimer = async_track_point_in_utc_time(self._hass, self._HandleTimer, dtUtcRefresh)
+
+
+    @callback
+    def _HandleTimer(self, dtUtcNow:datetime) -> None:
+        """
+        Starts the background token refresh task when the refresh timer expires.
+
+        Args:
+            dtUtcNow (datetime):
+                Date and time (UTC) the timer expired.
+        """
+        self._unsubscribeTimer = None
+        self._nextRefreshUtc = None
+        if (self._spotifyClient is None):
+            return
+        if (self._backgroundTask is not None) and (not self._backgroundTask.done()):
+            return
+        self._backgroundTask = self._hass.async_create_background_task(
+            self._async_RefreshBackground(),
+            "%s_token_refresh_background" % self._entry.entry_id,
+        )
+
+
+    async def _async_RefreshBackground(self) -> None:
+        """
+        Refreshes the token in the background (if it is still due), and schedules the next
+        refresh.
+        """
+        # was the token already refreshed by a foreground request?  if so, then just
+        # reschedule for the refreshed token expiration.
+        authToken:SpotifyAuthToken = self._spotifyClient.AuthToken
+        if (authToken is not None) and (authToken.ExpiresAt is not None) and (authToken.ExpiresAt - self._marginSecs > time.time()):
+            self._Schedule()
+            return
+
+        try:
+
+            token:dict = await self.async_RefreshToken(isBackground=True)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as ex:
+
+            _logsi.LogWarning("'%s': Background token refresh failed (%s); retrying in %d seconds" % (self._entry.title, str(ex), SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL), colorValue=SIColors.Gold)
+            self._Schedule(SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL)
+            return
+
+        # was the token not actually refreshed (e.g. the refresh token was revoked, and the
+        # user must re-authenticate)?  if so, then stop, rather than refreshing continuously.
+        authToken = SpotifyAuthToken("TokenRefreshAuthType", "TokenRefreshProfileId", root=token)
+        if (authToken.ExpiresAt is None) or (authToken.ExpiresAt - self._marginSecs <= time.time()):
+            _logsi.LogWarning("'%s': Background token refresh did not return a fresh token; background refresh is stopped" % (self._entry.title), colorValue=SIColors.Gold)
+            return
+
+        _logsi.LogVerbose("'%s': Background token refresh complete; token expires at %s UTC" % (self._entry.title, utc_from_timestamp(authToken.ExpiresAt).isoformat(timespec="seconds")), colorValue=SIColors.Gold)
+        self._Schedule()
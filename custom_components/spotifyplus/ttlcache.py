@@ -0,0 +1,209 @@
+"""
+Bounded least-recently-used cache with per-entry time-to-live expiration.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Generic, TypeVar
+
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+
+
+class TtlCacheEntry(Generic[_VT]):
+    """
+    A single cache entry.
+    """
+
+    __slots__ = ("Value", "IsNegative", "ExpiresMonotonic")
+
+    def __init__(self, value:_VT, isNegative:bool, expiresMonotonic:float) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            value (_VT):
+                Cached value.
+            isNegative (bool):
+                True if the entry records a failed lookup; otherwise, False.
+            expiresMonotonic (float):
+                Monotonic clock time at which the entry expires.
+        """
+        self.Value:_VT = value
+        self.IsNegative:bool = isNegative
+        self.ExpiresMonotonic:float = expiresMonotonic
+
+
+class TtlCache(Generic[_KT, _VT]):
+    """
+    A thread-safe, size-bounded least-recently-used cache whose entries expire after
+    a time-to-live interval.
+
+    Failed lookups can be stored as "negative" entries (with their own time-to-live),
+    so that a lookup which is known to fail is not retried on every request.
+    """
+
+    def __init__(
+        self,
+        name:str,
+        maxEntries:int,
+        ttl:float,
+        ttlNegative:float=None,
+        ) -> None:
+        """
+        Initializes a new instance of the class.
+
+        Args:
+            name (str):
+                Name of the cache, for trace purposes.
+            maxEntries (int):
+                Maximum number of entries to store; the least-recently-used entry is
+                evicted when the limit is exceeded.
+            ttl (float):
+                Time interval (in seconds) that a positive entry remains valid.
+            ttlNegative (float):
+                Time interval (in seconds) that a negative entry remains valid.
+                Defaults to the `ttl` value if not specified.
+        """
+        self._name:str = name
+        self._maxEntries:int = max(1, maxEntries)
+        self._ttl:float = ttl
+        self._ttlNegative:float = ttl if ttlNegative is None else ttlNegative
+        self._entries:OrderedDict[_KT, TtlCacheEntry[_VT]] = OrderedDict()
+        self._lock:threading.Lock = threading.Lock()
+        self._evictions:int = 0
+        self._hits:int = 0
+        self._hitsNegative:int = 0
+        self._misses:int = 0
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+    @property
+    def Evictions(self) -> int:
+        """
+        Number of entries that were evicted due to the size bound.
+        """
+        return self._evictions
+
+
+    @property
+    def Hits(self) -> int:
+        """
+        Number of lookups that were satisfied from the cache (including negative entries).
+        """
+        return self._hits
+
+
+    @property
+    def HitsNegative(self) -> int:
+        """
+        Number of lookups that were satisfied by a negative cache entry.
+        """
+        return self._hitsNegative
+
+
+    @property
+    def Misses(self) -> int:
+        """
+        Number of lookups that were not found in the cache, or had expired.
+        """
+        return self._misses
+
+
+    @property
+    def Name(self) -> str:
+        """
+        Name of the cache.
+        """
+        return self._name
+
+
+    def Clear(self) -> None:
+        """
+        Removes all entries from the cache.  Statistics are not reset.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+    def Get(self, key:_KT) -> TtlCacheEntry[_VT] | None:
+        """
+        Returns the cache entry for the specified key, or None if the key is not
+        cached or the entry has expired.
+
+        Args:
+            key (_KT):
+                Cache key.
+
+        Returns:
+            A `TtlCacheEntry` object if found; otherwise, None.  Check the entry `IsNegative`
+            property to determine if the entry records a failed lookup.
+        """
+        with self._lock:
+            entry:TtlCacheEntry[_VT] = self._entries.get(key, None)
+            if (entry is not None) and (entry.ExpiresMonotonic <= time.monotonic()):
+                del self._entries[key]
+                entry = None
+            if (entry is None):
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if (entry.IsNegative):
+                self._hitsNegative += 1
+            return entry
+
+
+    def Invalidate(self, key:_KT) -> None:
+        """
+        Removes the entry for the specified key from the cache, if present.
+
+        Args:
+            key (_KT):
+                Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+    def Set(self, key:_KT, value:_VT, isNegative:bool=False) -> None:
+        """
+        Adds or replaces the cache entry for the specified key.
+
+        Args:
+            key (_KT):
+                Cache key.
+            value (_VT):
+                Value to cache.
+            isNegative (bool):
+                True if the entry records a failed lookup (uses the negative time-to-live);
+                otherwise, False.
+        """
+        ttl:float = self._ttlNegative if isNegative else self._ttl
+        with self._lock:
+            self._entries[key] = TtlCacheEntry(value, isNegative, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while (len(self._entries) > self._maxEntries):
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+    def ToDictionary(self) -> dict[str, Any]:
+        """
+        Returns a dictionary of cache statistics, suitable for diagnostics output.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._maxEntries,
+                "hits": self._hits,
+                "hits_negative": self._hitsNegative,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
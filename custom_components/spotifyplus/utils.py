@@ -92,3 +92,23 @@ def passwordMaskString(inputObj:str) -> str:
     result:str = ''.ljust(len(inputObj), '*')
                 
     return result
+
+
+def restoreInstanceAttribute(obj:object, name:str, previousValue:object) -> None:
+    """
+    Restores an instance attribute that was replaced by a wrapper (e.g. a method override),
+    to the value it had before the wrapper was installed.
+
+    Args:
+        obj (object):
+            Object instance that the wrapper was installed on.
+        name (str):
+            Name of the instance attribute.
+        previousValue (object):
+            Instance attribute value before the wrapper was installed, or None if the
+            instance did not have the attribute (e.g. the class method was used).
+    """
+    if (previousValue is None):
+        obj.__dict__.pop(name, None)
+    else:
+        setattr(obj, name, previousValue)
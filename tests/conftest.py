@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the SpotifyPlus component tests.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Iterator
+
+import pytest
+
+
+class LoopThreadHass:
+    """
+    Minimal HomeAssistant stand-in whose event loop runs in a background thread, so that
+    tests can call component methods both from the event loop and from worker threads.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the class, and starts the event loop thread.
+        """
+        self.data:dict[str, Any] = {}
+        self.loop:asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread:threading.Thread = threading.Thread(target=self.loop.run_forever, name="hass_loop", daemon=True)
+        self._thread.start()
+        self.loop_thread_id:int = self._thread.ident
+
+
+    def async_create_task(self, target:Coroutine, name:str=None, eager_start:bool=True) -> asyncio.Task:
+        """
+        Creates a task in the event loop; must be called from the event loop.
+        """
+        return self.loop.create_task(target, name=name)
+
+
+    def async_create_background_task(self, target:Coroutine, name:str, eager_start:bool=True) -> asyncio.Task:
+        """
+        Creates a background task in the event loop; must be called from the event loop.
+        """
+        return self.loop.create_task(target, name=name)
+
+
+    def RunSync(self, coro:Coroutine, timeoutSecs:float=30) -> Any:
+        """
+        Runs a coroutine in the event loop, and returns its result.
+
+        Args:
+            coro (Coroutine):
+                Coroutine to run.
+            timeoutSecs (float):
+                Maximum time (in seconds) to wait for the coroutine to complete.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeoutSecs)
+
+
+    def Stop(self) -> None:
+        """
+        Cancels all pending tasks, and stops the event loop thread.
+        """
+        async def _async_CancelTasks() -> None:
+            tasks:list[asyncio.Task] = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.RunSync(_async_CancelTasks())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(10)
+        self.loop.close()
+
+
+@pytest.fixture
+def loop_hass() -> Iterator[LoopThreadHass]:
+    """
+    Returns a HomeAssistant stand-in whose event loop runs in a background thread.
+    """
+    hass:LoopThreadHass = LoopThreadHass()
+    try:
+        yield hass
+    finally:
+        hass.Stop()
@@ -0,0 +1,224 @@
+"""
+Tests of the media browser category content ids and node paging (see `browse_media.py`).
+
+Category playlists nodes are identified by a `spotify:category:<id>` content id; content
+ids that were created by previous versions (a base64 pickle of the Category object) are
+still accepted, but may only load the classes that a Category object is made of.
+
+Paged nodes display one page of items, followed by a "More…" child node whose content id
+carries the page token of the next page.
+"""
+from __future__ import annotations
+
+import base64
+import os
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from homeassistant.exceptions import IntegrationError
+from spotifywebapipython.models import Category
+
+from custom_components.spotifyplus.browse_media import (
+    BROWSE_MORE_TITLE,
+    CATEGORY_BASE64,
+    CATEGORY_URI_PREFIX,
+    SPOTIFY_LIBRARY_MAP,
+    _GetNextPageOffset,
+    _SplitPageToken,
+    browse_media_node,
+    deserialize_object,
+)
+from custom_components.spotifyplus.const import (
+    SPOTIFY_BROWSE_PAGE_SIZE,
+    SPOTIFY_BROWSE_PAGE_TOKEN,
+    BrowsableMedia,
+)
+
+CATEGORY_ROOT:dict = {
+    "href": "https://api.spotify.com/v1/browse/categories/0JQ5DAqbMKFQ00XGBls6ym",
+    "id": "0JQ5DAqbMKFQ00XGBls6ym",
+    "name": "Hip-Hop",
+    "icons": [
+        {"url": "https://t.scdn.co/images/728ed47fc1674feb95f7ac20236eb6d7.jpeg", "height": 274, "width": 274},
+    ],
+}
+""" Spotify Web API response of a browse category. """
+
+
+class _FakeClient:
+    """
+    Fake SpotifyClient that records the category ids of the category playlists it returns.
+    """
+
+    def __init__(self) -> None:
+        self.CategoryIds:list[str] = []
+        self.ConfigurationCache:dict = {}
+
+
+    def GetBrowseCategorysList(self, refresh:bool=True) -> list[Category]:
+        return [Category(root=CATEGORY_ROOT)]
+
+
+    def GetCategoryPlaylists(self, categoryId:str, limit:int=20, offset:int=0, sortResult:bool=True) -> tuple:
+        self.CategoryIds.append(categoryId)
+        playlist = SimpleNamespace(Id="37i9dQZF1DX0XUsuxWHRQd", Name="RapCaviar", Uri="spotify:playlist:37i9dQZF1DX0XUsuxWHRQd", ImageUrl=None)
+        return SimpleNamespace(Items=[playlist], Next=None), "Hip-Hop"
+
+
+class _ReduceToSystem:
+    """
+    Object whose pickle runs a shell command when it is loaded.
+    """
+
+    def __init__(self, command:str) -> None:
+        self._command:str = command
+
+
+    def __reduce__(self):
+        return (os.system, (self._command,))
+
+
+def _LegacyContentId(obj:object, protocol:int) -> str:
+    """
+    Returns a category playlists content id in the form that previous versions created.
+    """
+    return CATEGORY_BASE64 + base64.b64encode(pickle.dumps(obj, protocol=protocol)).decode('ascii')
+
+
+def _BrowseCategory(client:_FakeClient, media_content_id:str):
+    return browse_media_node(None, client, "test", None, SPOTIFY_LIBRARY_MAP, BrowsableMedia.SPOTIFY_CATEGORY_PLAYLISTS, media_content_id)
+
+
+@pytest.mark.parametrize("protocol", [4, 5])
+def test_legacy_category_content_id_is_resolved(protocol:int) -> None:
+    contentId:str = _LegacyContentId(Category(root=CATEGORY_ROOT), protocol)
+
+    category:Category = deserialize_object(contentId[len(CATEGORY_BASE64):])
+    assert category.Id == CATEGORY_ROOT["id"]
+    assert category.Name == CATEGORY_ROOT["name"]
+    assert category.ImageUrl == CATEGORY_ROOT["icons"][0]["url"]
+
+    client:_FakeClient = _FakeClient()
+    browseMedia = _BrowseCategory(client, contentId)
+    assert client.CategoryIds == [CATEGORY_ROOT["id"]]
+    assert browseMedia.title == CATEGORY_ROOT["name"]
+    assert [child.title for child in browseMedia.children] == ["RapCaviar"]
+
+
+def test_category_content_id_is_resolved() -> None:
+    client:_FakeClient = _FakeClient()
+    browseMedia = _BrowseCategory(client, CATEGORY_URI_PREFIX + CATEGORY_ROOT["id"])
+    assert client.CategoryIds == [CATEGORY_ROOT["id"]]
+    assert browseMedia.title == CATEGORY_ROOT["name"]
+    assert browseMedia.thumbnail == CATEGORY_ROOT["icons"][0]["url"]
+
+
+def test_legacy_content_id_cannot_run_code(tmp_path) -> None:
+    markerPath = tmp_path / "pwned"
+    contentId:str = _LegacyContentId(_ReduceToSystem("touch %s" % markerPath), 4)
+
+    with pytest.raises(pickle.UnpicklingError, match="posix.system|nt.system|os.system"):
+        deserialize_object(contentId[len(CATEGORY_BASE64):])
+
+    client:_FakeClient = _FakeClient()
+    with pytest.raises(IntegrationError) as excInfo:
+        _BrowseCategory(client, contentId)
+    assert isinstance(excInfo.value.__cause__, pickle.UnpicklingError)
+
+    assert not markerPath.exists()
+    assert client.CategoryIds == []
+
+
+def test_category_content_id_is_shorter_than_legacy_content_id() -> None:
+    category:Category = Category(root=CATEGORY_ROOT)
+    contentId:str = CATEGORY_URI_PREFIX + category.Id
+    assert len(contentId) < len(_LegacyContentId(category, pickle.DEFAULT_PROTOCOL))
+    assert len(contentId) < len(_LegacyContentId(category, 4))
+
+
+class _FakePagedClient:
+    """
+    Fake SpotifyClient that returns playlist favorites in pages.
+    """
+
+    def __init__(self, total:int) -> None:
+        self.Offsets:list[int] = []
+        self._total:int = total
+
+
+    def GetPlaylistFavorites(self, limit:int=20, offset:int=0, sortResult:bool=True) -> SimpleNamespace:
+        self.Offsets.append(offset)
+        items:list = [
+            SimpleNamespace(Id="playlist%d" % index, Name="Playlist %d" % index, Uri="spotify:playlist:playlist%d" % index, ImageUrl=None)
+            for index in range(offset, min(offset + limit, self._total))
+        ]
+        return SimpleNamespace(Items=items, Next="next" if (offset + limit < self._total) else None)
+
+
+def _BrowseUserPlaylists(client:_FakePagedClient, media_content_id:str):
+    return browse_media_node(None, client, "test", None, SPOTIFY_LIBRARY_MAP, BrowsableMedia.SPOTIFY_USER_PLAYLISTS, media_content_id)
+
+
+@pytest.mark.parametrize(
+    "media_content_id, expected",
+    [
+        (None, (None, None)),
+        ("spotifyplus_user_playlists", ("spotifyplus_user_playlists", None)),
+        ("spotifyplus_user_playlists" + SPOTIFY_BROWSE_PAGE_TOKEN + "50", ("spotifyplus_user_playlists", "50")),
+        ("spotify:artist:0TnOYISbd1XYRBk9myaseg" + SPOTIFY_BROWSE_PAGE_TOKEN + "0TnOYISbd1XYRBk9myaseg", ("spotify:artist:0TnOYISbd1XYRBk9myaseg", "0TnOYISbd1XYRBk9myaseg")),
+        ("a" + SPOTIFY_BROWSE_PAGE_TOKEN + "b" + SPOTIFY_BROWSE_PAGE_TOKEN + "100", ("a" + SPOTIFY_BROWSE_PAGE_TOKEN + "b", "100")),
+    ],
+)
+def test_split_page_token(media_content_id:str, expected:tuple) -> None:
+    assert _SplitPageToken(media_content_id) == expected
+
+
+def test_next_page_offset() -> None:
+    assert _GetNextPageOffset(None, 0) is None
+    assert _GetNextPageOffset(SimpleNamespace(Items=[1, 2, 3], Next=None), 0) is None
+    assert _GetNextPageOffset(SimpleNamespace(Items=[], Next="next"), 50) is None
+    assert _GetNextPageOffset(SimpleNamespace(Items=[1, 2, 3], Next="next"), 0) == "3"
+    assert _GetNextPageOffset(SimpleNamespace(Items=[1] * 50, Next="next"), 50) == "100"
+
+
+def test_more_node_pages_through_all_items() -> None:
+    total:int = SPOTIFY_BROWSE_PAGE_SIZE * 2 + 7
+    client:_FakePagedClient = _FakePagedClient(total)
+    contentId:str = BrowsableMedia.SPOTIFY_USER_PLAYLISTS.value
+    titles:list[str] = []
+    pageContentIds:list[str] = []
+
+    while (contentId is not None):
+        browseMedia = _BrowseUserPlaylists(client, contentId)
+        pageContentIds.append(browseMedia.media_content_id)
+        children:list = browseMedia.children
+        contentId = None
+        if (children[-1].title == BROWSE_MORE_TITLE):
+            assert children[-1].can_expand and not children[-1].can_play
+            assert children[-1].media_content_type == BrowsableMedia.SPOTIFY_USER_PLAYLISTS
+            contentId = children[-1].media_content_id
+            children = children[:-1]
+        titles.extend(child.title for child in children)
+
+    base:str = BrowsableMedia.SPOTIFY_USER_PLAYLISTS.value
+    assert pageContentIds == [
+        base,
+        base + SPOTIFY_BROWSE_PAGE_TOKEN + str(SPOTIFY_BROWSE_PAGE_SIZE),
+        base + SPOTIFY_BROWSE_PAGE_TOKEN + str(SPOTIFY_BROWSE_PAGE_SIZE * 2),
+    ]
+    assert client.Offsets == [0, SPOTIFY_BROWSE_PAGE_SIZE, SPOTIFY_BROWSE_PAGE_SIZE * 2]
+    assert titles == ["Playlist %d" % index for index in range(total)]
+
+
+def test_continuation_page_is_titled_with_its_item_range() -> None:
+    client:_FakePagedClient = _FakePagedClient(SPOTIFY_BROWSE_PAGE_SIZE + 7)
+    browseMedia = _BrowseUserPlaylists(client, BrowsableMedia.SPOTIFY_USER_PLAYLISTS.value + SPOTIFY_BROWSE_PAGE_TOKEN + str(SPOTIFY_BROWSE_PAGE_SIZE))
+    assert browseMedia.title.endswith("(%d - %d)" % (SPOTIFY_BROWSE_PAGE_SIZE + 1, SPOTIFY_BROWSE_PAGE_SIZE + 7))
+    assert browseMedia.can_play is False
+    assert BROWSE_MORE_TITLE not in [child.title for child in browseMedia.children]
@@ -0,0 +1,156 @@
+"""
+Tests of the stale-while-revalidate browse cache (see `browsecache.py`).
+
+The cache module clock is replaced by a fake clock, so that entries can be moved through
+their fresh and stale intervals without waiting.
+"""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+
+from custom_components.spotifyplus import browsecache
+from custom_components.spotifyplus.browsecache import SpotifyPlusBrowseCache
+from custom_components.spotifyplus.const import SPOTIFY_BROWSE_PAGE_TOKEN
+
+ENTITY_ID:str = "media_player.spotifyplus_test"
+""" Entity id of the media player that nodes are built for. """
+
+NODE_TTL:float = 60
+""" Time interval (in seconds) that a built node remains fresh. """
+
+STALE_TTL:float = 300
+""" Time interval (in seconds) after a node expires that it can still be returned. """
+
+
+class _FakeClock:
+    """
+    Fake monotonic clock that only moves when it is advanced.
+    """
+
+    def __init__(self) -> None:
+        self.NowMonotonic:float = 1000.0
+
+
+    def monotonic(self) -> float:
+        return self.NowMonotonic
+
+
+class _FakeBuilder:
+    """
+    Fake node builder that returns a new node version for each build.
+    """
+
+    def __init__(self, name:str) -> None:
+        self.BuildCount:int = 0
+        self.Release:asyncio.Event = None
+        self._name:str = name
+
+
+    async def async_Build(self) -> str:
+        self.BuildCount += 1
+        version:int = self.BuildCount
+        if (self.Release is not None):
+            await self.Release.wait()
+        return "%s v%d" % (self._name, version)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _FakeClock:
+    fakeClock:_FakeClock = _FakeClock()
+    monkeypatch.setattr(browsecache, "time", SimpleNamespace(monotonic=fakeClock.monotonic))
+    return fakeClock
+
+
+def test_stale_entry_is_returned_while_it_is_revalidated(loop_hass, clock) -> None:
+    cache:SpotifyPlusBrowseCache = SpotifyPlusBrowseCache(loop_hass, "test", 10, STALE_TTL)
+    builder:_FakeBuilder = _FakeBuilder("playlists")
+
+    async def _async_Get() -> str:
+        return await cache.async_GetOrBuild(ENTITY_ID, "spotifyplus_user_playlists", "spotifyplus_user_playlists", NODE_TTL, builder.async_Build)
+
+    async def _async_Test() -> None:
+        assert await _async_Get() == "playlists v1"
+        clock.NowMonotonic += NODE_TTL / 2
+        assert await _async_Get() == "playlists v1"
+        assert builder.BuildCount == 1
+
+        # an expired entry is returned as-is, and rebuilt in the background.
+        builder.Release = asyncio.Event()
+        clock.NowMonotonic += NODE_TTL
+        assert await _async_Get() == "playlists v1"
+        assert await _async_Get() == "playlists v1"
+        await asyncio.sleep(0.01)
+        assert builder.BuildCount == 2
+        builder.Release.set()
+        await asyncio.sleep(0.01)
+
+        assert await _async_Get() == "playlists v2"
+
+        # an entry that is past its stale interval is rebuilt before it is returned.
+        builder.Release = None
+        clock.NowMonotonic += NODE_TTL + STALE_TTL
+        assert await _async_Get() == "playlists v3"
+
+    loop_hass.RunSync(_async_Test())
+    stats:dict = cache.ToDictionary()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
+    assert stats["hits_stale"] == 2
+    assert stats["revalidations"] == 1
+
+
+def test_build_in_progress_is_not_cached_after_invalidation(loop_hass, clock) -> None:
+    cache:SpotifyPlusBrowseCache = SpotifyPlusBrowseCache(loop_hass, "test", 10, STALE_TTL)
+    builder:_FakeBuilder = _FakeBuilder("tracks")
+
+    async def _async_Get() -> str:
+        return await cache.async_GetOrBuild(ENTITY_ID, "spotifyplus_user_saved_tracks", "spotifyplus_user_saved_tracks", NODE_TTL, builder.async_Build)
+
+    async def _async_Test() -> None:
+        builder.Release = asyncio.Event()
+        pending:asyncio.Task = asyncio.ensure_future(_async_Get())
+        await asyncio.sleep(0.01)
+
+        # a service call saves a track favorite while the node is being built.
+        cache.Invalidate("spotifyplus_user_saved_tracks")
+        builder.Release.set()
+        assert await pending == "tracks v1"
+        assert len(cache) == 0
+
+        builder.Release = None
+        assert await _async_Get() == "tracks v2"
+        assert await _async_Get() == "tracks v2"
+
+    loop_hass.RunSync(_async_Test())
+    assert builder.BuildCount == 2
+    assert len(cache) == 1
+
+
+def test_invalidation_removes_continuation_pages(loop_hass, clock) -> None:
+    cache:SpotifyPlusBrowseCache = SpotifyPlusBrowseCache(loop_hass, "test", 10, STALE_TTL)
+    playlistId:str = "spotify:playlist:37i9dQZF1DX0XUsuxWHRQd"
+    keys:list[tuple[str, str, str]] = [
+        (ENTITY_ID, "playlist", playlistId),
+        (ENTITY_ID, "playlist", playlistId + SPOTIFY_BROWSE_PAGE_TOKEN + "50"),
+        (ENTITY_ID, "playlist", playlistId + SPOTIFY_BROWSE_PAGE_TOKEN + "100"),
+        ("media_player.spotifyplus_other", "playlist", playlistId + SPOTIFY_BROWSE_PAGE_TOKEN + "50"),
+        (ENTITY_ID, "playlist", playlistId + "X"),
+        (ENTITY_ID, "playlist", "spotify:playlist:37i9dQZF1DXcBWIGoYBM5M"),
+        (ENTITY_ID, "album", playlistId),
+    ]
+    for key in keys:
+        cache.Set(key, str(key), NODE_TTL)
+
+    cache.Invalidate("playlist", playlistId)
+
+    assert list(cache._entries) == keys[4:]
+    assert cache.ToDictionary()["invalidations"] == 4
+
+    cache.Invalidate("playlist")
+    assert list(cache._entries) == keys[6:]
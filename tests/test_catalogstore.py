@@ -0,0 +1,168 @@
+"""
+Tests of the persistent catalog store (see `catalogstore.py`).
+
+The HomeAssistant `Store` is replaced by a fake store that keeps its data in memory, and
+that batches delayed saves the same way (each delayed save request replaces the pending one).
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Callable
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+
+from custom_components.spotifyplus import catalogstore
+from custom_components.spotifyplus.catalogstore import SpotifyPlusCatalogStore, async_get_catalog_store
+from custom_components.spotifyplus.const import CATALOG_STORE_KEY, DATA_CATALOG_STORE
+
+SAVE_DELAY:float = 0.1
+""" Time interval (in seconds) that store writes are delayed by. """
+
+
+class _FakeStore:
+    """
+    Fake HomeAssistant `Store` that keeps its data in memory.
+    """
+
+    Instances:list[_FakeStore] = []
+    StoredData:dict = None
+    LoadError:Exception = None
+
+    def __init__(self, hass, version:int, key:str) -> None:
+        self.Key:str = key
+        self.LoadCount:int = 0
+        self.SaveRequestCount:int = 0
+        self.Writes:list[dict] = []
+        self._hass = hass
+        self._handle:asyncio.TimerHandle = None
+        _FakeStore.Instances.append(self)
+
+
+    async def async_load(self) -> dict | None:
+        self.LoadCount += 1
+        await asyncio.sleep(0.01)
+        if (_FakeStore.LoadError is not None):
+            raise _FakeStore.LoadError
+        return _FakeStore.StoredData
+
+
+    def async_delay_save(self, data_func:Callable[[], dict], delay:float=0) -> None:
+        self.SaveRequestCount += 1
+        if (self._handle is not None):
+            self._handle.cancel()
+        self._handle = self._hass.loop.call_later(delay, lambda: self.Writes.append(data_func()))
+
+
+@pytest.fixture
+def fake_store(monkeypatch) -> type[_FakeStore]:
+    monkeypatch.setattr(catalogstore, "Store", _FakeStore)
+    monkeypatch.setattr(catalogstore, "CATALOG_STORE_SAVE_DELAY", SAVE_DELAY)
+    monkeypatch.setattr(_FakeStore, "Instances", [])
+    monkeypatch.setattr(_FakeStore, "StoredData", None)
+    monkeypatch.setattr(_FakeStore, "LoadError", None)
+    return _FakeStore
+
+
+def _StoredEntry(value:Any, expiresInSecs:float) -> dict:
+    return {"expires": time.time() + expiresInSecs, "value": value}
+
+
+def test_load_restores_unexpired_entries(loop_hass, fake_store) -> None:
+    keyFresh:str = SpotifyPlusCatalogStore.GetKey("user1", "US", None, "GetBrowseCategorysList")
+    keyExpired:str = SpotifyPlusCatalogStore.GetKey("user1", "US", None, "GetAlbumNewReleases")
+    keySetEarly:str = SpotifyPlusCatalogStore.GetKey("user1", "US", None, "GetFeaturedPlaylists")
+    fake_store.StoredData = {
+        "entries": {
+            keyFresh: _StoredEntry(["category1"], 3600),
+            keyExpired: _StoredEntry(["album1"], -1),
+            keySetEarly: _StoredEntry(["playlist1"], 3600),
+        },
+    }
+    store:SpotifyPlusCatalogStore = SpotifyPlusCatalogStore(loop_hass)
+    assert store.Get(keyFresh) is None
+
+    async def _async_Test() -> None:
+        # an entry set before the load completes is not replaced by the stored one.
+        loadTask:asyncio.Future = asyncio.gather(store.async_Load(), store.async_Load())
+        store.Set(keySetEarly, ["playlist2"], 3600)
+        await loadTask
+        await store.async_Load()
+
+    loop_hass.RunSync(_async_Test())
+
+    assert store.IsLoaded
+    assert fake_store.Instances[0].Key == CATALOG_STORE_KEY
+    assert fake_store.Instances[0].LoadCount == 1
+    assert store.Get(keyFresh) == ["category1"]
+    assert store.Get(keyExpired) is None
+    assert store.Get(keySetEarly) == ["playlist2"]
+
+
+def test_damaged_store_is_loaded_empty(loop_hass, fake_store) -> None:
+    fake_store.LoadError = ValueError("invalid json")
+    store:SpotifyPlusCatalogStore = SpotifyPlusCatalogStore(loop_hass)
+
+    loop_hass.RunSync(store.async_Load())
+
+    assert store.IsLoaded
+    assert store.ToDictionary()["entries"] == 0
+
+
+def test_get_or_create_only_requests_missing_values(loop_hass, fake_store) -> None:
+    store:SpotifyPlusCatalogStore = SpotifyPlusCatalogStore(loop_hass)
+    loop_hass.RunSync(store.async_Load())
+    key:str = SpotifyPlusCatalogStore.GetKey("user1", "US", None, "GetBrowseCategorysList")
+    requests:list[str] = []
+
+    def _Create() -> tuple[str, ...]:
+        requests.append(key)
+        return ("category1", "category2")
+
+    def _GetOrCreate(fromStore:Callable[[Any], Any]=tuple) -> Any:
+        return store.GetOrCreate(key, 3600, _Create, list, fromStore)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(_GetOrCreate).result(5) == ("category1", "category2")
+        assert pool.submit(_GetOrCreate).result(5) == ("category1", "category2")
+        assert len(requests) == 1
+        assert store.Get(key) == ["category1", "category2"]
+
+        # a stored value that cannot be converted is requested again.
+        def _FromStore(value:Any) -> Any:
+            raise KeyError("name")
+
+        assert pool.submit(_GetOrCreate, _FromStore).result(5) == ("category1", "category2")
+        assert len(requests) == 2
+
+    stats:dict = store.ToDictionary()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_changes_are_saved_in_a_single_batched_write(loop_hass, fake_store) -> None:
+    store:SpotifyPlusCatalogStore = SpotifyPlusCatalogStore(loop_hass)
+    loop_hass.RunSync(store.async_Load())
+    keys:list[str] = [SpotifyPlusCatalogStore.GetKey("user%d" % index, "US", None, "GetAlbumNewReleases") for index in range(5)]
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        list(pool.map(lambda key: store.Set(key, [key], 3600), keys))
+    store.Set("expired", ["value"], -1)
+    time.sleep(SAVE_DELAY * 3)
+
+    fakeStore:_FakeStore = fake_store.Instances[0]
+    assert fakeStore.SaveRequestCount == 6
+    assert len(fakeStore.Writes) == 1
+    assert sorted(fakeStore.Writes[0]["entries"]) == sorted(keys)
+    assert store.ToDictionary()["saves"] == 1
+
+
+def test_catalog_store_is_shared(loop_hass, fake_store) -> None:
+    store:SpotifyPlusCatalogStore = async_get_catalog_store(loop_hass)
+    assert async_get_catalog_store(loop_hass) is store
+    assert loop_hass.data[DATA_CATALOG_STORE] is store
+    assert not store.IsLoaded
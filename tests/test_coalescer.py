@@ -0,0 +1,102 @@
+"""
+Tests of the latest-wins command coalescer (see `coalescer.py`).
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from custom_components.spotifyplus.coalescer import SpotifyPlusCommandCoalescer
+from custom_components.spotifyplus.const import SPOTIFY_COMMAND_COALESCE_WINDOW
+
+
+class _FakePlayer:
+    """
+    Fake Spotify Connect player that records the volume requests it receives.
+    """
+
+    def __init__(self, latencySecs:float=0.05, error:Exception=None) -> None:
+        self.Requests:list[int] = []
+        self._latencySecs:float = latencySecs
+        self._error:Exception = error
+        self._lock:threading.Lock = threading.Lock()
+
+
+    def PlayerSetVolume(self, volumePercent:int) -> None:
+        time.sleep(self._latencySecs)
+        with self._lock:
+            self.Requests.append(volumePercent)
+        if (self._error is not None):
+            raise self._error
+
+
+def _SubmitVolume(coalescer:SpotifyPlusCommandCoalescer, player:_FakePlayer, volumePercent:int) -> tuple[bool, float, Future]:
+    """
+    Submits a volume command, and returns the Submit result, the time (in seconds) that
+    the calling thread was blocked, and the request future handed to the caller.
+    """
+    startTime:float = time.perf_counter()
+    isRequestIssued:bool = coalescer.Submit("volume", player.PlayerSetVolume, volumePercent)
+    return (isRequestIssued, time.perf_counter() - startTime, SpotifyPlusCommandCoalescer.GetLastFuture())
+
+
+def test_absorbed_commands_do_not_block_the_calling_thread() -> None:
+    coalescer:SpotifyPlusCommandCoalescer = SpotifyPlusCommandCoalescer("test")
+    player:_FakePlayer = _FakePlayer()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+
+        # a slider drag: the first command issues the request, the others are absorbed.
+        owner = pool.submit(_SubmitVolume, coalescer, player, 10)
+        time.sleep(0.02)
+        absorbed:list = [pool.submit(_SubmitVolume, coalescer, player, volumePercent).result(5) for volumePercent in [20, 30, 40, 50]]
+
+        for isRequestIssued, blockedSecs, future in absorbed:
+            assert isRequestIssued is False
+            assert blockedSecs < 0.02
+            assert not future.done()
+
+        isRequestIssued, blockedSecs, ownerFuture = owner.result(5)
+
+    # a single request carried the latest value, and resolved the shared future.
+    assert isRequestIssued is True
+    assert blockedSecs >= SPOTIFY_COMMAND_COALESCE_WINDOW
+    assert player.Requests == [50]
+    assert all(future is ownerFuture for _, _, future in absorbed)
+    assert ownerFuture.done() and ownerFuture.exception() is None
+    assert coalescer.RequestCount == 1
+    assert coalescer.CoalescedCount == 4
+
+
+def test_request_exception_is_raised_to_the_issuing_caller() -> None:
+    coalescer:SpotifyPlusCommandCoalescer = SpotifyPlusCommandCoalescer("test")
+    player:_FakePlayer = _FakePlayer(error=ValueError("device not found"))
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        owner = pool.submit(_SubmitVolume, coalescer, player, 10)
+        time.sleep(0.02)
+        _, _, future = _SubmitVolume(coalescer, player, 20)
+
+        with pytest.raises(ValueError, match="device not found"):
+            owner.result(5)
+
+    # absorbed callers can observe the outcome through the shared future.
+    assert isinstance(future.exception(5), ValueError)
+    assert player.Requests == [20]
+
+
+def test_commands_after_a_request_are_issued_in_a_new_request() -> None:
+    coalescer:SpotifyPlusCommandCoalescer = SpotifyPlusCommandCoalescer("test")
+    player:_FakePlayer = _FakePlayer(latencySecs=0.0)
+
+    assert _SubmitVolume(coalescer, player, 10)[0] is True
+    assert _SubmitVolume(coalescer, player, 20)[0] is True
+    assert SpotifyPlusCommandCoalescer.WasCoalesced() is False
+    assert player.Requests == [10, 20]
@@ -0,0 +1,208 @@
+"""
+Worker thread occupancy benchmark of the playstate coordinator scan (see `coordinator.py`).
+
+Ten media players (one per Spotify user account) are scanned at the same time, with fake
+Spotify Web API responses that take 200 ms.  The async path (`GET /me/player` over the
+shared aiohttp session) is compared with the executor path (the blocking SpotifyClient
+`GetDevicePlaybackState` call in a worker thread of the account executor); the measured
+occupancy of each path is reported in the assertion messages.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from spotifywebapipython.models import PlayerPlayState
+
+from custom_components.spotifyplus import coordinator as coordinator_module
+from custom_components.spotifyplus.coordinator import SpotifyPlusPlayStateCoordinator
+from custom_components.spotifyplus.ratelimiter import SpotifyRequestLane
+
+PLAYER_COUNT:int = 10
+""" Number of media players (Spotify user accounts) that are scanned at the same time. """
+
+REQUEST_LATENCY:float = 0.200
+""" Latency (in seconds) of a fake Spotify Web API request. """
+
+PLAYER_PLAY_STATE_ROOT:dict = {
+    "device": {"id": "0d1841b0976bae2a3a310dd74c0f3df354899bc8", "name": "Office", "type": "Speaker", "volume_percent": 50, "is_active": True},
+    "context": None,
+    "currently_playing_type": "track",
+    "is_playing": True,
+    "progress_ms": 60000,
+    "repeat_state": "off",
+    "shuffle_state": False,
+    "timestamp": 0,
+    "item": {
+        "type": "track",
+        "id": "6rqhFgbbKwnb9MLmUQDhG6",
+        "uri": "spotify:track:6rqhFgbbKwnb9MLmUQDhG6",
+        "name": "Speak to Me",
+        "duration_ms": 240000,
+        "artists": [],
+        "album": {"id": "4LH4d3cOWNNsVw41Gqt2kv", "name": "The Dark Side of the Moon", "uri": "spotify:album:4LH4d3cOWNNsVw41Gqt2kv", "images": [], "artists": []},
+    },
+}
+""" Spotify Web API response of the player playback state. """
+
+
+class _ThreadOccupancy:
+    """
+    Records the threads that wait on fake Spotify Web API requests.
+    """
+
+    def __init__(self) -> None:
+        self.BusyThreadSecs:float = 0
+        self.PeakThreads:int = 0
+        self.ThreadIds:set[int] = set()
+        self._busyThreads:int = 0
+        self._lock:threading.Lock = threading.Lock()
+
+
+    def Wait(self, latencySecs:float) -> None:
+        """
+        Blocks the calling thread for the duration of a request.
+        """
+        with self._lock:
+            self.ThreadIds.add(threading.get_ident())
+            self._busyThreads += 1
+            self.PeakThreads = max(self.PeakThreads, self._busyThreads)
+        startTime:float = time.perf_counter()
+        time.sleep(latencySecs)
+        with self._lock:
+            self.BusyThreadSecs += time.perf_counter() - startTime
+            self._busyThreads -= 1
+
+
+class _FakeResponse:
+    """
+    Fake aiohttp response that waits (without blocking a thread) for the request latency.
+    """
+
+    def __init__(self) -> None:
+        self.headers:dict = {}
+        self.reason:str = "OK"
+        self.status:int = 200
+
+
+    async def __aenter__(self) -> _FakeResponse:
+        await asyncio.sleep(REQUEST_LATENCY)
+        return self
+
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+
+    async def json(self) -> dict:
+        return PLAYER_PLAY_STATE_ROOT
+
+
+class _FakeSession:
+    """
+    Fake aiohttp client session that records the threads that requests were issued from.
+    """
+
+    def __init__(self) -> None:
+        self.ThreadIds:set[int] = set()
+        self.Urls:list[str] = []
+
+
+    def get(self, url:str, headers:dict=None, params:dict=None) -> _FakeResponse:
+        self.ThreadIds.add(threading.get_ident())
+        self.Urls.append(url)
+        return _FakeResponse()
+
+
+class _FakeSpotifyClient:
+    """
+    Fake SpotifyClient whose blocking requests are recorded by a thread occupancy tracker.
+    """
+
+    def __init__(self, userId:str, occupancy:_ThreadOccupancy) -> None:
+        self.AuthToken = SimpleNamespace(HeaderKey="Authorization", HeaderValue="Bearer %s" % userId, IsExpired=False)
+        self.ConfigurationCache:dict = {}
+        self.SpotifyConnectDirectory = SimpleNamespace(UpdateActiveDevice=lambda playerPlayState: None)
+        self.SpotifyWebApiUrlBase:str = "https://api.spotify.com/v1"
+        self.UserProfile = SimpleNamespace(Country="US", Id=userId)
+        self._occupancy:_ThreadOccupancy = occupancy
+
+
+    def GetDevicePlaybackState(self, deviceId:str=None) -> PlayerPlayState:
+        response:dict = self.MakeRequest("GET", SimpleNamespace(MethodName="GetPlayerPlaybackState"))
+        return PlayerPlayState(root=response)
+
+
+    def MakeRequest(self, method:str, msg:SimpleNamespace) -> dict:
+        self._occupancy.Wait(REQUEST_LATENCY)
+        return PLAYER_PLAY_STATE_ROOT
+
+
+    def _CheckResponseForErrors(self, msg:SimpleNamespace, response:object) -> None:
+        return None
+
+
+@pytest.fixture
+def coordinators(loop_hass, monkeypatch) -> tuple[list[SpotifyPlusPlayStateCoordinator], _ThreadOccupancy, _FakeSession]:
+    occupancy:_ThreadOccupancy = _ThreadOccupancy()
+    session:_FakeSession = _FakeSession()
+    monkeypatch.setattr(coordinator_module, "async_get_clientsession", lambda hass: session)
+    items:list[SpotifyPlusPlayStateCoordinator] = [
+        SpotifyPlusPlayStateCoordinator(loop_hass, "user%d" % index, _FakeSpotifyClient("user%d" % index, occupancy), None)
+        for index in range(PLAYER_COUNT)
+    ]
+    try:
+        yield items, occupancy, session
+    finally:
+        for item in items:
+            item.Executor.Shutdown()
+
+
+def _ScanAll(loop_hass, scans) -> tuple[list[PlayerPlayState], float]:
+    """
+    Runs the playstate scan of every coordinator at the same time, and returns the scan
+    results and the elapsed time (in seconds).
+    """
+    async def _async_ScanAll() -> list[PlayerPlayState]:
+        return await asyncio.gather(*[scan() for scan in scans])
+
+    startTime:float = time.perf_counter()
+    results:list[PlayerPlayState] = loop_hass.RunSync(_async_ScanAll())
+    return results, time.perf_counter() - startTime
+
+
+def test_async_playstate_scan_does_not_occupy_worker_threads(loop_hass, coordinators) -> None:
+    items, occupancy, session = coordinators
+
+    results, elapsedSecs = _ScanAll(loop_hass, [item._async_GetPlayerPlaybackState for item in items])
+
+    timings:str = "%d players: async path %.0f ms, %d worker threads, %.2f busy thread-seconds" % (PLAYER_COUNT, elapsedSecs * 1000, occupancy.PeakThreads, occupancy.BusyThreadSecs)
+    assert all(result.Device.Name == "Office" for result in results), timings
+    assert len(session.Urls) == PLAYER_COUNT, timings
+    assert session.ThreadIds == {loop_hass.loop_thread_id}, timings
+    assert occupancy.PeakThreads == 0, timings
+    assert elapsedSecs < REQUEST_LATENCY * 3, timings
+
+
+def test_executor_playstate_scan_occupies_a_worker_thread_per_player(loop_hass, coordinators) -> None:
+    items, occupancy, session = coordinators
+
+    results, elapsedSecs = _ScanAll(loop_hass, [
+        lambda item=item: item.async_RunInExecutor(SpotifyRequestLane.POLL, item.SpotifyClient.GetDevicePlaybackState, None)
+        for item in items
+    ])
+
+    timings:str = "%d players: executor path %.0f ms, %d worker threads, %.2f busy thread-seconds" % (PLAYER_COUNT, elapsedSecs * 1000, occupancy.PeakThreads, occupancy.BusyThreadSecs)
+    assert all(result.Device.Name == "Office" for result in results), timings
+    assert len(session.Urls) == 0, timings
+    assert occupancy.PeakThreads == PLAYER_COUNT, timings
+    assert loop_hass.loop_thread_id not in occupancy.ThreadIds, timings
+    assert occupancy.BusyThreadSecs >= PLAYER_COUNT * REQUEST_LATENCY * 0.9, timings
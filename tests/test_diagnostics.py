@@ -0,0 +1,143 @@
+"""
+Tests of the configuration entry and device diagnostics (see `diagnostics.py`).
+
+Diagnostics are built for a playstate coordinator with a fake Spotify client, whose requests
+are recorded to verify that collecting diagnostics makes no Spotify Web API requests.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from spotifywebapipython.models import SpotifyConnectDevice, SpotifyConnectDevices
+
+from custom_components.spotifyplus import catalogstore
+from custom_components.spotifyplus.const import DOMAIN
+from custom_components.spotifyplus.coordinator import SpotifyPlusPlayStateCoordinator
+from custom_components.spotifyplus.diagnostics import (
+    _GetCacheDictionary,
+    async_get_config_entry_diagnostics,
+    async_get_device_diagnostics,
+)
+
+ENTRY_ID:str = "test_entry_id"
+""" Configuration entry id of the Spotify user account. """
+
+
+class _FakeStore:
+    """
+    Fake HomeAssistant `Store` that is never loaded or saved.
+    """
+
+    def __init__(self, hass, version:int, key:str) -> None:
+        pass
+
+
+class _FakeSpotifyClient:
+    """
+    Fake SpotifyClient that records the Spotify Web API requests it makes.
+    """
+
+    def __init__(self) -> None:
+        self.Requests:list[str] = []
+        self.SpotifyConnectDirectory = SimpleNamespace(GetDevices=self._GetDevices)
+
+
+    def MakeRequest(self, method:str, msg:SimpleNamespace) -> None:
+        self.Requests.append(msg.MethodName)
+
+
+    def _CheckResponseForErrors(self, msg:SimpleNamespace, response:object) -> None:
+        return None
+
+
+    def _GetDevices(self) -> SpotifyConnectDevices:
+        scDevice:SpotifyConnectDevice = SpotifyConnectDevice()
+        scDevice._Id = "0d1841b0976bae2a3a310dd74c0f3df354899bc8"
+        scDevice._Name = "Office"
+        scDevice._IsActiveDevice = True
+        scDevice._ZeroconfResponseInfo = SimpleNamespace(ActiveUser="testuser")
+        scDevices:SpotifyConnectDevices = SpotifyConnectDevices()
+        scDevices._Items.append(scDevice)
+        scDevices._DateLastRefreshed = time.time()
+        return scDevices
+
+
+@pytest.fixture
+def entry() -> SimpleNamespace:
+    return SimpleNamespace(entry_id=ENTRY_ID, title="Test Account", options={"device_password": "secret", "script_turn_on": "script.turn_on"})
+
+
+@pytest.fixture
+def loaded_data(loop_hass, monkeypatch) -> SimpleNamespace:
+    monkeypatch.setattr(catalogstore, "Store", _FakeStore)
+    client:_FakeSpotifyClient = _FakeSpotifyClient()
+    coordinator:SpotifyPlusPlayStateCoordinator = SpotifyPlusPlayStateCoordinator(loop_hass, "testuser", client, None)
+    data:SimpleNamespace = SimpleNamespace(
+        media_player=SimpleNamespace(GetDiagnostics=lambda: {"state_writes": 3}),
+        playstateCoordinator=coordinator,
+        spotifyClient=client,
+        tokenRefresher=SimpleNamespace(NextRefreshUtc=datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)),
+    )
+    loop_hass.data[DOMAIN] = {ENTRY_ID: data}
+    try:
+        yield data
+    finally:
+        coordinator.Executor.Shutdown()
+
+
+def test_unloaded_entry_diagnostics_only_contain_masked_options(loop_hass, entry) -> None:
+    diagInfo:dict = loop_hass.RunSync(async_get_config_entry_diagnostics(loop_hass, entry))
+
+    assert diagInfo == {"options": {"device_password": "******", "script_turn_on": "script.turn_on"}}
+
+
+def test_entry_diagnostics_make_no_spotify_requests(loop_hass, entry, loaded_data) -> None:
+    diagInfo:dict = loop_hass.RunSync(async_get_config_entry_diagnostics(loop_hass, entry))
+
+    assert loaded_data.spotifyClient.Requests == []
+    assert list(diagInfo) == [
+        "options",
+        "coordinator",
+        "token_next_refresh_utc",
+        "rate_limiter",
+        "circuit_breaker",
+        "instrumentation",
+        "executor",
+        "caches",
+        "spotify_connect_directory",
+    ]
+    assert diagInfo["options"]["device_password"] == "******"
+    assert diagInfo["token_next_refresh_utc"] == "2026-01-01T12:00:00+00:00"
+    assert list(diagInfo["caches"]) == ["browse_cache", "catalog_store", "playlist_cache"]
+    assert all(cache["hit_rate"] is None for cache in diagInfo["caches"].values())
+
+    # zeroconf device information is left out, as it may contain account details.
+    directory:dict = diagInfo["spotify_connect_directory"]
+    assert directory["device_count"] == 1
+    assert directory["devices"][0]["name"] == "Office"
+    assert "testuser" not in json.dumps(directory)
+
+    # diagnostics are downloaded as json.
+    json.dumps(diagInfo)
+
+
+def test_device_diagnostics_add_media_player_counters(loop_hass, entry, loaded_data) -> None:
+    diagInfo:dict = loop_hass.RunSync(async_get_device_diagnostics(loop_hass, entry, None))
+
+    assert diagInfo["media_player"] == {"state_writes": 3}
+    assert "coordinator" in diagInfo
+
+
+def test_cache_hit_rate_includes_negative_and_stale_hits() -> None:
+    assert _GetCacheDictionary({"hits": 6, "hits_negative": 1, "hits_stale": 1, "misses": 2})["hit_rate"] == 0.8
+    assert _GetCacheDictionary({"hits": 1, "misses": 2})["hit_rate"] == 0.333
+    assert _GetCacheDictionary({"hits": 0, "misses": 0})["hit_rate"] is None
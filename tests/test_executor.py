@@ -0,0 +1,185 @@
+"""
+Tests and fan-out latency measurement of the request executor (see `executor.py`).
+
+`RunConcurrently` is used by media browser nodes to fetch independent Spotify Web API
+requests (e.g. an artist header and the artist albums page) at the same time.  The
+latency test uses fake requests with a fixed 150 ms latency; the measured sequential
+and concurrent times are reported in the assertion messages.
+"""
+from __future__ import annotations
+
+from functools import partial
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from spotifywebapipython import SpotifyApiError
+
+from custom_components.spotifyplus.executor import RunConcurrently, SpotifyPlusExecutor
+from custom_components.spotifyplus.ratelimiter import SpotifyPlusRateLimiter, SpotifyRequestLane
+
+REQUEST_LATENCY:float = 0.150
+""" Latency (in seconds) of a fake Spotify Web API request. """
+
+
+def _FakeRequest(result:str, latencySecs:float=REQUEST_LATENCY) -> str:
+    """
+    Fake blocking Spotify Web API request.
+    """
+    time.sleep(latencySecs)
+    return result
+
+
+def _MeasureSecs(func) -> float:
+    """
+    Returns the time (in seconds) taken to call a function.
+    """
+    startTime:float = time.perf_counter()
+    func()
+    return time.perf_counter() - startTime
+
+
+@pytest.mark.parametrize("requestCount", [2, 4])
+def test_run_concurrently_fan_out_latency(requestCount:int) -> None:
+    funcs:list = [partial(_FakeRequest, "result %d" % index) for index in range(requestCount)]
+
+    sequentialSecs:float = _MeasureSecs(lambda: [func() for func in funcs])
+    concurrentSecs:float = _MeasureSecs(lambda: RunConcurrently(*funcs))
+    timings:str = "%d requests at %d ms: sequential %.3f s, concurrent %.3f s" % (requestCount, REQUEST_LATENCY * 1000, sequentialSecs, concurrentSecs)
+
+    # concurrent requests take (about) as long as the slowest single request.
+    assert sequentialSecs >= requestCount * REQUEST_LATENCY, timings
+    assert concurrentSecs < 2 * REQUEST_LATENCY, timings
+
+
+def test_run_concurrently_returns_results_in_argument_order() -> None:
+    results:list = RunConcurrently(
+        partial(_FakeRequest, "artist", 0.10),
+        partial(_FakeRequest, "albums", 0.01),
+        partial(_FakeRequest, "top tracks", 0.05),
+    )
+    assert results == ["artist", "albums", "top tracks"]
+    assert RunConcurrently() == []
+
+
+def test_run_concurrently_raises_first_exception_after_all_finish() -> None:
+    finished:list[str] = []
+
+    def _Fail(name:str, delaySecs:float) -> None:
+        time.sleep(delaySecs)
+        finished.append(name)
+        raise ValueError(name)
+
+    def _Succeed(name:str, delaySecs:float) -> str:
+        time.sleep(delaySecs)
+        finished.append(name)
+        return name
+
+    # the second function fails last, but it is the first failure in argument order.
+    with pytest.raises(ValueError, match="second"):
+        RunConcurrently(partial(_Succeed, "first", 0.01), partial(_Fail, "second", 0.10), partial(_Fail, "third", 0.01), partial(_Succeed, "fourth", 0.20))
+    assert sorted(finished) == ["first", "fourth", "second", "third"]
+
+
+def test_run_concurrently_inherits_request_lane() -> None:
+    lanes:list[SpotifyRequestLane] = SpotifyPlusRateLimiter.RunInLane(
+        SpotifyRequestLane.TRANSPORT,
+        RunConcurrently,
+        SpotifyPlusRateLimiter.GetCurrentLane,
+        SpotifyPlusRateLimiter.GetCurrentLane,
+        SpotifyPlusRateLimiter.GetCurrentLane,
+    )
+    assert lanes == [SpotifyRequestLane.TRANSPORT] * 3
+
+
+def test_run_concurrently_does_not_use_account_executor_workers() -> None:
+    executor:SpotifyPlusExecutor = SpotifyPlusExecutor("test_executor", 1, 4)
+    try:
+
+        # a job of a single-worker executor that fans out must not wait on its own executor.
+        threadNames:list[str] = executor.Submit(
+            SpotifyRequestLane.BULK,
+            RunConcurrently,
+            lambda: threading.current_thread().name,
+            lambda: threading.current_thread().name,
+        ).result(5)
+
+        assert threadNames[0].startswith("test_executor")
+        assert threadNames[1].startswith("spotifyplus_fanout")
+
+    finally:
+        executor.Shutdown()
+
+
+def test_executor_sheds_bulk_jobs_when_saturated() -> None:
+    executor:SpotifyPlusExecutor = SpotifyPlusExecutor("test_executor", 1, 2)
+    release:threading.Event = threading.Event()
+    try:
+
+        # occupy the only worker thread, then fill the queue.
+        running = executor.Submit(SpotifyRequestLane.BULK, release.wait, 5)
+        time.sleep(0.05)
+        queued:list = [executor.Submit(SpotifyRequestLane.BULK, _FakeRequest, "bulk", 0) for _ in range(2)]
+
+        with pytest.raises(SpotifyApiError):
+            executor.Submit(SpotifyRequestLane.BULK, _FakeRequest, "shed", 0)
+
+        # transport jobs are never shed, and are started ahead of queued bulk jobs.
+        order:list[str] = []
+        transport = executor.Submit(SpotifyRequestLane.TRANSPORT, order.append, "transport")
+        for future in queued:
+            future.add_done_callback(lambda f: order.append("bulk"))
+        release.set()
+
+        for future in [running, transport] + queued:
+            future.result(5)
+        assert order[0] == "transport"
+
+    finally:
+        release.set()
+        executor.Shutdown()
+
+
+def test_executor_keeps_a_worker_for_transport_jobs_when_bulk_saturates() -> None:
+    executor:SpotifyPlusExecutor = SpotifyPlusExecutor("test_executor", 4, 32)
+    release:threading.Event = threading.Event()
+    try:
+
+        # submit more slow bulk jobs (e.g. browse traversals) than there are worker threads.
+        bulk:list = [executor.Submit(SpotifyRequestLane.BULK, release.wait, 5) for _ in range(6)]
+        time.sleep(0.05)
+        statistics:dict = executor.ToDictionary()
+        assert statistics["running_bulk"] == executor.BulkLimit == 3
+        assert statistics["queue_depth"]["bulk"] == 3
+
+        # a transport job starts immediately on the reserved worker thread.
+        transportSecs:float = _MeasureSecs(lambda: executor.Submit(SpotifyRequestLane.TRANSPORT, _FakeRequest, "transport", 0).result(5))
+        assert transportSecs < REQUEST_LATENCY
+
+        release.set()
+        for future in bulk:
+            future.result(5)
+
+    finally:
+        release.set()
+        executor.Shutdown()
+
+
+def test_executor_bulk_limit_follows_configured_size() -> None:
+    executor:SpotifyPlusExecutor = SpotifyPlusExecutor("test_executor", 1, 4)
+    try:
+
+        # a single worker thread can not be reserved.
+        assert executor.BulkLimit == 1
+        assert executor.Submit(SpotifyRequestLane.BULK, _FakeRequest, "bulk", 0).result(5) == "bulk"
+
+        executor.Configure(4, 4)
+        assert executor.BulkLimit == 3
+
+    finally:
+        executor.Shutdown()
@@ -0,0 +1,257 @@
+"""
+Tests of the SpotifyPlus media player entity (see `media_player.py`).
+
+The entity is built with a fake Spotify client and playstate coordinator; HomeAssistant
+state updates are discarded.  The state attributes micro-benchmark compares a cached
+`extra_state_attributes` read with a rebuild of the attributes; the measured times are
+reported in the assertion message.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import timeit
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from homeassistant.components.media_player import MediaPlayerState
+from spotifywebapipython.models import PlayerPlayState, Playlist
+
+from custom_components.spotifyplus.const import (
+    ATTR_SPOTIFYPLUS_DEVICE_IS_BRAND_SONOS,
+    ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST,
+    ATTR_SPOTIFYPLUS_PLAYLIST_NAME,
+)
+from custom_components.spotifyplus.instancedata_spotifyplus import InstanceDataSpotifyPlus
+from custom_components.spotifyplus.instrumentation import SpotifyPlusInstrumentation
+from custom_components.spotifyplus.media_player import SpotifyMediaPlayer
+
+DEVICE_ID:str = "0d1841b0976bae2a3a310dd74c0f3df354899bc8"
+""" Spotify Connect device id of the fake player. """
+
+PLAYER_PLAY_STATE_ROOT:dict = {
+    "device": {"id": DEVICE_ID, "name": "Office", "type": "Speaker", "volume_percent": 50, "is_active": True},
+    "context": {"type": "playlist", "uri": "spotify:playlist:37i9dQZF1DX0XUsuxWHRQd", "href": None, "external_urls": {}},
+    "currently_playing_type": "track",
+    "is_playing": True,
+    "progress_ms": 60000,
+    "repeat_state": "off",
+    "shuffle_state": False,
+    "timestamp": 0,
+    "item": {
+        "type": "track",
+        "id": "6rqhFgbbKwnb9MLmUQDhG6",
+        "uri": "spotify:track:6rqhFgbbKwnb9MLmUQDhG6",
+        "name": "Speak to Me",
+        "duration_ms": 240000,
+        "explicit": False,
+        "artists": [{"id": "0k17h0D3J5VfsdmQ1iZtE9", "name": "Pink Floyd", "uri": "spotify:artist:0k17h0D3J5VfsdmQ1iZtE9"}],
+        "album": {"id": "4LH4d3cOWNNsVw41Gqt2kv", "name": "The Dark Side of the Moon", "uri": "spotify:album:4LH4d3cOWNNsVw41Gqt2kv", "images": [{"url": "https://i.scdn.co/image/ab67616d0000b273", "height": 640, "width": 640}], "artists": []},
+    },
+}
+""" Spotify Web API response of the player playback state of the fake player. """
+
+BENCHMARK_READS:int = 2000
+""" Number of state attribute reads (or rebuilds) per micro-benchmark repetition. """
+
+
+class _FakeSpotifyClient:
+    """
+    Fake SpotifyClient that records the player commands it receives.
+    """
+
+    def __init__(self, latencySecs:float=0.05) -> None:
+        self.DefaultDeviceId:str = None
+        self.HasSpotifyWebPlayerCredentials:bool = False
+        self.Seeks:list[tuple] = []
+        self.UserProfile = SimpleNamespace(
+            Country="US",
+            DisplayName="Test User",
+            EMail="test@example.com",
+            Id="testuser",
+            IsProductPremium=True,
+            Product="premium",
+            Uri="spotify:user:testuser",
+        )
+        self.PlayerLastPlayedInfo = SimpleNamespace(Summary="Speak to Me")
+        self.PlayerPlayState:PlayerPlayState = PlayerPlayState(root=PLAYER_PLAY_STATE_ROOT)
+        self._latencySecs:float = latencySecs
+        self._lock:threading.Lock = threading.Lock()
+
+
+    def GetPlayerPlaybackState(self, market:str=None, additionalTypes:str=None, refresh:bool=True) -> PlayerPlayState:
+        return self.PlayerPlayState
+
+
+    def PlayerMediaSeek(self, positionMS:int=None, deviceId:str=None, delay:float=0.50, relativePositionMS:int=None) -> None:
+        time.sleep(self._latencySecs)
+        with self._lock:
+            self.Seeks.append((positionMS, deviceId, relativePositionMS))
+
+
+    def PlayerTransferPlayback(self, deviceId:str=None, play:bool=True, delay:float=0.50, refreshDeviceList:bool=True, forceActivateDevice:bool=True, deviceIdFrom:str=None) -> SimpleNamespace:
+        return SimpleNamespace(Id=deviceId, Name="Kitchen", Title="Kitchen (Sonos)", IsChromeCast=False, IsRestricted=False, IsSonos=True)
+
+
+@pytest.fixture
+def media_player() -> SpotifyMediaPlayer:
+    coordinator = SimpleNamespace(
+        ConnectDevices=None,
+        Instrumentation=SpotifyPlusInstrumentation("test"),
+        TriggerVerificationScan=lambda delay: None,
+    )
+    data:InstanceDataSpotifyPlus = InstanceDataSpotifyPlus(
+        media_player=None,
+        options={},
+        playlistCache=None,
+        playstateCoordinator=coordinator,
+        session=None,
+        spotifyClient=_FakeSpotifyClient(),
+        tokenRefresher=None,
+        runtime_data={},
+    )
+    player:SpotifyMediaPlayer = SpotifyMediaPlayer(data)
+    player.schedule_update_ha_state = lambda force_refresh=False: None
+    return player
+
+
+def test_rapid_seek_service_calls_are_coalesced(media_player:SpotifyMediaPlayer) -> None:
+    client:_FakeSpotifyClient = media_player.data.spotifyClient
+
+    def _Seek(positionMS:int) -> float:
+        startTime:float = time.perf_counter()
+        media_player.service_spotify_player_media_seek(positionMS, DEVICE_ID, 0, 0)
+        return time.perf_counter() - startTime
+
+    # a seek slider drag: the first call issues the request, the others are absorbed.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        owner = pool.submit(_Seek, 10000)
+        time.sleep(0.02)
+        absorbedSecs:list[float] = list(pool.map(_Seek, [20000, 30000, 40000, 50000]))
+        owner.result(5)
+
+    assert client.Seeks == [(50000, DEVICE_ID, None)]
+    assert max(absorbedSecs) < 0.05, "absorbed seek calls were blocked for %s seconds" % absorbedSecs
+
+
+def test_relative_seek_service_calls_are_not_coalesced(media_player:SpotifyMediaPlayer) -> None:
+    client:_FakeSpotifyClient = media_player.data.spotifyClient
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: media_player.service_spotify_player_media_seek(-1, DEVICE_ID, 0, 10000), range(3)))
+
+    assert client.Seeks == [(None, DEVICE_ID, 10000)] * 3
+
+
+def _CountBuilds(player:SpotifyMediaPlayer, monkeypatch) -> list[int]:
+    """
+    Counts the state attribute rebuilds of a media player entity.
+    """
+    builds:list[int] = []
+    buildStateAttributes = player._BuildStateAttributes
+
+    def _BuildStateAttributes() -> dict:
+        builds.append(player._stateAttributesVersion)
+        return buildStateAttributes()
+
+    monkeypatch.setattr(player, "_BuildStateAttributes", _BuildStateAttributes)
+    return builds
+
+
+def _PlayingPlayer(player:SpotifyMediaPlayer, playlist:Playlist=None) -> SpotifyMediaPlayer:
+    """
+    Powers on a media player entity, and updates it from a coordinator snapshot.
+    """
+    player._attr_state = MediaPlayerState.IDLE
+    player._UpdateFromCoordinator(player.data.spotifyClient.PlayerPlayState, playlist)
+    return player
+
+
+def test_state_attributes_are_cached_until_invalidated(media_player:SpotifyMediaPlayer, monkeypatch) -> None:
+    player:SpotifyMediaPlayer = _PlayingPlayer(media_player)
+    builds:list[int] = _CountBuilds(player, monkeypatch)
+
+    attributes:dict = player.extra_state_attributes
+    attributes["sp_test"] = True
+    assert "sp_test" not in player.extra_state_attributes
+    assert len(builds) == 1
+
+    player._InvalidateStateAttributes()
+    player.extra_state_attributes
+    player.extra_state_attributes
+    assert len(builds) == 2
+
+
+def test_playlist_change_invalidates_state_attributes(media_player:SpotifyMediaPlayer) -> None:
+    player:SpotifyMediaPlayer = _PlayingPlayer(media_player)
+    playerPlayState:PlayerPlayState = player.data.spotifyClient.PlayerPlayState
+    playlist:Playlist = Playlist(root={"id": "37i9dQZF1DX0XUsuxWHRQd", "name": "RapCaviar", "uri": "spotify:playlist:37i9dQZF1DX0XUsuxWHRQd"})
+    assert ATTR_SPOTIFYPLUS_PLAYLIST_NAME not in player.extra_state_attributes
+
+    # a snapshot without a playlist change bumps the version once (for the playstate).
+    version:int = player._stateAttributesVersion
+    player._UpdateFromCoordinator(playerPlayState, None)
+    assert player._stateAttributesVersion == version + 1
+
+    # a playlist change bumps it again.
+    version = player._stateAttributesVersion
+    player._UpdateFromCoordinator(playerPlayState, playlist)
+    assert player._stateAttributesVersion == version + 2
+    assert player.extra_state_attributes[ATTR_SPOTIFYPLUS_PLAYLIST_NAME] == "RapCaviar"
+
+
+def test_device_change_invalidates_state_attributes(media_player:SpotifyMediaPlayer) -> None:
+    player:SpotifyMediaPlayer = _PlayingPlayer(media_player)
+    assert player.extra_state_attributes[ATTR_SPOTIFYPLUS_DEVICE_IS_BRAND_SONOS] is False
+    version:int = player._stateAttributesVersion
+
+    player.service_spotify_player_transfer_playback("Kitchen", True, 0)
+
+    assert player._stateAttributesVersion > version
+    assert player.source == "Kitchen"
+    assert player.extra_state_attributes[ATTR_SPOTIFYPLUS_DEVICE_IS_BRAND_SONOS] is True
+
+
+def test_play_time_remaining_is_overlaid_on_cached_state_attributes(media_player:SpotifyMediaPlayer, monkeypatch) -> None:
+    player:SpotifyMediaPlayer = _PlayingPlayer(media_player)
+    player._attr_state = MediaPlayerState.PLAYING
+    builds:list[int] = _CountBuilds(player, monkeypatch)
+    durationSecs:int = PLAYER_PLAY_STATE_ROOT["item"]["duration_ms"] // 1000
+
+    # outside the last scan interval window, the remaining time is duration minus position.
+    assert player.extra_state_attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] == durationSecs - 60
+
+    # inside the window, it counts down with the monotonic clock.
+    player._attr_media_position = durationSecs - 10
+    player._mediaPositionMonotonic = time.monotonic()
+    assert player.extra_state_attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] in [9, 10]
+    player._mediaPositionMonotonic -= 4
+    assert player.extra_state_attributes[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] in [5, 6]
+
+    assert len(builds) == 1
+    assert player._stateAttributesCache[ATTR_SPOTIFYPLUS_PLAY_TIME_REMAINING_EST] is None
+
+
+def test_cached_state_attributes_read_is_faster_than_rebuild(media_player:SpotifyMediaPlayer) -> None:
+    player:SpotifyMediaPlayer = _PlayingPlayer(media_player, Playlist(root={"id": "37i9dQZF1DX0XUsuxWHRQd", "name": "RapCaviar", "uri": "spotify:playlist:37i9dQZF1DX0XUsuxWHRQd"}))
+    player._attr_state = MediaPlayerState.PLAYING
+    assert player.extra_state_attributes.keys() == player._BuildStateAttributes().keys()
+
+    def _ReadCached() -> dict:
+        return player.extra_state_attributes
+
+    def _ReadRebuilt() -> dict:
+        player._InvalidateStateAttributes()
+        return player.extra_state_attributes
+
+    cachedSecs:float = min(timeit.repeat(_ReadCached, number=BENCHMARK_READS, repeat=5))
+    rebuiltSecs:float = min(timeit.repeat(_ReadRebuilt, number=BENCHMARK_READS, repeat=5))
+
+    timings:str = "%d reads: cached %.1f ms, rebuilt %.1f ms (%.1fx)" % (BENCHMARK_READS, cachedSecs * 1000, rebuiltSecs * 1000, rebuiltSecs / cachedSecs)
+    assert cachedSecs < rebuiltSecs, timings
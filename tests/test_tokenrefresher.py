@@ -0,0 +1,363 @@
+"""
+Tests of the OAuth2 token refresh (see `tokenrefresher.py`).
+
+The single-flight stress tests start 50 concurrent callers that find the token expired, and
+verify that they share a single refresh: callers in the event loop via `async_RefreshToken`
+(which shields the refresh from cancelled callers), and worker threads via `RefreshTokenWait`
+(which waits on the refresh with `run_coroutine_threadsafe`, and gives up after a timeout).
+
+The background refresh tests replace the HomeAssistant point-in-time tracker with a fake
+timer, and fire it to run the scheduled refresh.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import inspect
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("smartinspectpython")
+pytest.importorskip("spotifywebapipython")
+
+from homeassistant.util.dt import utc_from_timestamp, utcnow
+from spotifywebapipython import SpotifyAuthToken
+
+from custom_components.spotifyplus import tokenrefresher
+from custom_components.spotifyplus.const import SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL, SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT
+from custom_components.spotifyplus.tokenrefresher import SpotifyPlusTokenRefresher
+
+from .conftest import LoopThreadHass
+
+CALLER_COUNT:int = 50
+""" Number of concurrent callers that need a fresh token. """
+
+REFRESH_MARGIN:int = 300
+""" Time interval (in seconds) before the token expires that it is refreshed in the background. """
+
+
+def _CreateToken(expiresInSecs:int) -> dict:
+    """
+    Returns an OAuth2 token dictionary that expires in the specified number of seconds.
+    """
+    return {
+        "access_token": "access-token-%d" % time.monotonic_ns(),
+        "expires_at": int(time.time()) + expiresInSecs,
+        "refresh_token": "refresh-token",
+        "scope": "user-read-playback-state",
+        "token_type": "Bearer",
+    }
+
+
+class _RefreshFunc:
+    """
+    Token refresh function that counts its calls, and takes a while to complete (like a
+    request to the Spotify token endpoint).
+    """
+
+    def __init__(self, entry:SimpleNamespace, delaySecs:float, exception:Exception=None) -> None:
+        self.CallCount:int = 0
+        self._entry:SimpleNamespace = entry
+        self._delaySecs:float = delaySecs
+        self._exception:Exception = exception
+
+
+    async def __call__(self) -> dict:
+        self.CallCount += 1
+        await asyncio.sleep(self._delaySecs)
+        if (self._exception is not None):
+            raise self._exception
+
+        # persist the refreshed token to the configuration entry, as the component does.
+        token:dict = _CreateToken(3600)
+        self._entry.data = {"token": token}
+        return token
+
+
+def _CreateRefresher(hass:LoopThreadHass, delaySecs:float, exception:Exception=None) -> tuple[SpotifyPlusTokenRefresher, _RefreshFunc]:
+    """
+    Returns a token refresher for a configuration entry whose token has expired.
+    """
+    entry:SimpleNamespace = SimpleNamespace(entry_id="test_entry_id", title="Test Account", data={"token": _CreateToken(-60)})
+    refreshFunc:_RefreshFunc = _RefreshFunc(entry, delaySecs, exception)
+    return SpotifyPlusTokenRefresher(hass, entry, refreshFunc, 300), refreshFunc
+
+
+def _RunWorkerThreads(func) -> list:
+    """
+    Calls a function from `CALLER_COUNT` worker threads at the same time, and returns the
+    result (or exception) of every call.
+    """
+    results:list = [None] * CALLER_COUNT
+    barrier:threading.Barrier = threading.Barrier(CALLER_COUNT)
+
+    def _Worker(index:int) -> None:
+        barrier.wait()
+        try:
+            results[index] = func()
+        except Exception as ex:
+            results[index] = ex
+
+    threads:list[threading.Thread] = [threading.Thread(target=_Worker, args=(index,)) for index in range(CALLER_COUNT)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT + 5)
+    return results
+
+
+def test_async_callers_share_single_refresh(loop_hass:LoopThreadHass) -> None:
+    refresher, refreshFunc = _CreateRefresher(loop_hass, 0.2)
+
+    async def _async_Test() -> list[dict]:
+        return await asyncio.gather(*[refresher.async_RefreshToken() for _ in range(CALLER_COUNT)])
+
+    tokens:list[dict] = loop_hass.RunSync(_async_Test())
+
+    assert refreshFunc.CallCount == 1
+    assert all(token is tokens[0] for token in tokens)
+    assert not refresher.IsRefreshing
+
+
+def test_cancelled_callers_do_not_cancel_refresh(loop_hass:LoopThreadHass) -> None:
+    refresher, refreshFunc = _CreateRefresher(loop_hass, 0.3)
+
+    async def _async_Test() -> list:
+        tasks:list[asyncio.Task] = [asyncio.create_task(refresher.async_RefreshToken()) for _ in range(CALLER_COUNT)]
+        await asyncio.sleep(0.05)
+
+        # cancel half of the callers (including the one that started the refresh).
+        for task in tasks[:CALLER_COUNT // 2]:
+            task.cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results:list = loop_hass.RunSync(_async_Test())
+
+    assert refreshFunc.CallCount == 1
+    assert all(isinstance(result, asyncio.CancelledError) for result in results[:CALLER_COUNT // 2])
+    tokens:list[dict] = results[CALLER_COUNT // 2:]
+    assert all(isinstance(token, dict) and (token is tokens[0]) for token in tokens)
+
+
+def test_refresh_failure_is_shared(loop_hass:LoopThreadHass) -> None:
+    refreshError:RuntimeError = RuntimeError("token endpoint unavailable")
+    refresher, refreshFunc = _CreateRefresher(loop_hass, 0.1, refreshError)
+
+    async def _async_Test() -> list:
+        return await asyncio.gather(*[refresher.async_RefreshToken() for _ in range(CALLER_COUNT)], return_exceptions=True)
+
+    results:list = loop_hass.RunSync(_async_Test())
+
+    assert refreshFunc.CallCount == 1
+    assert all(result is refreshError for result in results)
+
+    # the next caller starts a new refresh, as the token is still expired.
+    with pytest.raises(RuntimeError):
+        loop_hass.RunSync(refresher.async_RefreshToken())
+    assert refreshFunc.CallCount == 2
+
+
+def test_worker_threads_share_single_refresh(loop_hass:LoopThreadHass) -> None:
+    refresher, refreshFunc = _CreateRefresher(loop_hass, 0.2)
+
+    startMonotonic:float = time.monotonic()
+    results:list = _RunWorkerThreads(refresher.RefreshTokenWait)
+    elapsedSecs:float = time.monotonic() - startMonotonic
+
+    assert refreshFunc.CallCount == 1
+    assert all(isinstance(result, dict) and (result is results[0]) for result in results)
+    assert elapsedSecs < SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT
+
+    # a caller that finds the token already refreshed does not start another refresh.
+    assert refresher.RefreshTokenWait() is results[0]
+    assert refreshFunc.CallCount == 1
+
+
+def test_worker_thread_waits_time_out_without_cancelling_refresh(loop_hass:LoopThreadHass) -> None:
+    refresher, refreshFunc = _CreateRefresher(loop_hass, 1.0)
+
+    startMonotonic:float = time.monotonic()
+    results:list = _RunWorkerThreads(lambda: refresher.RefreshTokenWait(0.2))
+    elapsedSecs:float = time.monotonic() - startMonotonic
+
+    # every waiting thread was released by its timeout, before the refresh completed.
+    assert all(isinstance(result, TimeoutError) for result in results)
+    assert elapsedSecs < 1.0
+    assert refresher.IsRefreshing
+
+    # the refresh itself was not cancelled by the timed out waits.
+    loop_hass.RunSync(refresher.async_WaitIdle())
+    assert refreshFunc.CallCount == 1
+    assert refresher._refreshTask.result() is refresher._entry.data["token"]
+
+
+def test_worker_thread_wait_default_timeout() -> None:
+    parameter:inspect.Parameter = inspect.signature(SpotifyPlusTokenRefresher.RefreshTokenWait).parameters["timeoutSecs"]
+    assert parameter.default == SPOTIFY_TOKEN_REFRESH_WAIT_TIMEOUT == 30
+
+
+def test_worker_thread_wait_rejects_event_loop_caller(loop_hass:LoopThreadHass) -> None:
+    refresher, refreshFunc = _CreateRefresher(loop_hass, 0.1)
+
+    async def _async_Test() -> None:
+        refresher.RefreshTokenWait()
+
+    with pytest.raises(RuntimeError):
+        loop_hass.RunSync(_async_Test())
+    assert refreshFunc.CallCount == 0
+
+
+class _FakeTimer:
+    """
+    Fake HomeAssistant point-in-time tracker that records the scheduled refresh times.
+    """
+
+    def __init__(self) -> None:
+        self.Action = None
+        self.CancelCount:int = 0
+        self.PointsInTime:list[datetime] = []
+
+
+    def async_track_point_in_utc_time(self, hass, action, pointInTime:datetime):
+        self.Action = action
+        self.PointsInTime.append(pointInTime)
+        return self._Cancel
+
+
+    def _Cancel(self) -> None:
+        self.CancelCount += 1
+
+
+class _FakeSpotifyClient:
+    """
+    Fake SpotifyClient that holds an authorization token, like the SpotifyClient does.
+    """
+
+    def __init__(self, token:dict) -> None:
+        self._AuthClient = SimpleNamespace(Session=SimpleNamespace(token=token))
+        self._AuthToken:SpotifyAuthToken = SpotifyAuthToken("Authorization Code PKCE", "testuser", root=token)
+
+
+    @property
+    def AuthToken(self) -> SpotifyAuthToken:
+        return self._AuthToken
+
+
+class _FakeCoordinator:
+    """
+    Fake playstate coordinator that records token refresh timing.
+    """
+
+    def __init__(self) -> None:
+        self.Refreshes:list[tuple[bool, bool]] = []
+
+
+    def RecordTokenRefresh(self, elapsedSecs:float, isBackground:bool, isError:bool) -> None:
+        self.Refreshes.append((isBackground, isError))
+
+
+@pytest.fixture
+def fake_timer(monkeypatch) -> _FakeTimer:
+    timer:_FakeTimer = _FakeTimer()
+    monkeypatch.setattr(tokenrefresher, "async_track_point_in_utc_time", timer.async_track_point_in_utc_time)
+    return timer
+
+
+def _StartBackgroundRefresher(hass:LoopThreadHass, expiresInSecs:int, exception:Exception=None) -> tuple[SpotifyPlusTokenRefresher, _RefreshFunc, _FakeSpotifyClient, _FakeCoordinator]:
+    """
+    Returns a started token refresher for a configuration entry whose token expires in the
+    specified number of seconds.
+    """
+    token:dict = _CreateToken(expiresInSecs)
+    entry:SimpleNamespace = SimpleNamespace(entry_id="test_entry_id", title="Test Account", data={"token": token})
+    refreshFunc:_RefreshFunc = _RefreshFunc(entry, 0.01, exception)
+    refresher:SpotifyPlusTokenRefresher = SpotifyPlusTokenRefresher(hass, entry, refreshFunc, REFRESH_MARGIN)
+    client:_FakeSpotifyClient = _FakeSpotifyClient(token)
+    coordinator:_FakeCoordinator = _FakeCoordinator()
+    refresher.Start(client, coordinator)
+    return refresher, refreshFunc, client, coordinator
+
+
+def _FireTimer(hass:LoopThreadHass, timer:_FakeTimer, refresher:SpotifyPlusTokenRefresher) -> None:
+    """
+    Fires the refresh timer, and waits for the background refresh to complete.
+    """
+    async def _async_Fire() -> None:
+        timer.Action(utcnow())
+        await refresher._backgroundTask
+
+    hass.RunSync(_async_Fire())
+
+
+def test_background_refresh_is_scheduled_before_the_token_expires(loop_hass:LoopThreadHass, fake_timer:_FakeTimer) -> None:
+    refresher, refreshFunc, client, coordinator = _StartBackgroundRefresher(loop_hass, 3600)
+
+    assert fake_timer.PointsInTime == [utc_from_timestamp(client.AuthToken.ExpiresAt - REFRESH_MARGIN)]
+    assert refresher.NextRefreshUtc == fake_timer.PointsInTime[0]
+
+    refresher.Stop()
+    assert fake_timer.CancelCount == 1
+    assert refresher.NextRefreshUtc is None
+    assert refreshFunc.CallCount == 0
+
+
+def test_background_refresh_swaps_the_token_into_the_client(loop_hass:LoopThreadHass, fake_timer:_FakeTimer) -> None:
+    refresher, refreshFunc, client, coordinator = _StartBackgroundRefresher(loop_hass, REFRESH_MARGIN - 60)
+    oldAuthToken:SpotifyAuthToken = client.AuthToken
+
+    _FireTimer(loop_hass, fake_timer, refresher)
+
+    token:dict = refresher._entry.data["token"]
+    assert refreshFunc.CallCount == 1
+    assert client.AuthToken is not oldAuthToken
+    assert client.AuthToken.AccessToken == token["access_token"]
+    assert client._AuthClient.Session.token is token
+    assert coordinator.Refreshes == [(True, False)]
+
+    # the next refresh is scheduled a margin before the refreshed token expires.
+    assert fake_timer.PointsInTime[-1] == utc_from_timestamp(token["expires_at"] - REFRESH_MARGIN)
+
+
+def test_background_refresh_is_skipped_if_the_token_was_already_refreshed(loop_hass:LoopThreadHass, fake_timer:_FakeTimer) -> None:
+    refresher, refreshFunc, client, coordinator = _StartBackgroundRefresher(loop_hass, 3600)
+
+    _FireTimer(loop_hass, fake_timer, refresher)
+
+    assert refreshFunc.CallCount == 0
+    assert coordinator.Refreshes == []
+    assert fake_timer.PointsInTime == [utc_from_timestamp(client.AuthToken.ExpiresAt - REFRESH_MARGIN)] * 2
+
+
+def test_background_refresh_failure_is_retried(loop_hass:LoopThreadHass, fake_timer:_FakeTimer) -> None:
+    refresher, refreshFunc, client, coordinator = _StartBackgroundRefresher(loop_hass, REFRESH_MARGIN - 60, RuntimeError("token endpoint unavailable"))
+
+    dtUtcFired:datetime = utcnow()
+    _FireTimer(loop_hass, fake_timer, refresher)
+
+    assert refreshFunc.CallCount == 1
+    assert coordinator.Refreshes == [(True, True)]
+    retrySecs:float = (fake_timer.PointsInTime[-1] - dtUtcFired).total_seconds()
+    assert SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL <= retrySecs < SPOTIFY_TOKEN_REFRESH_RETRY_INTERVAL + 5
+
+
+def test_background_refresh_stops_if_the_token_is_not_refreshed(loop_hass:LoopThreadHass, fake_timer:_FakeTimer) -> None:
+    refresher, refreshFunc, client, coordinator = _StartBackgroundRefresher(loop_hass, REFRESH_MARGIN - 60)
+
+    # the refresh token was revoked, so the entry token is returned as-is (re-authentication
+    # is started by the foreground path).
+    staleToken:dict = refresher._entry.data["token"]
+
+    async def _async_RefreshRevoked() -> dict:
+        refreshFunc.CallCount += 1
+        return staleToken
+
+    refresher._refreshFunc = _async_RefreshRevoked
+    _FireTimer(loop_hass, fake_timer, refresher)
+
+    assert refreshFunc.CallCount == 1
+    assert len(fake_timer.PointsInTime) == 1
+    assert refresher.NextRefreshUtc is None